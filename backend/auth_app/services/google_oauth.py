@@ -0,0 +1,161 @@
+# auth_app/services/google_oauth.py
+
+import jwt
+import requests
+from requests.adapters import HTTPAdapter
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+GOOGLE_JWKS_CACHE_KEY = "google:jwks"
+
+
+class GoogleOAuthError(Exception):
+    status = 400
+
+    def __init__(self, message, google_response=None):
+        super().__init__(message)
+        self.google_response = google_response
+
+
+class GoogleUnavailable(GoogleOAuthError):
+    """Google timed out / refused / answered 5xx: retryable, not the client's fault."""
+    status = 503
+
+
+# --------------------------------------------------
+# SHARED KEEP-ALIVE POOL
+# --------------------------------------------------
+def _build_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=settings.GOOGLE_HTTP_POOL_SIZE,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session = _build_session()
+
+
+def _request(method, url, **kwargs):
+    try:
+        response = _session.request(method, url, timeout=10, **kwargs)
+    except requests.RequestException as exc:
+        raise GoogleUnavailable(
+            f"Google is unreachable ({exc.__class__.__name__}), try again"
+        )
+
+    if response.status_code >= 500:
+        raise GoogleUnavailable(
+            f"Google returned {response.status_code}, try again"
+        )
+    return response
+
+
+def _json(response):
+    try:
+        return response.json()
+    except ValueError:
+        raise GoogleUnavailable("Google returned an unreadable response")
+
+
+# --------------------------------------------------
+# CODE → TOKENS
+# --------------------------------------------------
+def exchange_code(code):
+    response = _request(
+        "POST",
+        settings.GOOGLE_TOKEN_URL,
+        data={
+            "code": code,
+            "client_id": settings.GOOGLE_CLIENT_ID,
+            "client_secret": settings.GOOGLE_CLIENT_SECRET,
+            "redirect_uri": settings.GOOGLE_REDIRECT_URI,
+            "grant_type": "authorization_code",
+        },
+    )
+
+    if response.status_code != 200:
+        raise GoogleOAuthError(
+            "Google token exchange failed", _json(response)
+        )
+
+    return _json(response)
+
+
+# --------------------------------------------------
+# ID TOKEN (verified locally against cached JWKS)
+# --------------------------------------------------
+def get_jwks(refresh=False):
+    jwks = None if refresh else cache.get(GOOGLE_JWKS_CACHE_KEY)
+
+    if jwks is None:
+        response = _request("GET", settings.GOOGLE_JWKS_URL)
+        if response.status_code != 200:
+            raise GoogleUnavailable("Could not fetch Google signing keys")
+        jwks = _json(response)
+        cache.set(
+            GOOGLE_JWKS_CACHE_KEY,
+            jwks,
+            timeout=settings.GOOGLE_JWKS_CACHE_TIMEOUT,
+        )
+
+    return jwks
+
+
+def _signing_key(kid):
+    for refresh in (False, True):
+        # unknown kid → Google rotated keys, refetch once
+        for key in jwt.PyJWKSet.from_dict(get_jwks(refresh)).keys:
+            if key.key_id == kid:
+                return key
+    raise GoogleOAuthError("Unknown Google signing key")
+
+
+def verify_id_token(id_token):
+    try:
+        header = jwt.get_unverified_header(id_token)
+        key = _signing_key(header.get("kid"))
+
+        return jwt.decode(
+            id_token,
+            key=key,
+            algorithms=["RS256"],
+            audience=settings.GOOGLE_CLIENT_ID,
+            issuer=settings.GOOGLE_ISSUERS,
+        )
+    except jwt.PyJWTError as exc:
+        raise GoogleOAuthError(f"Invalid Google id_token: {exc}")
+
+
+# --------------------------------------------------
+# USERINFO (fallback when no id_token is returned)
+# --------------------------------------------------
+def fetch_userinfo(access_token):
+    response = _request(
+        "GET",
+        settings.GOOGLE_USERINFO_URL,
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+
+    if response.status_code != 200:
+        raise GoogleOAuthError("Failed to fetch Google user info")
+
+    return _json(response)
+
+
+def get_google_user(code):
+    """
+    Google profile claims (email, name, picture) for an auth code.
+    One HTTP hop when Google returns an id_token, two otherwise.
+    """
+    tokens = exchange_code(code)
+
+    if tokens.get("id_token"):
+        return verify_id_token(tokens["id_token"])
+
+    return fetch_userinfo(tokens.get("access_token"))
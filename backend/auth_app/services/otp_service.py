@@ -0,0 +1,204 @@
+# auth_app/services/otp_service.py
+
+import json
+import time
+import uuid
+
+from django.conf import settings
+from django_redis import get_redis_connection
+
+from auth_app.utils.otp_utils import generate_otp, hash_otp
+
+
+SMS_QUEUE_KEY = "otp:sms_queue"
+SMS_SCHEDULED_KEY = "otp:sms_dispatch_scheduled"
+
+
+# --------------------------------------------------
+# LUA SCRIPTS (one round trip each)
+# --------------------------------------------------
+# Sliding window limiter shared by both scripts. Every window is
+# checked before any is recorded: a request rejected by the per-IP
+# limit must not use up one of the phone's slots (or one IP could lock
+# a victim's number out).
+_LIMIT_LUA = """
+local function wait_ms(key, now, window, limit)
+    redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+    if redis.call('ZCARD', key) >= limit then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        return tonumber(oldest[2]) + window - now
+    end
+    return 0
+end
+
+local function record(key, now, window, member)
+    redis.call('ZADD', key, now, member)
+    redis.call('PEXPIRE', key, window)
+end
+"""
+
+# KEYS: otp, send:phone, send:ip, sms queue, sms scheduled flag
+# ARGV: otp hash, ttl, now ms, window ms, phone limit, ip limit,
+#       member, sms payload
+_ISSUE_LUA = _LIMIT_LUA + """
+local now = tonumber(ARGV[3])
+local window = tonumber(ARGV[4])
+
+local wait = math.max(
+    wait_ms(KEYS[2], now, window, tonumber(ARGV[5])),
+    wait_ms(KEYS[3], now, window, tonumber(ARGV[6]))
+)
+if wait > 0 then return {0, wait} end
+record(KEYS[2], now, window, ARGV[7])
+record(KEYS[3], now, window, ARGV[7])
+
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], 'code', ARGV[1], 'attempts', 0)
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+
+redis.call('RPUSH', KEYS[4], ARGV[8])
+local schedule = redis.call('SET', KEYS[5], 1, 'NX', 'PX', 5000)
+return {1, schedule and 1 or 0}
+"""
+
+# KEYS: otp, verify:phone, verify:ip
+# ARGV: otp hash, now ms, window ms, phone limit, ip limit,
+#       member, max attempts
+_VERIFY_LUA = _LIMIT_LUA + """
+local now = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+
+local wait = math.max(
+    wait_ms(KEYS[2], now, window, tonumber(ARGV[4])),
+    wait_ms(KEYS[3], now, window, tonumber(ARGV[5]))
+)
+if wait > 0 then return {'limited', wait} end
+record(KEYS[2], now, window, ARGV[6])
+record(KEYS[3], now, window, ARGV[6])
+
+local code = redis.call('HGET', KEYS[1], 'code')
+if not code then return {'missing', 0} end
+
+if code == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return {'ok', 0}
+end
+
+local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+if attempts >= tonumber(ARGV[7]) then
+    redis.call('DEL', KEYS[1])
+end
+return {'invalid', 0}
+"""
+
+_scripts = {}
+
+
+def _script(name, source):
+    if name not in _scripts:
+        _scripts[name] = get_redis_connection("default").register_script(
+            source
+        )
+    return _scripts[name]
+
+
+class OTPRateLimited(Exception):
+    def __init__(self, retry_after):
+        super().__init__("Too many OTP requests")
+        self.retry_after = retry_after
+
+
+# --------------------------------------------------
+# ISSUE
+# --------------------------------------------------
+def issue_otp(phone, ip):
+    """
+    Store a fresh OTP, apply send limits and queue the SMS,
+    all in one redis call. Returns the OTP.
+    """
+    otp = generate_otp()
+    payload = json.dumps({
+        "phone": phone,
+        "text": f"Your DayTaask verification code is {otp}",
+    })
+
+    allowed, extra = _script("issue", _ISSUE_LUA)(
+        keys=[
+            f"otp:{phone}",
+            f"otp:send:phone:{phone}",
+            f"otp:send:ip:{ip}",
+            SMS_QUEUE_KEY,
+            SMS_SCHEDULED_KEY,
+        ],
+        args=[
+            hash_otp(phone, otp),
+            settings.OTP_EXPIRY,
+            int(time.time() * 1000),
+            settings.OTP_RATE_WINDOW * 1000,
+            settings.OTP_SEND_LIMIT_PER_PHONE,
+            settings.OTP_SEND_LIMIT_PER_IP,
+            uuid.uuid4().hex,
+            payload,
+        ],
+    )
+
+    if not allowed:
+        raise OTPRateLimited(retry_after=int(extra) // 1000 + 1)
+
+    if extra:
+        # first message since the last drain → wake the dispatcher
+        from auth_app.tasks import dispatch_otp_sms
+        dispatch_otp_sms.apply_async(
+            countdown=settings.OTP_SMS_BATCH_DELAY
+        )
+
+    return otp
+
+
+# --------------------------------------------------
+# VERIFY + CONSUME
+# --------------------------------------------------
+def verify_otp(phone, otp, ip):
+    """
+    Check and consume an OTP atomically.
+    The OTP is burned after OTP_MAX_ATTEMPTS wrong guesses.
+    """
+    result, extra = _script("verify", _VERIFY_LUA)(
+        keys=[
+            f"otp:{phone}",
+            f"otp:verify:phone:{phone}",
+            f"otp:verify:ip:{ip}",
+        ],
+        args=[
+            hash_otp(phone, otp),
+            int(time.time() * 1000),
+            settings.OTP_RATE_WINDOW * 1000,
+            settings.OTP_VERIFY_LIMIT_PER_PHONE,
+            settings.OTP_VERIFY_LIMIT_PER_IP,
+            uuid.uuid4().hex,
+            settings.OTP_MAX_ATTEMPTS,
+        ],
+    )
+
+    if result == b"limited":
+        raise OTPRateLimited(retry_after=int(extra) // 1000 + 1)
+
+    return result == b"ok"
+
+
+# --------------------------------------------------
+# SMS QUEUE (drained by auth_app.tasks.dispatch_otp_sms)
+# --------------------------------------------------
+def pop_sms_batch(size):
+    conn = get_redis_connection("default")
+
+    pipe = conn.pipeline(transaction=True)
+    pipe.lrange(SMS_QUEUE_KEY, 0, size - 1)
+    pipe.ltrim(SMS_QUEUE_KEY, size, -1)
+    raw, _ = pipe.execute()
+
+    return [json.loads(item) for item in raw]
+
+
+def clear_dispatch_flag():
+    get_redis_connection("default").delete(SMS_SCHEDULED_KEY)
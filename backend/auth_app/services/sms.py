@@ -0,0 +1,27 @@
+# auth_app/services/sms.py
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class BaseSMSProvider:
+    def send_batch(self, messages):
+        """
+        messages: list of {"phone": ..., "text": ...}
+        """
+        raise NotImplementedError
+
+
+class FakeSMSProvider(BaseSMSProvider):
+    """
+    Local provider for development and tests.
+    Sent messages are kept in FakeSMSProvider.outbox.
+    """
+    outbox = []
+
+    def send_batch(self, messages):
+        FakeSMSProvider.outbox.extend(messages)
+
+
+def get_sms_provider():
+    return import_string(settings.SMS_PROVIDER)()
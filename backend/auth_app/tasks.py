@@ -0,0 +1,28 @@
+# auth_app/tasks.py
+
+from celery import shared_task
+from django.conf import settings
+
+from auth_app.services.otp_service import pop_sms_batch, clear_dispatch_flag
+from auth_app.services.sms import get_sms_provider
+
+
+@shared_task
+def dispatch_otp_sms():
+    """
+    Drain queued OTP messages in batches.
+    The flag is cleared first, so anything queued while we run
+    either lands in this drain or schedules a new one.
+    """
+    clear_dispatch_flag()
+    provider = get_sms_provider()
+
+    sent = 0
+    while True:
+        batch = pop_sms_batch(settings.OTP_SMS_BATCH_SIZE)
+        if not batch:
+            break
+        provider.send_batch(batch)
+        sent += len(batch)
+
+    return sent
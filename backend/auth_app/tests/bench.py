@@ -0,0 +1,96 @@
+# auth_app/tests/bench.py
+#
+# OTP verification under concurrency. Not part of the default test run
+# (module name doesn't match test*.py); run explicitly against the
+# redis from CACHES:
+#
+#     python manage.py test auth_app.tests.bench
+#
+# OTP_BENCH_COUNT / OTP_BENCH_THREADS env vars resize the run.
+
+import os
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from django_redis import get_redis_connection
+
+from auth_app.services.otp_service import (
+    SMS_QUEUE_KEY,
+    SMS_SCHEDULED_KEY,
+    issue_otp,
+    verify_otp,
+)
+
+
+BENCH_COUNT = int(os.getenv("OTP_BENCH_COUNT", "10000"))
+BENCH_THREADS = int(os.getenv("OTP_BENCH_THREADS", "64"))
+
+
+@override_settings(
+    OTP_VERIFY_LIMIT_PER_PHONE=10,
+    OTP_VERIFY_LIMIT_PER_IP=10 * BENCH_COUNT,
+)
+@mock.patch("auth_app.tasks.dispatch_otp_sms.apply_async")
+class OTPVerifyBenchmark(SimpleTestCase):
+
+    def setUp(self):
+        self.prefix = uuid.uuid4().hex[:8]
+
+    def tearDown(self):
+        conn = get_redis_connection("default")
+        for keys in _batched(conn.scan_iter(f"otp:*{self.prefix}*", count=1000)):
+            conn.delete(*keys)
+        conn.delete(SMS_QUEUE_KEY, SMS_SCHEDULED_KEY)
+
+    def test_concurrent_verifications(self, _dispatch):
+        """
+        BENCH_COUNT phones, each OTP submitted twice at the same time
+        from BENCH_THREADS threads: exactly one of the two may pass.
+        """
+        ip = f"bench-{self.prefix}"
+        codes = {}
+        for n in range(BENCH_COUNT):
+            phone = f"+8{self.prefix}{n:06d}"
+            codes[phone] = issue_otp(phone, f"{ip}-{n}")
+
+        jobs = [(phone, otp) for phone, otp in codes.items()] * 2
+        latencies = []
+
+        def verify(job):
+            started = time.perf_counter()
+            ok = verify_otp(job[0], job[1], ip)
+            latencies.append(time.perf_counter() - started)
+            return job[0], ok
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=BENCH_THREADS) as pool:
+            results = list(pool.map(verify, jobs))
+        elapsed = time.perf_counter() - started
+
+        passed = {}
+        for phone, ok in results:
+            passed[phone] = passed.get(phone, 0) + ok
+        self.assertEqual(set(passed.values()), {1})
+
+        latencies.sort()
+        print(
+            f"\n{len(jobs)} verifications, {BENCH_THREADS} threads: "
+            f"{elapsed:.2f}s, {len(jobs) / elapsed:.0f}/s, "
+            f"p50 {statistics.median(latencies) * 1000:.2f}ms, "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f}ms"
+        )
+
+
+def _batched(iterable, size=1000):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
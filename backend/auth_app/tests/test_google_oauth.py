@@ -0,0 +1,163 @@
+# auth_app/tests/test_google_oauth.py
+#
+# The client talks to a stub Google on localhost (token, JWKS and
+# userinfo endpoints), so the real HTTP pool, timeouts and status
+# mapping are exercised. Needs the redis from CACHES (JWKS cache).
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from auth_app.services.google_oauth import (
+    GOOGLE_JWKS_CACHE_KEY,
+    GoogleOAuthError,
+    GoogleUnavailable,
+    get_google_user,
+)
+
+
+CLIENT_ID = "client-123.apps.googleusercontent.com"
+KEY_ID = "stub-key"
+SIGNING_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+OTHER_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def id_token(key=SIGNING_KEY, **claims):
+    now = int(time.time())
+    payload = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "iat": now,
+        "exp": now + 300,
+        "email": "asha@example.com",
+        "name": "Asha Rao",
+        **claims,
+    }
+    return jwt.encode(payload, key, algorithm="RS256", headers={"kid": KEY_ID})
+
+
+class StubGoogle(BaseHTTPRequestHandler):
+    """Answers from server.routes: {path: (status, json body)}."""
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.requests.append(
+            (self.path, parse_qs(self.rfile.read(length).decode()))
+        )
+        self.answer()
+
+    def do_GET(self):
+        self.server.requests.append((self.path, {}))
+        self.answer()
+
+    def answer(self):
+        status, body = self.server.routes.get(self.path, (404, {}))
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class GoogleOAuthTests(SimpleTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubGoogle)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.addClassCleanup(cls.server.server_close)
+        cls.addClassCleanup(cls.server.shutdown)
+
+        base = f"http://127.0.0.1:{cls.server.server_port}"
+        settings = override_settings(
+            GOOGLE_CLIENT_ID=CLIENT_ID,
+            GOOGLE_TOKEN_URL=f"{base}/token",
+            GOOGLE_JWKS_URL=f"{base}/certs",
+            GOOGLE_USERINFO_URL=f"{base}/userinfo",
+        )
+        settings.enable()
+        cls.addClassCleanup(settings.disable)
+
+    def setUp(self):
+        cache.delete(GOOGLE_JWKS_CACHE_KEY)
+        jwk = jwt.algorithms.RSAAlgorithm.to_jwk(
+            SIGNING_KEY.public_key(), as_dict=True
+        )
+        self.server.routes = {
+            "/certs": (200, {"keys": [{**jwk, "kid": KEY_ID, "alg": "RS256"}]}),
+        }
+        self.server.requests = []
+
+    def token_response(self, status, body):
+        self.server.routes["/token"] = (status, body)
+
+    def callback(self):
+        return self.client.post(
+            "/google/callback/", {"code": "auth-code"},
+            content_type="application/json",
+        )
+
+    def test_valid_id_token(self):
+        self.token_response(200, {"id_token": id_token(), "access_token": "at"})
+
+        claims = get_google_user("auth-code")
+
+        self.assertEqual(claims["email"], "asha@example.com")
+        path, form = self.server.requests[0]
+        self.assertEqual(path, "/token")
+        self.assertEqual(form["code"], ["auth-code"])
+        self.assertEqual(form["client_id"], [CLIENT_ID])
+        # verified locally: no userinfo call
+        self.assertEqual(
+            [path for path, _ in self.server.requests], ["/token", "/certs"]
+        )
+
+        # JWKS cached: the next login is the token exchange only
+        self.server.requests = []
+        get_google_user("auth-code")
+        self.assertEqual([path for path, _ in self.server.requests], ["/token"])
+
+    def test_wrong_audience_is_rejected(self):
+        self.token_response(200, {"id_token": id_token(aud="someone-else")})
+
+        with self.assertRaises(GoogleOAuthError) as raised:
+            get_google_user("auth-code")
+        self.assertNotIsInstance(raised.exception, GoogleUnavailable)
+        self.assertEqual(self.callback().status_code, 400)
+
+    def test_bad_signature_is_rejected(self):
+        self.token_response(200, {"id_token": id_token(key=OTHER_KEY)})
+
+        with self.assertRaisesMessage(GoogleOAuthError, "Invalid Google id_token"):
+            get_google_user("auth-code")
+        self.assertEqual(self.callback().status_code, 400)
+
+    def test_upstream_5xx_is_503(self):
+        self.token_response(502, {"error": "bad gateway"})
+
+        with self.assertRaises(GoogleUnavailable):
+            get_google_user("auth-code")
+
+        response = self.callback()
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("502", response.json()["error"])
+
+    def test_rejected_code_is_400(self):
+        self.token_response(400, {"error": "invalid_grant"})
+
+        response = self.callback()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["google_response"], {"error": "invalid_grant"})
@@ -0,0 +1,84 @@
+# auth_app/tests/test_otp_service.py
+#
+# Needs the redis from CACHES (the limiter and consume are Lua scripts).
+
+import uuid
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from django_redis import get_redis_connection
+
+from auth_app.services.otp_service import (
+    OTPRateLimited,
+    SMS_QUEUE_KEY,
+    SMS_SCHEDULED_KEY,
+    issue_otp,
+    verify_otp,
+)
+
+
+@mock.patch("auth_app.tasks.dispatch_otp_sms.apply_async")
+class OTPServiceTests(SimpleTestCase):
+
+    def setUp(self):
+        self.prefix = uuid.uuid4().hex[:8]
+
+    def tearDown(self):
+        conn = get_redis_connection("default")
+        keys = list(conn.scan_iter(f"otp:*{self.prefix}*"))
+        conn.delete(SMS_QUEUE_KEY, SMS_SCHEDULED_KEY, *keys)
+
+    def phone(self, n=0):
+        return f"+9{self.prefix}{n}"
+
+    def ip(self, n=0):
+        return f"ip-{self.prefix}-{n}"
+
+    # ---------------------------
+    # ISSUE
+    # ---------------------------
+    @override_settings(OTP_SEND_LIMIT_PER_PHONE=2, OTP_SEND_LIMIT_PER_IP=1)
+    def test_ip_rejection_does_not_use_phone_slot(self, _dispatch):
+        victim = self.phone(1)
+        issue_otp(self.phone(0), self.ip(0))  # fills ip 0
+
+        for _ in range(5):
+            with self.assertRaises(OTPRateLimited):
+                issue_otp(victim, self.ip(0))
+
+        # the victim's two phone slots are still free
+        issue_otp(victim, self.ip(1))
+        issue_otp(victim, self.ip(2))
+        with self.assertRaises(OTPRateLimited):
+            issue_otp(victim, self.ip(3))
+
+    # ---------------------------
+    # VERIFY
+    # ---------------------------
+    @override_settings(OTP_VERIFY_LIMIT_PER_PHONE=2, OTP_VERIFY_LIMIT_PER_IP=1)
+    def test_verify_ip_rejection_does_not_use_phone_slot(self, _dispatch):
+        victim = self.phone(1)
+        otp = issue_otp(victim, self.ip(0))
+        verify_otp(self.phone(0), 111111, self.ip(0))  # fills ip 0
+
+        for _ in range(5):
+            with self.assertRaises(OTPRateLimited):
+                verify_otp(victim, otp, self.ip(0))
+
+        self.assertFalse(verify_otp(victim, 111111, self.ip(1)))
+        self.assertTrue(verify_otp(victim, otp, self.ip(2)))
+
+    def test_otp_is_consumed_once(self, _dispatch):
+        otp = issue_otp(self.phone(), self.ip())
+
+        self.assertTrue(verify_otp(self.phone(), otp, self.ip()))
+        self.assertFalse(verify_otp(self.phone(), otp, self.ip()))
+
+    @override_settings(OTP_MAX_ATTEMPTS=3)
+    def test_otp_burned_after_max_attempts(self, _dispatch):
+        otp = issue_otp(self.phone(), self.ip())
+        wrong = 100000 if otp != 100000 else 100001
+
+        for _ in range(3):
+            self.assertFalse(verify_otp(self.phone(), wrong, self.ip()))
+        self.assertFalse(verify_otp(self.phone(), otp, self.ip()))
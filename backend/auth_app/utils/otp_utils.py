@@ -1,18 +1,18 @@
-import random
-from django.core.cache import cache
+import hashlib
+import hmac
+import secrets
 
+from django.conf import settings
 
-def generate_otp():
-    return random.randint(100000, 999999)
-
-
-def store_otp(phone, otp):
-    cache.set(f"otp_{phone}", otp, timeout=300)
 
-
-def get_stored_otp(phone):
-    return cache.get(f"otp_{phone}")
+def generate_otp():
+    return secrets.randbelow(900000) + 100000
 
 
-def delete_stored_otp(phone):
-    cache.delete(f"otp_{phone}")
+def hash_otp(phone, otp):
+    """OTPs are never stored in plain text."""
+    return hmac.new(
+        settings.SECRET_KEY.encode(),
+        f"{phone}:{otp}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
@@ -1,15 +1,19 @@
+import asyncio
 import json
-import requests
+import threading
+from concurrent.futures import Future
 
+from asgiref.sync import sync_to_async
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
 
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from auth_app.services.google_oauth import get_google_user, GoogleOAuthError
 from users_app.models import User
-from users_app.models.role import UserRole
-from users_app.utils.rbac import get_user_permissions
+from users_app.utils.rbac import get_login_context
+from users_app.utils.tokens import access_token_for
 
 
 # ==========================
@@ -26,11 +30,61 @@ def google_login(request):
     return JsonResponse({"auth_url": google_auth_url})
 
 
+# ==========================
+# HELPERS
+# ==========================
+# in-flight user upserts, keyed by email, shared process-wide: under
+# WSGI every async view runs in its own event loop (and thread), so a
+# per-loop key would never coalesce anything
+_inflight_users = {}
+_inflight_lock = threading.Lock()
+
+
+async def _get_or_create_user(email, defaults):
+    """
+    Concurrent callbacks for the same email share one upsert.
+    The first caller runs it; the rest await its result from
+    whatever loop they are on.
+    """
+    with _inflight_lock:
+        future = _inflight_users.get(email)
+        leader = future is None
+        if leader:
+            future = _inflight_users[email] = Future()
+
+    if not leader:
+        return await asyncio.wrap_future(future)
+
+    try:
+        result = await User.objects.aget_or_create(email=email, defaults=defaults)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        with _inflight_lock:
+            _inflight_users.pop(email, None)
+    return result
+
+
+@sync_to_async
+def _login_payload(user):
+    refresh = RefreshToken.for_user(user)
+
+    context = get_login_context(user)
+    roles = [role["role__name"] for role in context["roles"]]
+    permissions = context["permissions"]
+    access = access_token_for(refresh, user.id, context)
+
+    return refresh, access, roles, permissions
+
+
 # ==========================
 # GOOGLE CALLBACK
 # ==========================
 @csrf_exempt
-def google_callback(request):
+async def google_callback(request):
     if request.method != "POST":
         return JsonResponse({"error": "Only POST allowed"}, status=405)
 
@@ -44,41 +98,18 @@ def google_callback(request):
         return JsonResponse({"error": "Authorization code missing"}, status=400)
 
     # --------------------------------------------------
-    # 1️⃣ Exchange CODE → GOOGLE TOKEN
-    # --------------------------------------------------
-    token_response = requests.post(
-        settings.GOOGLE_TOKEN_URL,
-        data={
-            "code": code,
-            "client_id": settings.GOOGLE_CLIENT_ID,
-            "client_secret": settings.GOOGLE_CLIENT_SECRET,
-            "redirect_uri": settings.GOOGLE_REDIRECT_URI,
-            "grant_type": "authorization_code",
-        },
-        timeout=10
-    )
-
-    if token_response.status_code != 200:
-        return JsonResponse({
-            "error": "Google token exchange failed",
-            "google_response": token_response.json()
-        }, status=400)
-
-    google_access_token = token_response.json().get("access_token")
-
-    # --------------------------------------------------
-    # 2️⃣ Fetch Google User Info
+    # 1️⃣ CODE → GOOGLE TOKEN → verified id_token claims
+    #    (pooled HTTP in a worker thread, loop stays free)
     # --------------------------------------------------
-    userinfo_response = requests.get(
-        settings.GOOGLE_USERINFO_URL,
-        headers={"Authorization": f"Bearer {google_access_token}"},
-        timeout=10
-    )
-
-    if userinfo_response.status_code != 200:
-        return JsonResponse({"error": "Failed to fetch Google user info"}, status=400)
-
-    google_user = userinfo_response.json()
+    try:
+        google_user = await sync_to_async(
+            get_google_user, thread_sensitive=False
+        )(code)
+    except GoogleOAuthError as exc:
+        error = {"error": str(exc)}
+        if exc.google_response is not None:
+            error["google_response"] = exc.google_response
+        return JsonResponse(error, status=exc.status)
 
     email = google_user.get("email")
     name = google_user.get("name")
@@ -88,31 +119,24 @@ def google_callback(request):
         return JsonResponse({"error": "Google account has no email"}, status=400)
 
     # --------------------------------------------------
-    # 3️⃣ Create or Get User
+    # 2️⃣ Create or Get User
     # --------------------------------------------------
-    user, created = User.objects.get_or_create(
-        email=email,
-        defaults={
+    user, created = await _get_or_create_user(
+        email,
+        {
             "full_name": name,
             "profile_image": picture,
             "email_verified": True,
-        }
+        },
     )
 
     # --------------------------------------------------
-    # 4️⃣ Generate JWT
+    # 3️⃣ Generate JWT
     # --------------------------------------------------
-    refresh = RefreshToken.for_user(user)
-
-    roles = list(
-        UserRole.objects.filter(user=user)
-        .values_list("role__name", flat=True)
-    )
-
-    permissions = get_user_permissions(user)
+    refresh, access, roles, permissions = await _login_payload(user)
 
     # --------------------------------------------------
-    # 5️⃣ Response + COOKIES
+    # 4️⃣ Response + COOKIES
     # --------------------------------------------------
     response = JsonResponse({
         "message": "Google login successful",
@@ -130,7 +154,7 @@ def google_callback(request):
     # ✅ ACCESS TOKEN COOKIE (LONG)
     response.set_cookie(
         key=settings.AUTH_COOKIE,
-        value=str(refresh.access_token),
+        value=str(access),
         httponly=settings.AUTH_COOKIE_HTTP_ONLY,
         secure=settings.AUTH_COOKIE_SECURE,
         samesite=settings.AUTH_COOKIE_SAMESITE,
@@ -1,35 +1,59 @@
+from django.conf import settings
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import status
 from django.contrib.auth import get_user_model
-from auth_app.utils.otp_utils import generate_otp, store_otp, get_stored_otp, delete_stored_otp
+from auth_app.serializers.otp import SendOTPSerializer, VerifyOTPSerializer
+from auth_app.services.otp_service import (
+    issue_otp,
+    verify_otp,
+    OTPRateLimited,
+)
 
 User = get_user_model()
 
 
+def _rate_limited(exc):
+    return Response(
+        {"error": "Too many OTP requests", "retry_after": exc.retry_after},
+        status=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 class SendOTPView(APIView):
     def post(self, request):
-        phone = request.data.get("phone")
+        serializer = SendOTPSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        phone = serializer.validated_data["phone"]
 
-        otp = generate_otp()
-        store_otp(phone, otp)
+        try:
+            otp = issue_otp(phone, request.META.get("REMOTE_ADDR"))
+        except OTPRateLimited as exc:
+            return _rate_limited(exc)
 
-        # For now just return OTP (later use SMS gateway)
-        return Response({"message": "OTP sent", "otp": otp})
+        data = {"message": "OTP sent"}
+        if settings.DEBUG:
+            # no SMS gateway yet → expose OTP in dev only
+            data["otp"] = otp
+        return Response(data)
 
 
 class VerifyOTPView(APIView):
     def post(self, request):
-        phone = request.data.get("phone")
-        otp = request.data.get("otp")
+        serializer = VerifyOTPSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        phone = serializer.validated_data["phone"]
+        otp = serializer.validated_data["otp"]
 
-        saved_otp = get_stored_otp(phone)
+        try:
+            valid = verify_otp(phone, otp, request.META.get("REMOTE_ADDR"))
+        except OTPRateLimited as exc:
+            return _rate_limited(exc)
 
-        if not saved_otp or str(saved_otp) != str(otp):
+        if not valid:
             return Response({"error": "Invalid OTP"}, status=400)
 
-        delete_stored_otp(phone)
-
         user, created = User.objects.get_or_create(phone=phone)
 
         return Response({
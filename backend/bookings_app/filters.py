@@ -0,0 +1,29 @@
+# bookings_app/filters.py
+
+from users_app.utils.search import apply_search
+
+
+def filter_bookings(queryset, params, path=""):
+    """
+    Admin booking list filters (?search= ?status= ?assignment_status=).
+    path applies them through a relation, e.g. "booking__" for payments,
+    so exports honour exactly what the list shows.
+    """
+    search = params.get("search")
+    status_filter = params.get("status")
+    assignment_status = params.get("assignment_status")
+
+    if search:
+        queryset = apply_search(
+            queryset, search, prefix_field="booking_code", path=path
+        )
+
+    if status_filter:
+        queryset = queryset.filter(**{f"{path}status": status_filter})
+
+    if assignment_status:
+        queryset = queryset.filter(
+            **{f"{path}assignment_status": assignment_status}
+        )
+
+    return queryset
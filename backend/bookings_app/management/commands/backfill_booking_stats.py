@@ -0,0 +1,52 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from bookings_app.models import Booking
+from bookings_app.services.stats import refresh_daily_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the booking_daily_stats rollup (all days by default)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", help="First day, YYYY-MM-DD")
+        parser.add_argument("--end", help="Last day, YYYY-MM-DD")
+        parser.add_argument(
+            "--chunk-days",
+            type=int,
+            default=31,
+            help="Days rebuilt per query",
+        )
+
+    def handle(self, *args, **options):
+        bounds = Booking.objects.aggregate(
+            first=Min("scheduled_at"), last=Max("scheduled_at")
+        )
+        if bounds["first"] is None:
+            self.stdout.write("No bookings, nothing to backfill")
+            return
+
+        try:
+            start = (
+                date.fromisoformat(options["start"]) if options["start"]
+                else timezone.localdate(bounds["first"])
+            )
+            end = (
+                date.fromisoformat(options["end"]) if options["end"]
+                else timezone.localdate(bounds["last"])
+            )
+        except ValueError:
+            raise CommandError("--start / --end must be YYYY-MM-DD")
+
+        chunk = timedelta(days=options["chunk_days"])
+        day, total_rows = start, 0
+        while day <= end:
+            last = min(day + chunk - timedelta(days=1), end)
+            total_rows += refresh_daily_stats(day, last)
+            day = last + timedelta(days=1)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ booking_daily_stats rebuilt {start} → {end}: {total_rows} row(s)"))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from bookings_app.models import Booking
+from bookings_app.serializers.utils.assignment_utils import (
+    reconcile_accepted_counts,
+)
+
+
+class Command(BaseCommand):
+    help = "Recomputes Booking.accepted_count from accepted AssignmentLogs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Bookings per UPDATE (by id range)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = Booking.objects.aggregate(last=Max("id"))["last"] or 0
+
+        total_fixed = 0
+        for start in range(0, last_id + 1, batch_size):
+            total_fixed += reconcile_accepted_counts(
+                Booking.objects.filter(
+                    id__gte=start, id__lt=start + batch_size
+                )
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ accepted_count reconciled: {total_fixed} booking(s) fixed"))
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:19
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_accepted_count(apps, schema_editor):
+    Booking = apps.get_model('bookings_app', 'Booking')
+    AssignmentLog = apps.get_model('bookings_app', 'AssignmentLog')
+
+    accepted = (
+        AssignmentLog.objects.filter(booking=OuterRef('pk'), status='accepted')
+        .order_by()
+        .values('booking')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    Booking.objects.update(accepted_count=Coalesce(Subquery(accepted), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings_app', '0013_booking_paid_amount_booking_payment_status_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='accepted_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='payment_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('cod_pending', 'COD Pending'), ('partial', 'Partially Paid'), ('paid', 'Paid'), ('refunded', 'Refunded')], default='pending', max_length=30),
+        ),
+        migrations.RunPython(backfill_accepted_count, migrations.RunPython.noop),
+    ]
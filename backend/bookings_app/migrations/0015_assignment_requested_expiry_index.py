@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings_app', '0014_booking_accepted_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignmentlog',
+            index=models.Index(condition=models.Q(('status', 'requested')), fields=['expires_at'], name='assignment_requested_exp_idx'),
+        ),
+    ]
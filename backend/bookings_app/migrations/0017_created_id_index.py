@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings_app', '0016_assignmentbroadcast'),
+        ('services_app', '0001_initial'),
+        ('users_app', '0003_address_geohash'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignmentlog',
+            index=models.Index(fields=['created_at', 'id'], name='assignment_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['created_at', 'id'], name='booking_created_id_idx'),
+        ),
+    ]
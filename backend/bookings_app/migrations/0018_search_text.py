@@ -0,0 +1,64 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:38
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings_app', '0017_created_id_index'),
+        ('services_app', '0001_initial'),
+        ('users_app', '0004_user_search_text'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='booking',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='quoterequest',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE bookings_app_booking b
+            SET search_text = lower(concat_ws(' ', b.booking_code, u.full_name, s.name))
+            FROM users_app_user u, services_app_service s
+            WHERE u.id = b.customer_id AND s.id = b.service_id
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE bookings_app_quoterequest q
+            SET search_text = lower(concat_ws(' ', q.quote_code, u.full_name, q.service_name))
+            FROM users_app_user u
+            WHERE u.id = q.customer_id
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_text'], name='booking_search_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['booking_code'], name='booking_code_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='quoterequest',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_text'], name='quote_search_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='quoterequest',
+            index=models.Index(fields=['quote_code'], name='quote_code_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
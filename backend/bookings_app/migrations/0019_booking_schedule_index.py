@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings_app', '0018_search_text'),
+        ('services_app', '0001_initial'),
+        ('users_app', '0004_user_search_text'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['scheduled_at', 'status'], include=('priority',), name='booking_schedule_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings_app', '0019_booking_schedule_index'),
+        ('services_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('bookings', models.PositiveIntegerField(default=0)),
+                ('status_counts', models.JSONField(default=dict)),
+                ('payment_status_counts', models.JSONField(default=dict)),
+                ('assignment_status_counts', models.JSONField(default=dict)),
+                ('booked_value', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('collected', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='services_app.category')),
+                ('service', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='services_app.service')),
+            ],
+            options={
+                'db_table': 'booking_daily_stats',
+                'indexes': [models.Index(fields=['day', 'category'], name='booking_dai_day_2531cb_idx')],
+                'unique_together': {('day', 'service')},
+            },
+        ),
+    ]
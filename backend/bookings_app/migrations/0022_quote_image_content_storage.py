@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 11:02
+
+import daytaask_backend.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings_app', '0021_quoteimage_image_variants'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='quoteimage',
+            name='image',
+            field=models.ImageField(storage=daytaask_backend.storage.ContentAddressedStorage(), upload_to='quotes/images/'),
+        ),
+        migrations.AddIndex(
+            model_name='quoteimage',
+            index=models.Index(fields=['image'], name='quote_image_file_idx'),
+        ),
+    ]
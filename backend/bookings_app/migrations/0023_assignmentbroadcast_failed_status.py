@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings_app', '0022_quote_image_content_storage'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='assignmentbroadcast',
+            name='status',
+            field=models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('completed', 'Completed'), ('filled', 'Filled'), ('cancelled', 'Cancelled'), ('failed', 'Failed')], default='queued', max_length=20),
+        ),
+    ]
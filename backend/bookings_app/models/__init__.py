@@ -8,3 +8,5 @@ from .assignment_log import AssignmentLog
 from .customService import CustomService
 from .quote_request import QuoteRequest
 from .quote_image import QuoteImage
+from .assignment_broadcast import AssignmentBroadcast
+from .booking_daily_stats import BookingDailyStats
@@ -0,0 +1,56 @@
+# bookings_app/models/assignment_broadcast.py
+
+from django.db import models
+
+
+class AssignmentBroadcast(models.Model):
+    """
+    One "send to every eligible taaskr" run for a booking.
+    Requests go out in chunks from celery; progress lives here.
+    """
+
+    booking = models.ForeignKey(
+        "bookings_app.Booking",
+        on_delete=models.CASCADE,
+        related_name="broadcasts"
+    )
+
+    created_by = models.ForeignKey(
+        "users_app.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="assignment_broadcasts"
+    )
+
+    radius_km = models.FloatField(null=True, blank=True)
+
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ("queued", "Queued"),
+            ("running", "Running"),
+            ("completed", "Completed"),
+            ("filled", "Filled"),  # required taaskrs accepted mid-run
+            ("cancelled", "Cancelled"),
+            ("failed", "Failed"),  # a celery step raised
+        ],
+        default="queued"
+    )
+
+    # 🔹 Progress
+    total_taaskrs = models.PositiveIntegerField(default=0)
+    chunks_total = models.PositiveIntegerField(default=0)
+    chunks_done = models.PositiveIntegerField(default=0)
+    requests_sent = models.PositiveIntegerField(default=0)
+
+    # shared by every request this broadcast sends
+    expires_at = models.DateTimeField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Broadcast {self.id} - booking {self.booking_id} ({self.status})"
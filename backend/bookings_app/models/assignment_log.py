@@ -63,6 +63,16 @@ class AssignmentLog(models.Model):
         indexes = [
             models.Index(fields=["booking", "taaskr"]),
             models.Index(fields=["status"]),
+            # keyset pagination for admin lists (newest first)
+            models.Index(
+                fields=["created_at", "id"], name="assignment_created_id_idx"
+            ),
+            # expiry sweeper: only live requests are indexed
+            models.Index(
+                fields=["expires_at"],
+                condition=models.Q(status="requested"),
+                name="assignment_requested_exp_idx",
+            ),
         ]
 
     def __str__(self):
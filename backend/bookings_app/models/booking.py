@@ -3,6 +3,8 @@
 from django.db import models
 from django.utils.crypto import get_random_string
 
+from users_app.utils.search import search_index
+
 
 class Booking(models.Model):
 
@@ -40,6 +42,10 @@ class Booking(models.Model):
     scheduled_at = models.DateTimeField()
     required_taaskrs = models.PositiveIntegerField(default=1)
 
+    # 🔹 Accepted assignments, kept in step with AssignmentLog on accept
+    #    (see reconcile_accepted_counts for repairs)
+    accepted_count = models.PositiveIntegerField(default=0)
+
     # 🔹 Booking lifecycle
     status = models.CharField(
         max_length=30,
@@ -101,6 +107,31 @@ class Booking(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # lowercased code / customer name / service name for admin search,
+    # kept in sync by bookings_app.services.search
+    search_text = models.TextField(blank=True, default="", editable=False)
+
+    class Meta:
+        indexes = [
+            search_index("booking_search_trgm_idx"),
+            # calendar range scans; priority covers the per-day summary
+            models.Index(
+                fields=["scheduled_at", "status"],
+                include=["priority"],
+                name="booking_schedule_idx",
+            ),
+            # code prefix lookups ("BK-7F3")
+            models.Index(
+                fields=["booking_code"],
+                name="booking_code_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+            # keyset pagination for admin lists (newest first)
+            models.Index(
+                fields=["created_at", "id"], name="booking_created_id_idx"
+            ),
+        ]
+
    # ---------------------------
     # AUTO BOOKING CODE
     # ---------------------------
@@ -109,5 +140,9 @@ class Booking(models.Model):
             self.booking_code = f"BK-{get_random_string(8).upper()}"
         super().save(*args, **kwargs)
 
+    @property
+    def open_slots(self):
+        return max(self.required_taaskrs - self.accepted_count, 0)
+
     def __str__(self):
         return f"id: {self.id} - {self.booking_code} - {self.service.name}"
@@ -0,0 +1,51 @@
+# bookings_app/models/booking_daily_stats.py
+
+from django.db import models
+
+
+class BookingDailyStats(models.Model):
+    """
+    Dashboard rollup: one row per (service day, service).
+    Rebuilt by bookings_app.services.stats, never edited by hand.
+    """
+
+    day = models.DateField()  # scheduled_at date, server time zone
+
+    service = models.ForeignKey(
+        "services_app.Service",
+        on_delete=models.CASCADE,
+        related_name="daily_stats"
+    )
+
+    category = models.ForeignKey(
+        "services_app.Category",
+        on_delete=models.CASCADE,
+        related_name="daily_stats"
+    )
+
+    bookings = models.PositiveIntegerField(default=0)
+
+    # {"pending": 3, "confirmed": 5, ...}
+    status_counts = models.JSONField(default=dict)
+    payment_status_counts = models.JSONField(default=dict)
+    assignment_status_counts = models.JSONField(default=dict)
+
+    # 🔹 Money (cancelled bookings excluded from booked_value)
+    booked_value = models.DecimalField(
+        max_digits=14, decimal_places=2, default=0
+    )
+    collected = models.DecimalField(
+        max_digits=14, decimal_places=2, default=0
+    )
+
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "booking_daily_stats"
+        unique_together = ("day", "service")
+        indexes = [
+            models.Index(fields=["day", "category"]),
+        ]
+
+    def __str__(self):
+        return f"{self.day} - service {self.service_id} ({self.bookings})"
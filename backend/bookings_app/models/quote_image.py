@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import models, transaction
+
+from daytaask_backend.storage import content_addressed_storage
 
 
 class QuoteImage(models.Model):
@@ -9,9 +11,13 @@ class QuoteImage(models.Model):
         related_name="images"
     )
 
+    # deduplicated by content: several rows can share one file
     image = models.ImageField(
-        upload_to="quotes/images/"
+        upload_to="quotes/images/",
+        storage=content_addressed_storage,
     )
+    # thumbnails / responsive widths (services_app.utils.image_derivatives)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     uploaded_by = models.CharField(
         max_length=20,
@@ -25,5 +31,17 @@ class QuoteImage(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # reference lookup before a shared file is deleted
+            models.Index(fields=["image"], name="quote_image_file_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # file write and INSERT in one transaction: the blob lock taken
+        # while storing the file is held until the row is visible
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def __str__(self):
         return f"QuoteImage {self.id} - {self.uploaded_by}"
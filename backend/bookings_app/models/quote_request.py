@@ -3,6 +3,8 @@
 from django.db import models
 from django.utils.crypto import get_random_string
 
+from users_app.utils.search import search_index
+
 
 class QuoteRequest(models.Model):
 
@@ -72,6 +74,20 @@ class QuoteRequest(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # lowercased code / customer name / service name for admin search,
+    # kept in sync by bookings_app.services.search
+    search_text = models.TextField(blank=True, default="", editable=False)
+
+    class Meta:
+        indexes = [
+            search_index("quote_search_trgm_idx"),
+            models.Index(
+                fields=["quote_code"],
+                name="quote_code_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
+
     # ---------------------------
     # AUTO QUOTE CODE
     # ---------------------------
@@ -1,7 +1,194 @@
 # bookings_app/pagination.py
 
+import base64
+import json
+from datetime import datetime
+
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class NoPagination(PageNumberPagination):
     page_size = None
+
+
+# --------------------------------------------------
+# ROW COUNTS
+# --------------------------------------------------
+def estimate_count(queryset):
+    """
+    Row count from postgres statistics instead of COUNT(*):
+    - unfiltered → pg_class.reltuples
+    - filtered   → the planner's row estimate
+    Falls back to an exact count elsewhere / before the first ANALYZE.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        if row and row[0] >= 0:
+            return row[0]
+        return queryset.count()
+
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    if isinstance(plan, list):
+        plan = plan[0]
+    return plan["Plan"]["Plan Rows"]
+
+
+class EstimatedCountPaginator(DjangoPaginator):
+    @cached_property
+    def count(self):
+        return estimate_count(self.object_list)
+
+
+# --------------------------------------------------
+# KEYSET PAGINATION (admin lists)
+# --------------------------------------------------
+class KeysetPagination(PageNumberPagination):
+    """
+    Newest first on (created_at, id).
+
+    ?page=N         page numbers as before (COUNT + OFFSET)
+    ?cursor=        keyset mode: first page, then follow next / previous.
+                    Every page is an index range scan, however deep.
+    ?count=         exact | estimate | none
+                    (default: exact for pages, none for cursors)
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    ordering = ("-created_at", "-id")
+
+    # ---------------------------
+    # CURSOR ENCODING
+    # ---------------------------
+    def encode_cursor(self, obj, reverse):
+        raw = f"{int(reverse)}|{obj.created_at.isoformat()}|{obj.pk}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, value):
+        """(reverse, created_at, id), or None for the first page."""
+        if not value:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(value.encode()).decode()
+            reverse, created_at, pk = raw.split("|")
+            return reverse == "1", datetime.fromisoformat(created_at), int(pk)
+        except (ValueError, UnicodeDecodeError):
+            raise NotFound("Invalid cursor")
+
+    def get_count_mode(self, request, default):
+        mode = request.query_params.get(self.count_query_param, default)
+        return mode if mode in ("exact", "estimate", "none") else default
+
+    # ---------------------------
+    # PAGINATE
+    # ---------------------------
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.cursor_mode = self.cursor_query_param in request.query_params
+
+        if not self.cursor_mode:
+            self.django_paginator_class = (
+                EstimatedCountPaginator
+                if self.get_count_mode(request, "exact") == "estimate"
+                else DjangoPaginator
+            )
+            return super().paginate_queryset(queryset, request, view)
+
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(
+            request.query_params[self.cursor_query_param]
+        )
+
+        count_mode = self.get_count_mode(request, "none")
+        if count_mode == "exact":
+            self.count = queryset.count()
+        elif count_mode == "estimate":
+            self.count = estimate_count(queryset)
+        else:
+            self.count = None
+
+        reverse = bool(position and position[0])
+        if reverse:
+            # previous page: walk the index the other way, flip back after
+            queryset = queryset.order_by("created_at", "id")
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if position:
+            _, created_at, pk = position
+            if reverse:
+                queryset = queryset.filter(
+                    Q(created_at__gt=created_at) | Q(id__gt=pk),
+                    created_at__gte=created_at,
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at) | Q(id__lt=pk),
+                    created_at__lte=created_at,
+                )
+
+        results = list(queryset[:page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+
+        # forward: more rows ahead = next; reverse: more rows behind = previous
+        self.next_cursor = self.previous_cursor = None
+        if results:
+            if has_more or reverse:
+                self.next_cursor = self.encode_cursor(results[-1], False)
+            if position and (has_more or not reverse):
+                self.previous_cursor = self.encode_cursor(results[0], True)
+
+        return results
+
+    # ---------------------------
+    # RESPONSE
+    # ---------------------------
+    def get_cursor_link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        if self.cursor_mode:
+            return self.get_cursor_link(self.next_cursor)
+        return super().get_next_link()
+
+    def get_previous_link(self):
+        if self.cursor_mode:
+            return self.get_cursor_link(self.previous_cursor)
+        return super().get_previous_link()
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+
+        return Response({
+            "count": self.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
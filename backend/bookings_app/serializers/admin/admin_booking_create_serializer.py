@@ -1,11 +1,12 @@
 # bookings_app/serializers/admin/admin_booking_create_serializer.py
 
 from rest_framework import serializers
-from django.utils import timezone
 
-from bookings_app.models import Booking, AssignmentLog
+from bookings_app.models import Booking
+from bookings_app.serializers.utils.assignment_utils import (
+    send_assignment_requests,
+)
 from users_app.models import User
-from bookings_app.serializers.utils.assignment_utils import accepted_taaskr_count
 
 
 class AdminBookingCreateSerializer(serializers.ModelSerializer):
@@ -43,23 +44,14 @@ class AdminBookingCreateSerializer(serializers.ModelSerializer):
 
         max_assignable = booking.required_taaskrs
 
-        for taaskr_id in taaskr_ids[:max_assignable]:
-            AssignmentLog.objects.create(
-                booking=booking,
-                taaskr_id=taaskr_id,
+        if taaskr_ids:
+            send_assignment_requests(
+                [
+                    (booking.id, taaskr_id)
+                    for taaskr_id in taaskr_ids[:max_assignable]
+                ],
                 assigned_by=request.user,
-                method="manual",
-                status="requested",
-                expires_at=timezone.now() + timezone.timedelta(hours=2),
             )
-
-        # 🔹 Final assignment status
-        accepted = accepted_taaskr_count(booking)
-        if accepted >= booking.required_taaskrs:
-            booking.assignment_status = "assigned"
-        elif accepted > 0:
-            booking.assignment_status = "partially_assigned"
-
-        booking.save(update_fields=["assignment_status"])
+            booking.refresh_from_db(fields=["assignment_status"])
 
         return booking
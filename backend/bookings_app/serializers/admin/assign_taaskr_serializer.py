@@ -1,9 +1,11 @@
 # bookings_app/serializers/admin/assign_taaskr_serializer.py
 
 from rest_framework import serializers
-from django.utils import timezone
 
-from bookings_app.models import Booking, AssignmentLog
+from bookings_app.models import Booking
+from bookings_app.serializers.utils.assignment_utils import (
+    send_assignment_requests,
+)
 from users_app.models import User
 
 
@@ -42,18 +44,10 @@ class AssignTaaskrSerializer(serializers.Serializer):
 
         max_required = booking.required_taaskrs
 
-        for taaskr_id in taaskr_ids[:max_required]:
-            AssignmentLog.objects.create(
-                booking=booking,
-                taaskr_id=taaskr_id,
-                assigned_by=request.user,
-                method="manual",
-                status="requested",
-                expires_at=timezone.now() + timezone.timedelta(hours=2),
-            )
-
-        # booking stays pending until accepted
-        booking.assignment_status = "requested"
-        booking.save(update_fields=["assignment_status"])
+        send_assignment_requests(
+            [(booking.id, taaskr_id) for taaskr_id in taaskr_ids[:max_required]],
+            assigned_by=request.user,
+        )
 
+        booking.refresh_from_db(fields=["assignment_status"])
         return booking
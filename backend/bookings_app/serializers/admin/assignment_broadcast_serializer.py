@@ -0,0 +1,31 @@
+# bookings_app/serializers/admin/assignment_broadcast_serializer.py
+
+from rest_framework import serializers
+from bookings_app.models import AssignmentBroadcast
+
+
+class AssignmentBroadcastSerializer(serializers.ModelSerializer):
+    booking_code = serializers.CharField(
+        source="booking.booking_code", read_only=True
+    )
+    created_by = serializers.CharField(
+        source="created_by.full_name", read_only=True
+    )
+
+    class Meta:
+        model = AssignmentBroadcast
+        fields = [
+            "id",
+            "booking",
+            "booking_code",
+            "created_by",
+            "radius_km",
+            "status",
+            "total_taaskrs",
+            "chunks_total",
+            "chunks_done",
+            "requests_sent",
+            "expires_at",
+            "created_at",
+            "finished_at",
+        ]
@@ -1,46 +1,34 @@
 # bookings_app/serializers/admin/booking_calendar_serializer.py
 
 from rest_framework import serializers
-from bookings_app.models import Booking
-
-
-class BookingCalendarSerializer(serializers.ModelSerializer):
-    service_name = serializers.CharField(
-        source="service.name", read_only=True
-    )
-    customer_name = serializers.CharField(
-        source="customer.full_name", read_only=True
+from bookings_app.services.calendar import urgency_level
+
+
+class BookingCalendarSerializer(serializers.Serializer):
+    """
+    Renders the .values() rows of services.calendar.calendar_rows()
+    (plain dicts, no Booking instances). Same fields and formats as
+    the former ModelSerializer.
+    """
+
+    id = serializers.IntegerField(read_only=True)
+    booking_code = serializers.CharField(read_only=True)
+    scheduled_at = serializers.DateTimeField(read_only=True)
+    service_name = serializers.CharField(read_only=True)
+    status = serializers.CharField(read_only=True)
+    assignment_status = serializers.CharField(read_only=True)
+    customer_name = serializers.CharField(read_only=True)
+    priority = serializers.CharField(read_only=True)
+    required_taaskrs = serializers.IntegerField(read_only=True)
+
+    accepted_taaskr_count = serializers.IntegerField(
+        source="accepted_count", read_only=True
     )
-
-    accepted_taaskr_count = serializers.IntegerField(read_only=True)
     is_fully_assigned = serializers.SerializerMethodField()
     urgency_level = serializers.SerializerMethodField()
 
-    class Meta:
-        model = Booking
-        fields = [
-            "id",
-            "booking_code",
-            "scheduled_at",
-            "service_name",
-            "status",
-            "assignment_status",
-            "customer_name",
-            "priority",
-            "required_taaskrs",
-            "accepted_taaskr_count",
-            "is_fully_assigned",
-            "urgency_level",
-        ]
-
-    def get_is_fully_assigned(self, obj):
-        return obj.accepted_taaskr_count >= obj.required_taaskrs
-
-    def get_urgency_level(self, obj):
-        accepted = obj.accepted_taaskr_count
+    def get_is_fully_assigned(self, row):
+        return row["accepted_count"] >= row["required_taaskrs"]
 
-        if accepted == 0:
-            return "high"
-        elif accepted < obj.required_taaskrs:
-            return "medium"
-        return "low"
+    def get_urgency_level(self, row):
+        return urgency_level(row["accepted_count"], row["required_taaskrs"])
@@ -8,6 +8,9 @@ from bookings_app.models import (
     Review,
     Warranty,
 )
+from bookings_app.serializers.utils.assignment_utils import (
+    get_accepted_assignments,
+)
 from users_app.models import Address, User
 
 
@@ -84,10 +87,10 @@ class BookingAdminDetailSerializer(serializers.ModelSerializer):
         ]
 
     def get_accepted_taaskrs(self, obj):
-        return obj.assignments.filter(status="accepted").count()
+        return obj.accepted_count
 
     def get_assigned_taaskrs(self, obj):
-        assignments = obj.assignments.filter(status="accepted")
+        assignments = get_accepted_assignments(obj)
 
         return [
             {
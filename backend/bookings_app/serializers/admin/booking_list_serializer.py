@@ -34,7 +34,7 @@ class BookingAdminListSerializer(serializers.ModelSerializer):
         ]
 
     def get_accepted_taaskrs(self, obj):
-        return obj.assignments.filter(status="accepted").count()
+        return obj.accepted_count
 
     def get_is_urgent(self, obj):
         return (
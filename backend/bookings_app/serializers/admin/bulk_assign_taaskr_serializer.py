@@ -0,0 +1,78 @@
+# bookings_app/serializers/admin/bulk_assign_taaskr_serializer.py
+
+from django.conf import settings
+from rest_framework import serializers
+
+from bookings_app.models import Booking
+from bookings_app.serializers.utils.assignment_utils import (
+    send_assignment_requests,
+)
+from users_app.models import User
+
+
+class BookingTaaskrRequestSerializer(serializers.Serializer):
+    booking_id = serializers.IntegerField()
+    taaskr_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        min_length=1
+    )
+
+
+class BulkAssignTaaskrSerializer(serializers.Serializer):
+    """
+    {"requests": [{"booking_id": 1, "taaskr_ids": [4, 5]}, ...]}
+    """
+    requests = BookingTaaskrRequestSerializer(many=True, allow_empty=False)
+
+    def validate_requests(self, value):
+        pairs = [
+            (item["booking_id"], taaskr_id)
+            for item in value
+            for taaskr_id in item["taaskr_ids"]
+        ]
+
+        if len(pairs) > settings.ASSIGNMENT_BULK_MAX_REQUESTS:
+            raise serializers.ValidationError(
+                f"At most {settings.ASSIGNMENT_BULK_MAX_REQUESTS} requests per call"
+            )
+
+        booking_ids = {booking_id for booking_id, _ in pairs}
+        open_bookings = set(
+            Booking.objects.filter(id__in=booking_ids)
+            .exclude(status__in=["cancelled", "completed"])
+            .values_list("id", flat=True)
+        )
+        if booking_ids - open_bookings:
+            raise serializers.ValidationError(
+                "Invalid or closed booking_id(s): "
+                f"{sorted(booking_ids - open_bookings)}"
+            )
+
+        taaskr_ids = {taaskr_id for _, taaskr_id in pairs}
+        valid_taaskrs = set(
+            User.objects.filter(
+                id__in=taaskr_ids,
+                taaskrprofile__isnull=False
+            ).values_list("id", flat=True)
+        )
+        if taaskr_ids - valid_taaskrs:
+            raise serializers.ValidationError(
+                "One or more users are not valid taaskrs: "
+                f"{sorted(taaskr_ids - valid_taaskrs)}"
+            )
+
+        return pairs
+
+    def create(self, validated_data):
+        request = self.context["request"]
+
+        outcomes = send_assignment_requests(
+            validated_data["requests"],
+            assigned_by=request.user,
+        )
+
+        summary = {"created": 0, "revived": 0, "skipped": 0}
+        for outcome in outcomes:
+            summary[outcome["result"]] += 1
+
+        return {"summary": summary, "results": outcomes}
@@ -31,7 +31,7 @@ class NeedyAssignmentSerializer(serializers.ModelSerializer):
         ]
 
     def get_accepted_taaskrs(self, obj):
-        return obj.assignments.filter(status="accepted").count()
+        return obj.accepted_count
 
     def get_is_urgent(self, obj):
         return (
@@ -2,14 +2,18 @@
 
 from rest_framework import serializers
 from bookings_app.models import QuoteImage
+from services_app.utils.image_derivatives import ImageDerivativesField
 
 
 class QuoteImageSerializer(serializers.ModelSerializer):
+    image_variants = ImageDerivativesField("image")
+
     class Meta:
         model = QuoteImage
         fields = [
             "id",
             "image",
+            "image_variants",
             "uploaded_by",
             "created_at",
         ]
@@ -40,14 +40,14 @@ class AdminQuoteRequestUpdateSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
 
-        # 🗑️ Remove selected images (also deletes files)
+        # 🗑️ Remove selected images (files are released by the
+        # post_delete signal once no other quote image shares them)
         if remove_image_ids:
             images = QuoteImage.objects.filter(
                 id__in=remove_image_ids,
                 quote_request=instance
             )
             for img in images:
-                img.image.delete(save=False)
                 img.delete()
 
         # ➕ Add new images
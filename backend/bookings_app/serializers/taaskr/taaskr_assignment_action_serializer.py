@@ -1,7 +1,12 @@
 # bookings_app/serializers/taaskr/taaskr_assignment_action_serializer.py
 
 from rest_framework import serializers
-from bookings_app.models import AssignmentLog
+from bookings_app.serializers.utils.assignment_utils import (
+    claim_assignment,
+    reject_assignment,
+    CLAIM_FULL,
+    CLAIM_NOT_PENDING,
+)
 from django.utils import timezone
 
 
@@ -9,7 +14,7 @@ class TaaskrAssignmentActionSerializer(serializers.Serializer):
     action = serializers.ChoiceField(choices=["accept", "reject"])
 
     def validate(self, attrs):
-        instance = self.context["instance"]  # we'll pass it via view
+        instance = self.instance  # passed in by the view
         if instance.status != "requested":
             raise serializers.ValidationError(
                 {"action": "This assignment request is no longer pending."}
@@ -22,36 +27,30 @@ class TaaskrAssignmentActionSerializer(serializers.Serializer):
 
     def update(self, instance, validated_data):
         action = validated_data["action"]
-        booking = instance.booking
 
-        # assume you have this
-        from bookings_app.serializers.utils.assignment_utils import accepted_taaskr_count
-
-        accepted_count = accepted_taaskr_count(booking)
-
-        if action == "accept":
-            if accepted_count >= booking.required_taaskrs:
+        if action == "reject":
+            if not reject_assignment(instance):
                 raise serializers.ValidationError(
-                    {"action": "All required taaskrs have already been assigned."}
+                    {"action": "This assignment request is no longer pending."}
                 )
-            instance.status = "accepted"
-        else:
-            instance.status = "rejected"
-
-        instance.save()
+            return instance
 
-        # Re-check after action
-        accepted_count = accepted_taaskr_count(booking)
+        result = claim_assignment(instance)
 
-        if accepted_count >= booking.required_taaskrs:
-            # Auto-cancel remaining pending requests
-            AssignmentLog.objects.filter(
-                booking=booking,
-                status="requested"
-            ).exclude(id=instance.id).update(status="expired")
-
-            booking.assignment_status = "assigned"
-            booking.status = "confirmed"  # or your logic
-            booking.save()
+        if result == CLAIM_FULL:
+            raise serializers.ValidationError(
+                {"action": "All required taaskrs have already been assigned."}
+            )
+        if result == CLAIM_NOT_PENDING:
+            raise serializers.ValidationError(
+                {"action": "This assignment request is no longer pending."}
+            )
 
         return instance
+
+    def to_representation(self, instance):
+        return {
+            "id": instance.id,
+            "booking": instance.booking_id,
+            "status": instance.status,
+        }
@@ -21,7 +21,8 @@ class TaaskrPendingAssignmentSerializer(serializers.ModelSerializer):
         source="booking.scheduled_at", read_only=True)
     required_taaskrs = serializers.IntegerField(
         source="booking.required_taaskrs", read_only=True)
-    accepted_count = serializers.IntegerField(read_only=True)
+    accepted_count = serializers.IntegerField(
+        source="booking.accepted_count", read_only=True)
     location_short = serializers.SerializerMethodField()
     expires_in = serializers.SerializerMethodField()  # human friendly
 
@@ -1,21 +1,298 @@
 # bookings_app/serializers/utils/assignment_utils.py
 
-from bookings_app.models import AssignmentLog
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from bookings_app.models import AssignmentLog, Booking
 
 
 def accepted_taaskr_count(booking):
-    return AssignmentLog.objects.filter(
-        booking=booking,
-        status="accepted"
-    ).count()
+    return booking.accepted_count
 
 
 def remaining_slots(booking):
-    return max(
-        booking.required_taaskr - accepted_taaskr_count(booking),
-        0
-    )
+    return booking.open_slots
 
 
 def can_accept_assignment(booking):
-    return accepted_taaskr_count(booking) < booking.required_taaskr
+    return booking.open_slots > 0
+
+
+# ==========================
+# ACCEPTED COUNT (denormalized on Booking)
+# ==========================
+def decrement_accepted_count(booking_id):
+    return Booking.objects.filter(
+        pk=booking_id, accepted_count__gt=0
+    ).update(
+        accepted_count=F("accepted_count") - 1
+    )
+
+
+# ==========================
+# ACCEPT (slot claiming)
+# ==========================
+CLAIM_ACCEPTED = "accepted"
+CLAIM_FULL = "full"
+CLAIM_NOT_PENDING = "not_pending"
+
+
+def _pending(queryset, now):
+    return queryset.filter(status="requested").filter(
+        Q(expires_at__isnull=True) | Q(expires_at__gt=now)
+    )
+
+
+def claim_assignment(assignment):
+    """
+    Accept a requested assignment if the booking still has a free slot.
+
+    At most `required_taaskrs` claims can succeed: the slot is taken
+    with a conditional UPDATE on the booking row, which Postgres
+    re-checks after any concurrent claimer commits. Writers that touch
+    both tables lock the booking row before any of its AssignmentLog
+    rows (send_assignment_requests locks its bookings first, in id
+    order), so the winner expiring the leftover requests can't
+    deadlock with other claimers or with a concurrent re-request.
+
+    Returns CLAIM_ACCEPTED, CLAIM_FULL or CLAIM_NOT_PENDING.
+    """
+    booking_id = assignment.booking_id
+
+    # fast path: full bookings answer without taking any lock
+    if not Booking.objects.filter(
+        pk=booking_id, accepted_count__lt=F("required_taaskrs")
+    ).exists():
+        return CLAIM_FULL
+
+    now = timezone.now()
+
+    with transaction.atomic():
+        claimed = Booking.objects.filter(
+            pk=booking_id, accepted_count__lt=F("required_taaskrs")
+        ).update(accepted_count=F("accepted_count") + 1)
+
+        if not claimed:
+            return CLAIM_FULL
+
+        flipped = _pending(
+            AssignmentLog.objects.filter(pk=assignment.pk), now
+        ).update(status="accepted", updated_at=now)
+
+        if not flipped:
+            # give the slot back
+            transaction.set_rollback(True)
+            return CLAIM_NOT_PENDING
+
+        accepted_count, required_taaskrs = Booking.objects.filter(
+            pk=booking_id
+        ).values_list("accepted_count", "required_taaskrs").get()
+
+        if accepted_count >= required_taaskrs:
+            # Auto-cancel remaining pending requests
+            AssignmentLog.objects.filter(
+                booking_id=booking_id,
+                status="requested",
+            ).update(status="expired", updated_at=now)
+
+            Booking.objects.filter(pk=booking_id).update(
+                assignment_status="assigned",
+                status="confirmed",
+            )
+
+    assignment.status = "accepted"
+    assignment.updated_at = now
+    return CLAIM_ACCEPTED
+
+
+def reject_assignment(assignment):
+    now = timezone.now()
+    rejected = _pending(
+        AssignmentLog.objects.filter(pk=assignment.pk), now
+    ).update(status="rejected", updated_at=now)
+
+    if rejected:
+        assignment.status = "rejected"
+        assignment.updated_at = now
+    return bool(rejected)
+
+
+# ==========================
+# SEND REQUESTS (bulk upsert)
+# ==========================
+REQUEST_CREATED = "created"
+REQUEST_REVIVED = "revived"
+REQUEST_SKIPPED = "skipped"
+
+# rows in these states are left alone on re-request
+_LIVE_STATUSES = ["requested", "accepted"]
+
+DEFAULT_REQUEST_TTL = timezone.timedelta(hours=2)
+
+
+def send_assignment_requests(pairs, assigned_by=None, method="manual",
+                             expires_at=None, revive=True):
+    """
+    Request taaskrs for bookings in one upsert.
+
+    pairs: iterable of (booking_id, taaskr_id).
+    New pairs are inserted; expired / rejected / cancelled rows for
+    the same (booking, taaskr) are revived in place through the
+    unique_together conflict; live rows (requested and not yet
+    expired, or accepted) are skipped. revive=False skips every
+    existing row instead (broadcasts).
+
+    Returns one {"booking_id", "taaskr_id", "result", "reason"} per pair.
+    """
+    now = timezone.now()
+    if expires_at is None:
+        expires_at = now + DEFAULT_REQUEST_TTL
+
+    pairs = list(dict.fromkeys(pairs))  # dedupe, keep order
+    if not pairs:
+        return []
+
+    booking_ids = {booking_id for booking_id, _ in pairs}
+    taaskr_ids = {taaskr_id for _, taaskr_id in pairs}
+
+    with transaction.atomic():
+        # bookings first, in id order: the lock order claim_assignment
+        # uses, so a re-request can't deadlock with a concurrent accept
+        list(
+            Booking.objects.select_for_update()
+            .filter(id__in=booking_ids)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+        # lock existing rows so a concurrent accept can't be revived over
+        existing = {
+            (booking_id, taaskr_id): (status, row_expires_at)
+            for booking_id, taaskr_id, status, row_expires_at in (
+                AssignmentLog.objects.select_for_update()
+                .filter(booking_id__in=booking_ids, taaskr_id__in=taaskr_ids)
+                .values_list("booking_id", "taaskr_id", "status", "expires_at")
+            )
+        }
+
+        outcomes, rows = [], []
+        for booking_id, taaskr_id in pairs:
+            outcome = {"booking_id": booking_id, "taaskr_id": taaskr_id}
+            current = existing.get((booking_id, taaskr_id))
+
+            if current is None:
+                outcome["result"] = REQUEST_CREATED
+            elif not revive:
+                outcome["result"] = REQUEST_SKIPPED
+                outcome["reason"] = f"already {current[0]}"
+                outcomes.append(outcome)
+                continue
+            else:
+                status, row_expires_at = current
+                stale = (
+                    status == "requested"
+                    and row_expires_at is not None
+                    and row_expires_at <= now
+                )
+                if status in _LIVE_STATUSES and not stale:
+                    outcome["result"] = REQUEST_SKIPPED
+                    outcome["reason"] = f"already {status}"
+                    outcomes.append(outcome)
+                    continue
+                outcome["result"] = REQUEST_REVIVED
+
+            outcomes.append(outcome)
+            rows.append(AssignmentLog(
+                booking_id=booking_id,
+                taaskr_id=taaskr_id,
+                assigned_by=assigned_by,
+                method=method,
+                status="requested",
+                expires_at=expires_at,
+            ))
+
+        if rows:
+            if revive:
+                conflicts = {
+                    "update_conflicts": True,
+                    "unique_fields": ["booking", "taaskr"],
+                    "update_fields": [
+                        "assigned_by", "method", "status",
+                        "expires_at", "updated_at",
+                    ],
+                }
+            else:
+                # a row inserted since the lock above stays as it is
+                conflicts = {"ignore_conflicts": True}
+            AssignmentLog.objects.bulk_create(rows, batch_size=1000, **conflicts)
+
+            # booking stays pending until accepted
+            Booking.objects.filter(
+                id__in={row.booking_id for row in rows},
+                assignment_status__in=[
+                    "unassigned", "declined",
+                    "auto_assign_pending", "failed",
+                ],
+            ).update(assignment_status="requested")
+
+    return outcomes
+
+
+def reconcile_accepted_counts(queryset=None):
+    """
+    Recompute accepted_count from AssignmentLog in one UPDATE,
+    touching only drifted rows. Returns the number of rows fixed.
+    """
+    if queryset is None:
+        queryset = Booking.objects.all()
+
+    actual = Coalesce(
+        Subquery(
+            AssignmentLog.objects.filter(
+                booking=OuterRef("pk"),
+                status="accepted",
+            )
+            .order_by()
+            .values("booking")
+            .annotate(total=Count("id"))
+            .values("total")
+        ),
+        0,
+    )
+
+    return (
+        queryset.annotate(actual_count=actual)
+        .exclude(accepted_count=F("actual_count"))
+        .update(accepted_count=actual)
+    )
+
+
+# ==========================
+# PREFETCH (detail serializer)
+# ==========================
+def with_accepted_assignments(queryset):
+    """
+    Booking queryset with accepted assignments (taaskr + assigned_by)
+    prefetched into `accepted_assignments`.
+    """
+    return queryset.prefetch_related(
+        Prefetch(
+            "assignments",
+            queryset=AssignmentLog.objects.filter(
+                status="accepted"
+            ).select_related("taaskr", "assigned_by"),
+            to_attr="accepted_assignments",
+        )
+    )
+
+
+def get_accepted_assignments(booking):
+    accepted = getattr(booking, "accepted_assignments", None)
+    if accepted is not None:
+        return accepted
+
+    return booking.assignments.filter(
+        status="accepted"
+    ).select_related("taaskr", "assigned_by")
@@ -0,0 +1,181 @@
+# bookings_app/services/broadcast.py
+
+from django.conf import settings
+from django.db.models import BooleanField, Exists, F, OuterRef, Subquery, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from bookings_app.models import AssignmentBroadcast, AssignmentLog
+from bookings_app.serializers.utils.assignment_utils import (
+    send_assignment_requests,
+    REQUEST_SKIPPED,
+)
+from bookings_app.services.matching import CLOSED_BOOKING_STATUSES, tokenize
+from taaskr_app.models import Availability, TaaskrProfile
+from users_app.models import Address
+from users_app.utils.geo import within_radius
+
+
+ACTIVE_BROADCAST_STATUSES = ["queued", "running"]
+
+
+# --------------------------------------------------
+# ELIGIBLE TAASKRS (one SQL query)
+# --------------------------------------------------
+def eligible_taaskr_ids(booking, radius_km=None):
+    """
+    Taaskr user ids with a skill tag matching the service, currently
+    available, not asked for this booking before (whatever came of
+    it), and within radius_km when one is given and the booking has
+    coordinates. Best rated first.
+    """
+    service = booking.service
+    tokens = tokenize(service.name, service.category.name)
+    if not tokens:
+        return []
+
+    # same word match as the matching engine, done by postgres
+    skill_pattern = r"\m(" + "|".join(sorted(tokens)) + r")\M"
+
+    latest_availability = Availability.objects.filter(
+        taaskr=OuterRef("user_id")
+    ).order_by("-updated_at").values("is_available")[:1]
+
+    profiles = TaaskrProfile.objects.annotate(
+        skill_match=RawSQL(
+            "EXISTS (SELECT 1 FROM unnest(taaskr_app_taaskrprofile.skill_tags)"
+            " AS tag WHERE lower(tag) ~ %s)",
+            (skill_pattern,),
+            output_field=BooleanField(),
+        ),
+        available=Coalesce(Subquery(latest_availability), Value(True)),
+    ).filter(
+        skill_match=True,
+        available=True,
+        user__is_active=True,
+    ).exclude(
+        Exists(AssignmentLog.objects.filter(
+            booking=booking, taaskr=OuterRef("user_id")
+        ))
+    )
+
+    if settings.MATCHING_VERIFIED_ONLY:
+        profiles = profiles.filter(verified=True)
+
+    address = booking.address
+    if (
+        radius_km is not None
+        and address
+        and address.latitude is not None
+        and address.longitude is not None
+    ):
+        profiles = profiles.filter(user_id__in=within_radius(
+            Address.objects.all(),
+            address.latitude,
+            address.longitude,
+            radius_km,
+        ).values("user_id"))
+
+    return list(
+        profiles.order_by("-rating_avg", "user_id")
+        .values_list("user_id", flat=True)
+    )
+
+
+# --------------------------------------------------
+# PIPELINE STEPS (called from bookings_app.tasks)
+# --------------------------------------------------
+def create_broadcast(booking, created_by, radius_km=None):
+    return AssignmentBroadcast.objects.create(
+        booking=booking,
+        created_by=created_by,
+        radius_km=radius_km,
+        expires_at=timezone.now() + timezone.timedelta(
+            minutes=settings.BROADCAST_REQUEST_EXPIRY_MINUTES
+        ),
+    )
+
+
+def plan_broadcast(broadcast_id):
+    """
+    Select eligible taaskrs and split them into chunks.
+    Returns the chunks to send ([] when there's nothing to do).
+    """
+    broadcast = AssignmentBroadcast.objects.select_related(
+        "booking__service__category", "booking__address"
+    ).get(pk=broadcast_id)
+
+    if broadcast.status != "queued":
+        return []
+
+    taaskr_ids = eligible_taaskr_ids(broadcast.booking, broadcast.radius_km)
+    size = settings.BROADCAST_CHUNK_SIZE
+    chunks = [
+        taaskr_ids[i:i + size] for i in range(0, len(taaskr_ids), size)
+    ]
+
+    AssignmentBroadcast.objects.filter(pk=broadcast_id).update(
+        status="running" if chunks else "completed",
+        total_taaskrs=len(taaskr_ids),
+        chunks_total=len(chunks),
+        finished_at=None if chunks else timezone.now(),
+    )
+    return chunks
+
+
+def _finish(broadcast_id, status):
+    return AssignmentBroadcast.objects.filter(
+        pk=broadcast_id, status__in=ACTIVE_BROADCAST_STATUSES
+    ).update(status=status, finished_at=timezone.now())
+
+
+def send_broadcast_chunk(broadcast_id, taaskr_ids):
+    """
+    Send one chunk of requests, unless the broadcast was cancelled or
+    the booking has filled / closed since the last chunk.
+    Returns the taaskr ids that got a (new or revived) request.
+    """
+    broadcast = AssignmentBroadcast.objects.select_related(
+        "booking", "created_by"
+    ).get(pk=broadcast_id)
+
+    if broadcast.status != "running":
+        return []
+
+    booking = broadcast.booking
+    if booking.status in CLOSED_BOOKING_STATUSES:
+        _finish(broadcast_id, "cancelled")
+        return []
+    if booking.open_slots == 0:
+        _finish(broadcast_id, "filled")
+        return []
+
+    outcomes = send_assignment_requests(
+        [(booking.id, taaskr_id) for taaskr_id in taaskr_ids],
+        assigned_by=broadcast.created_by,
+        method="broadcast",
+        expires_at=broadcast.expires_at,
+        revive=False,  # a broadcast never re-asks someone who said no
+    )
+    sent = [o["taaskr_id"] for o in outcomes if o["result"] != REQUEST_SKIPPED]
+
+    AssignmentBroadcast.objects.filter(pk=broadcast_id).update(
+        chunks_done=F("chunks_done") + 1,
+        requests_sent=F("requests_sent") + len(sent),
+    )
+    AssignmentBroadcast.objects.filter(
+        pk=broadcast_id, status="running", chunks_done__gte=F("chunks_total")
+    ).update(status="completed", finished_at=timezone.now())
+
+    return sent
+
+
+def cancel_broadcast(broadcast_id):
+    """Stops the chunks that haven't gone out yet."""
+    return _finish(broadcast_id, "cancelled")
+
+
+def fail_broadcast(broadcast_id):
+    """A step raised: stop here instead of staying queued / running."""
+    return _finish(broadcast_id, "failed")
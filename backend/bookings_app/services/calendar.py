@@ -0,0 +1,122 @@
+# bookings_app/services/calendar.py
+
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from bookings_app.models import Booking
+
+
+class CalendarRangeError(ValueError):
+    pass
+
+
+# --------------------------------------------------
+# DATE RANGE → TIMESTAMP RANGE
+# --------------------------------------------------
+def calendar_range(start_date, end_date, tz_name=None):
+    """
+    Inclusive YYYY-MM-DD dates → half-open aware range
+    [start 00:00, day after end 00:00) in the calendar's timezone.
+    Filtering on this keeps scheduled_at sargable (no ::date cast).
+    """
+    try:
+        tz = ZoneInfo(tz_name) if tz_name else timezone.get_current_timezone()
+    except (ZoneInfoNotFoundError, ValueError):
+        raise CalendarRangeError(f"Unknown timezone: {tz_name}")
+
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        raise CalendarRangeError("Dates must be YYYY-MM-DD")
+
+    if end < start:
+        raise CalendarRangeError("end_date is before start_date")
+    if (end - start).days >= settings.CALENDAR_MAX_DAYS:
+        raise CalendarRangeError(
+            f"Range is limited to {settings.CALENDAR_MAX_DAYS} days"
+        )
+
+    return (
+        datetime.combine(start, time.min, tzinfo=tz),
+        datetime.combine(end + timedelta(days=1), time.min, tzinfo=tz),
+        tz,
+    )
+
+
+def urgency_level(accepted, required):
+    if accepted == 0:
+        return "high"
+    if accepted < required:
+        return "medium"
+    return "low"
+
+
+def in_range(queryset, start, end):
+    return queryset.filter(scheduled_at__gte=start, scheduled_at__lt=end)
+
+
+# --------------------------------------------------
+# ENTRIES (week / day view)
+# --------------------------------------------------
+def calendar_rows():
+    """
+    One slim dict per booking, straight from .values(); rendered by
+    BookingCalendarSerializer without building Booking instances.
+    """
+    return Booking.objects.order_by("scheduled_at", "id").values(
+        "id",
+        "booking_code",
+        "scheduled_at",
+        "status",
+        "assignment_status",
+        "priority",
+        "required_taaskrs",
+        "accepted_count",
+        service_name=F("service__name"),
+        customer_name=F("customer__full_name"),
+    )
+
+
+# --------------------------------------------------
+# PER-DAY SUMMARY (month view)
+# --------------------------------------------------
+def calendar_day_summary(start, end, tz):
+    """
+    {"date", "total", "by_status", "by_priority"} per day that has
+    bookings; grouped in SQL, never loads booking rows.
+    """
+    rows = (
+        in_range(Booking.objects.all(), start, end)
+        .annotate(day=TruncDate("scheduled_at", tzinfo=tz))
+        .values("day", "status", "priority")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+
+    days = defaultdict(lambda: {
+        "total": 0,
+        "by_status": defaultdict(int),
+        "by_priority": defaultdict(int),
+    })
+    for row in rows:
+        day = days[row["day"]]
+        day["total"] += row["total"]
+        day["by_status"][row["status"]] += row["total"]
+        day["by_priority"][row["priority"]] += row["total"]
+
+    return [
+        {
+            "date": day,
+            "total": summary["total"],
+            "by_status": dict(summary["by_status"]),
+            "by_priority": dict(summary["by_priority"]),
+        }
+        for day, summary in sorted(days.items())
+    ]
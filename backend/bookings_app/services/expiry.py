@@ -0,0 +1,107 @@
+# bookings_app/services/expiry.py
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from bookings_app.models import AssignmentLog, Booking
+from bookings_app.services.matching import CLOSED_BOOKING_STATUSES
+
+
+def expire_request_batch(now, batch_size):
+    """
+    Expire up to batch_size overdue requests (oldest first).
+    Rows locked by an in-flight accept/cancel are skipped, not waited on.
+    Returns the expired (log id, booking id) pairs.
+    """
+    with transaction.atomic():
+        rows = list(
+            AssignmentLog.objects.select_for_update(skip_locked=True)
+            .filter(status="requested", expires_at__lte=now)
+            .order_by("expires_at")
+            .values_list("id", "booking_id")[:batch_size]
+        )
+        if not rows:
+            return rows
+
+        AssignmentLog.objects.filter(
+            id__in=[log_id for log_id, _ in rows]
+        ).update(status="expired", updated_at=now)
+
+    return rows
+
+
+def refresh_assignment_status(booking_ids):
+    """
+    Bookings left with open slots and no live request go back to
+    auto_assign_pending (or failed once attempts run out). Bookings
+    some taaskrs already accepted stay partially_assigned.
+    Returns the ids that should be retried.
+    """
+    now = timezone.now()
+
+    bookings = (
+        Booking.objects.filter(id__in=booking_ids)
+        .exclude(status__in=CLOSED_BOOKING_STATUSES)
+        .annotate(live_requests=Count(
+            "assignments",
+            filter=Q(
+                assignments__status="requested",
+                assignments__expires_at__gt=now,
+            ),
+        ))
+        .only("id", "required_taaskrs", "accepted_count",
+              "assignment_attempts", "assignment_status")
+    )
+
+    retry, pending, partial, failed = [], [], [], []
+    for booking in bookings:
+        if booking.open_slots == 0 or booking.live_requests:
+            continue
+        exhausted = booking.assignment_attempts >= settings.MATCHING_MAX_ATTEMPTS
+        if booking.accepted_count:
+            partial.append(booking.id)
+        elif exhausted:
+            failed.append(booking.id)
+        else:
+            pending.append(booking.id)
+        if not exhausted:
+            retry.append(booking.id)
+
+    # a claim may have landed since the read: don't demote it
+    still_open = Booking.objects.filter(accepted_count__lt=F("required_taaskrs"))
+    still_open.filter(id__in=pending, accepted_count=0).update(
+        assignment_status="auto_assign_pending"
+    )
+    still_open.filter(id__in=partial).update(
+        assignment_status="partially_assigned"
+    )
+    still_open.filter(id__in=failed, accepted_count=0).update(
+        assignment_status="failed"
+    )
+
+    return retry
+
+
+def sweep_expired_requests(batch_size=None, max_batches=None):
+    """
+    Bounded sweep: at most max_batches UPDATEs of batch_size rows.
+    Returns {"expired": n, "retry": booking ids to re-match}.
+    """
+    batch_size = batch_size or settings.ASSIGNMENT_EXPIRY_BATCH_SIZE
+    max_batches = max_batches or settings.ASSIGNMENT_EXPIRY_MAX_BATCHES
+    now = timezone.now()
+
+    expired, touched = 0, set()
+    for _ in range(max_batches):
+        rows = expire_request_batch(now, batch_size)
+        if not rows:
+            break
+        expired += len(rows)
+        touched.update(booking_id for _, booking_id in rows)
+
+    return {
+        "expired": expired,
+        "retry": refresh_assignment_status(touched),
+    }
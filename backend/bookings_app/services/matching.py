@@ -0,0 +1,401 @@
+# bookings_app/services/matching.py
+
+import heapq
+import math
+import re
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from bookings_app.models import AssignmentLog, Booking
+from taaskr_app.models import Availability, TaaskrProfile
+from users_app.models import Address
+from users_app.utils.geo import EARTH_RADIUS_KM, KM_PER_DEGREE, within_radius
+
+
+OPEN_ASSIGNMENT_STATUSES = ["unassigned", "auto_assign_pending", "declined"]
+CLOSED_BOOKING_STATUSES = ["cancelled", "completed"]
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(*texts):
+    """Lowercase word set used on both skill tags and service names."""
+    tokens = set()
+    for text in texts:
+        if text:
+            tokens.update(
+                t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 2
+            )
+    return tokens
+
+
+# --------------------------------------------------
+# IN-MEMORY TAASKR INDEX
+# --------------------------------------------------
+class TaaskrIndex:
+    """
+    Every matchable taaskr, loaded once per matching run:
+    - skill token → taaskr ids (inverted index)
+    - lat/lng grid cell → skill token → taaskr ids
+    - rating / current load per taaskr
+    Candidate lookups never touch the database.
+    """
+
+    def __init__(self, profiles, locations, loads, max_distance_km):
+        # profiles: (user_id, skill_tags, rating_avg), available only
+        self.cell_deg = max_distance_km / KM_PER_DEGREE
+        self.rating = {}
+        self.skills = {}
+        self.by_skill = defaultdict(set)
+        self.locations = {}
+        self.grid = defaultdict(lambda: defaultdict(list))
+        self.loads = defaultdict(int, loads)
+
+        for user_id, skill_tags, rating_avg in profiles:
+            tokens = tokenize(*skill_tags)
+            self.rating[user_id] = rating_avg or 0.0
+            self.skills[user_id] = tokens
+            for token in tokens:
+                self.by_skill[token].add(user_id)
+
+        for user_id, (lat, lng) in locations.items():
+            if user_id in self.rating:
+                self.locations[user_id] = (
+                    math.radians(lat), math.radians(lng)
+                )
+                cell = self.grid[self._cell(lat, lng)]
+                for token in self.skills[user_id]:
+                    cell[token].append(user_id)
+
+    def _cell(self, lat, lng):
+        return (
+            math.floor(lat / self.cell_deg),
+            math.floor(lng / self.cell_deg),
+        )
+
+    @classmethod
+    def build(cls, max_distance_km=None, near=None):
+        """
+        near=(lat, lng): load only taaskrs with an address within
+        max_distance_km of that point. Same candidates as the full
+        index for a booking there, for a fraction of the rows.
+        """
+        if max_distance_km is None:
+            max_distance_km = settings.MATCHING_MAX_DISTANCE_KM
+
+        taaskr_ids = None
+        if near is not None:
+            taaskr_ids = set(
+                within_radius(
+                    Address.objects.filter(user__taaskrprofile__isnull=False),
+                    near[0], near[1], max_distance_km,
+                ).values_list("user_id", flat=True)
+            )
+
+        def scoped(queryset, field):
+            if taaskr_ids is None:
+                return queryset
+            return queryset.filter(**{f"{field}__in": taaskr_ids})
+
+        profiles = scoped(TaaskrProfile.objects.all(), "user_id")
+        if settings.MATCHING_VERIFIED_ONLY:
+            profiles = profiles.filter(verified=True)
+
+        # latest Availability row wins; no row → available
+        available = {}
+        for taaskr_id, is_available in (
+            scoped(Availability.objects.all(), "taaskr_id")
+            .order_by("updated_at")
+            .values_list("taaskr_id", "is_available")
+        ):
+            available[taaskr_id] = is_available
+
+        profiles = [
+            row for row in profiles.values_list(
+                "user_id", "skill_tags", "rating_avg"
+            )
+            if available.get(row[0], True)
+        ]
+
+        # primary address first, then oldest
+        locations = {}
+        for user_id, lat, lng in (
+            scoped(Address.objects.all(), "user_id").filter(
+                user__taaskrprofile__isnull=False,
+                latitude__isnull=False,
+                longitude__isnull=False,
+            )
+            .order_by("user_id", "-is_primary", "id")
+            .values_list("user_id", "latitude", "longitude")
+        ):
+            locations.setdefault(user_id, (float(lat), float(lng)))
+
+        loads = dict(
+            scoped(AssignmentLog.objects.all(), "taaskr_id").filter(
+                status__in=["requested", "accepted"],
+            )
+            .exclude(booking__status__in=CLOSED_BOOKING_STATUSES)
+            .order_by()
+            .values("taaskr_id")
+            .annotate(total=Count("id"))
+            .values_list("taaskr_id", "total")
+        )
+
+        return cls(profiles, locations, loads, max_distance_km)
+
+    @classmethod
+    def for_booking(cls, booking, max_distance_km=None):
+        """Index narrowed to one booking's surroundings (auto_assign)."""
+        address = booking.address
+        if address and address.latitude is not None and address.longitude is not None:
+            return cls.build(
+                max_distance_km,
+                near=(float(address.latitude), float(address.longitude)),
+            )
+        # no coordinates: any skilled taaskr qualifies
+        return cls.build(max_distance_km)
+
+    # ---------------------------
+    # CANDIDATES
+    # ---------------------------
+    def skill_matches(self, service_tokens):
+        ids = set()
+        for token in service_tokens:
+            ids |= self.by_skill.get(token, set())
+        return ids
+
+    def nearby(self, lat, lng, radius_km, tokens):
+        """
+        (taaskr id, distance km) for taaskrs with any of `tokens`
+        within radius_km. Only the surrounding grid cells are scanned.
+        """
+        lat_span = math.ceil(radius_km / KM_PER_DEGREE / self.cell_deg)
+        cos_lat = max(math.cos(math.radians(lat)), 0.01)
+        lng_span = math.ceil(
+            radius_km / (KM_PER_DEGREE * cos_lat) / self.cell_deg
+        )
+        row, col = self._cell(lat, lng)
+        lat, lng = math.radians(lat), math.radians(lng)
+
+        seen = set()
+        for d_row in range(-lat_span, lat_span + 1):
+            for d_col in range(-lng_span, lng_span + 1):
+                cell = self.grid.get((row + d_row, col + d_col))
+                if not cell:
+                    continue
+                for token in tokens:
+                    for user_id in cell.get(token, ()):
+                        if user_id in seen:
+                            continue
+                        seen.add(user_id)
+                        # equirectangular: accurate well past city range
+                        t_lat, t_lng = self.locations[user_id]
+                        x = (t_lng - lng) * math.cos((lat + t_lat) / 2)
+                        distance = math.hypot(x, t_lat - lat) * EARTH_RADIUS_KM
+                        if distance <= radius_km:
+                            yield user_id, distance
+
+
+# --------------------------------------------------
+# SCORING
+# --------------------------------------------------
+def score_candidate(index, user_id, service_tokens, distance_km,
+                    max_distance_km, weights):
+    skill = (
+        len(index.skills[user_id] & service_tokens) / len(service_tokens)
+        if service_tokens else 0.0
+    )
+    proximity = (
+        1.0 - distance_km / max_distance_km
+        if distance_km is not None else 0.0
+    )
+    rating = min(index.rating[user_id] / 5.0, 1.0)
+    load = 1.0 / (1 + index.loads[user_id])
+
+    return (
+        weights["skill"] * skill
+        + weights["distance"] * proximity
+        + weights["rating"] * rating
+        + weights["load"] * load
+    )
+
+
+def rank_candidates(index, booking, service_tokens, exclude=(), limit=None,
+                    max_distance_km=None, weights=None):
+    """
+    Best `limit` (taaskr id, score) pairs for a booking.
+    Needs a skill match; needs to be within range when the booking
+    address has coordinates.
+    """
+    if max_distance_km is None:
+        max_distance_km = settings.MATCHING_MAX_DISTANCE_KM
+    if weights is None:
+        weights = settings.MATCHING_WEIGHTS
+
+    skilled = index.skill_matches(service_tokens)
+    if not skilled:
+        return []
+
+    address = booking.address
+    if address and address.latitude is not None and address.longitude is not None:
+        candidates = index.nearby(
+            float(address.latitude),
+            float(address.longitude),
+            max_distance_km,
+            service_tokens,
+        )
+    else:
+        candidates = ((user_id, None) for user_id in skilled)
+
+    scored = (
+        (
+            score_candidate(
+                index, user_id, service_tokens, distance,
+                max_distance_km, weights,
+            ),
+            user_id,
+        )
+        for user_id, distance in candidates
+        if user_id not in exclude
+    )
+
+    return [
+        (user_id, score)
+        for score, user_id in heapq.nlargest(limit or 1, scored)
+    ]
+
+
+# --------------------------------------------------
+# MATCHING RUN
+# --------------------------------------------------
+def open_bookings():
+    return (
+        Booking.objects
+        .select_related("service__category", "address")
+        .filter(
+            assignment_status__in=OPEN_ASSIGNMENT_STATUSES,
+            assignment_attempts__lt=settings.MATCHING_MAX_ATTEMPTS,
+        )
+        .exclude(status__in=CLOSED_BOOKING_STATUSES)
+        .order_by("scheduled_at")
+    )
+
+
+def match_bookings(bookings, index=None):
+    """
+    Send ranked auto requests for each booking's open slots.
+    Load is bumped in the index as requests go out, so one run
+    doesn't flood the same taaskr across bookings.
+    """
+    bookings = [b for b in bookings if b.open_slots > 0]
+    if not bookings:
+        return {"bookings": 0, "requests": 0, "unmatched": 0, "stale": 0}
+
+    if index is None:
+        index = (
+            TaaskrIndex.for_booking(bookings[0])
+            if len(bookings) == 1 else TaaskrIndex.build()
+        )
+
+    # (booking, taaskr) is unique: skip anyone already asked
+    already_asked = defaultdict(set)
+    for booking_id, taaskr_id in AssignmentLog.objects.filter(
+        booking_id__in=[b.id for b in bookings]
+    ).values_list("booking_id", "taaskr_id"):
+        already_asked[booking_id].add(taaskr_id)
+
+    now = timezone.now()
+    expires_at = now + timezone.timedelta(
+        minutes=settings.MATCHING_REQUEST_EXPIRY_MINUTES
+    )
+
+    plans = []  # (booking, new assignment_status, requests)
+    unmatched = 0
+    for booking in bookings:
+        service = booking.service
+        service_tokens = tokenize(service.name, service.category.name)
+
+        ranked = rank_candidates(
+            index,
+            booking,
+            service_tokens,
+            exclude=already_asked[booking.id],
+            limit=booking.open_slots * settings.MATCHING_REQUESTS_PER_SLOT,
+        )
+
+        if not ranked:
+            unmatched += 1
+            assignment_status = booking.assignment_status
+            if assignment_status != "requested":
+                if booking.accepted_count:
+                    # keep what was accepted; open slots wait for a retry
+                    assignment_status = "partially_assigned"
+                elif booking.assignment_attempts + 1 >= settings.MATCHING_MAX_ATTEMPTS:
+                    assignment_status = "failed"
+                else:
+                    assignment_status = "auto_assign_pending"
+            plans.append((booking, assignment_status, []))
+            continue
+
+        requests = []
+        for taaskr_id, _ in ranked:
+            index.loads[taaskr_id] += 1
+            requests.append(AssignmentLog(
+                booking=booking,
+                taaskr_id=taaskr_id,
+                method="auto",
+                status="requested",
+                expires_at=expires_at,
+            ))
+        plans.append((booking, "requested", requests))
+
+    # Ranking took a while: write only bookings still in the state they
+    # were ranked in (not claimed full, cancelled, assigned by hand or
+    # matched by another run meanwhile). Bookings in id order, before
+    # any AssignmentLog row: the lock order claim_assignment uses.
+    logs, stale = [], 0
+    with transaction.atomic():
+        for booking, assignment_status, requests in sorted(
+            plans, key=lambda plan: plan[0].id
+        ):
+            updated = (
+                Booking.objects.filter(
+                    pk=booking.pk,
+                    assignment_status=booking.assignment_status,
+                    accepted_count__lt=F("required_taaskrs"),
+                )
+                .exclude(status__in=CLOSED_BOOKING_STATUSES)
+                .update(
+                    assignment_status=assignment_status,
+                    assignment_attempts=F("assignment_attempts") + 1,
+                )
+            )
+            if not updated:
+                stale += 1
+                continue
+
+            booking.assignment_status = assignment_status
+            booking.assignment_attempts += 1
+            logs.extend(requests)
+
+        AssignmentLog.objects.bulk_create(
+            logs, batch_size=1000, ignore_conflicts=True
+        )
+
+    return {
+        "bookings": len(bookings),
+        "requests": len(logs),
+        "unmatched": unmatched,
+        "stale": stale,
+    }
+
+
+def run_auto_matching(limit=None):
+    bookings = open_bookings()
+    if limit:
+        bookings = bookings[:limit]
+    return match_bookings(list(bookings))
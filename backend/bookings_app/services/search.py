@@ -0,0 +1,50 @@
+# bookings_app/services/search.py
+
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Concat, Lower
+
+from bookings_app.models import Booking, QuoteRequest
+from services_app.models import Service
+from users_app.models import User
+
+
+# --------------------------------------------------
+# SEARCH DOCUMENTS (computed in SQL, one UPDATE per refresh)
+# --------------------------------------------------
+def _related(model, field, ref):
+    return Coalesce(
+        Subquery(model.objects.filter(pk=OuterRef(ref)).values(field)[:1]),
+        Value(""),
+    )
+
+
+def booking_search_expression():
+    return Lower(Concat(
+        "booking_code",
+        Value(" "),
+        _related(User, "full_name", "customer_id"),
+        Value(" "),
+        _related(Service, "name", "service_id"),
+    ))
+
+
+def quote_search_expression():
+    return Lower(Concat(
+        "quote_code",
+        Value(" "),
+        _related(User, "full_name", "customer_id"),
+        Value(" "),
+        "service_name",
+    ))
+
+
+def refresh_booking_search(queryset=None):
+    if queryset is None:
+        queryset = Booking.objects.all()
+    return queryset.update(search_text=booking_search_expression())
+
+
+def refresh_quote_search(queryset=None):
+    if queryset is None:
+        queryset = QuoteRequest.objects.all()
+    return queryset.update(search_text=quote_search_expression())
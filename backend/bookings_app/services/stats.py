@@ -0,0 +1,194 @@
+# bookings_app/services/stats.py
+
+from collections import Counter, defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from bookings_app.models import Booking, BookingDailyStats
+
+
+# --------------------------------------------------
+# REBUILD ROLLUP ROWS
+# --------------------------------------------------
+def _day_bounds(first_day, last_day):
+    tz = timezone.get_current_timezone()
+    return (
+        datetime.combine(first_day, time.min, tzinfo=tz),
+        datetime.combine(last_day + timedelta(days=1), time.min, tzinfo=tz),
+        tz,
+    )
+
+
+def refresh_daily_stats(first_day, last_day=None, service_id=None):
+    """
+    Recompute the rollup for [first_day, last_day] (optionally one
+    service) with a single GROUP BY over the schedule index, then
+    upsert the rows and drop the ones whose bookings are gone.
+    Returns the number of rollup rows written.
+    """
+    last_day = last_day or first_day
+    start, end, tz = _day_bounds(first_day, last_day)
+
+    bookings = Booking.objects.filter(
+        scheduled_at__gte=start, scheduled_at__lt=end
+    )
+    if service_id is not None:
+        bookings = bookings.filter(service_id=service_id)
+
+    groups = (
+        bookings
+        .annotate(day=TruncDate("scheduled_at", tzinfo=tz))
+        .values(
+            "day",
+            "service_id",
+            "service__category_id",
+            "status",
+            "payment_status",
+            "assignment_status",
+        )
+        .annotate(
+            total=Count("id"),
+            booked=Sum("total_price", filter=~Q(status="cancelled")),
+            collected=Sum("paid_amount"),
+        )
+        .order_by()
+    )
+
+    rows = {}
+    for group in groups:
+        key = (group["day"], group["service_id"])
+        row = rows.get(key)
+        if row is None:
+            row = rows[key] = BookingDailyStats(
+                day=group["day"],
+                service_id=group["service_id"],
+                category_id=group["service__category_id"],
+                status_counts=Counter(),
+                payment_status_counts=Counter(),
+                assignment_status_counts=Counter(),
+                booked_value=Decimal(0),
+                collected=Decimal(0),
+            )
+
+        total = group["total"]
+        row.bookings += total
+        row.status_counts[group["status"]] += total
+        row.payment_status_counts[group["payment_status"]] += total
+        row.assignment_status_counts[group["assignment_status"]] += total
+        row.booked_value += group["booked"] or 0
+        row.collected += group["collected"] or 0
+
+    # rows no booking maps to anymore (moved / deleted / cancelled out)
+    kept = defaultdict(set)
+    for day, row_service_id in rows:
+        kept[day].add(row_service_id)
+
+    vanished = Q()
+    day = first_day
+    while day <= last_day:
+        if kept[day]:
+            vanished |= Q(day=day) & ~Q(service_id__in=kept[day])
+        else:
+            vanished |= Q(day=day)
+        day += timedelta(days=1)
+
+    stale = BookingDailyStats.objects.filter(vanished)
+    if service_id is not None:
+        stale = stale.filter(service_id=service_id)
+
+    # upsert, not delete + insert: concurrent refreshes of the same
+    # (day, service) (signal tasks, the beat refresh) used to collide
+    # on the unique key
+    with transaction.atomic():
+        stale.delete()
+        BookingDailyStats.objects.bulk_create(
+            # key order: concurrent upserts lock rows in the same order
+            [rows[key] for key in sorted(rows)],
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["day", "service"],
+            update_fields=[
+                "category",
+                "bookings",
+                "status_counts",
+                "payment_status_counts",
+                "assignment_status_counts",
+                "booked_value",
+                "collected",
+                "refreshed_at",
+            ],
+        )
+
+    return len(rows)
+
+
+def booking_day(booking):
+    return timezone.localdate(booking.scheduled_at)
+
+
+def refresh_recent_stats():
+    """
+    Periodic safety net for changes made with queryset.update()
+    (no signals): rebuild the window where bookings still move.
+    """
+    today = timezone.localdate()
+    return refresh_daily_stats(
+        today - timedelta(days=settings.STATS_REFRESH_DAYS_BACK),
+        today + timedelta(days=settings.STATS_REFRESH_DAYS_AHEAD),
+    )
+
+
+# --------------------------------------------------
+# DASHBOARD TILES (reads only the rollup)
+# --------------------------------------------------
+def dashboard_stats(first_day, last_day, service_id=None, category_id=None):
+    rows = BookingDailyStats.objects.filter(
+        day__gte=first_day, day__lte=last_day
+    )
+    if service_id:
+        rows = rows.filter(service_id=service_id)
+    if category_id:
+        rows = rows.filter(category_id=category_id)
+
+    by_status = Counter()
+    by_payment_status = Counter()
+    by_assignment_status = Counter()
+    days = {}
+    totals = {"bookings": 0, "booked_value": Decimal(0), "collected": Decimal(0)}
+
+    for row in rows.order_by("day").values(
+        "day",
+        "bookings",
+        "status_counts",
+        "payment_status_counts",
+        "assignment_status_counts",
+        "booked_value",
+        "collected",
+    ):
+        by_status.update(row["status_counts"])
+        by_payment_status.update(row["payment_status_counts"])
+        by_assignment_status.update(row["assignment_status_counts"])
+
+        day = days.setdefault(row["day"], {
+            "date": row["day"],
+            "bookings": 0,
+            "booked_value": Decimal(0),
+            "collected": Decimal(0),
+        })
+        for field in totals:
+            day[field] += row[field]
+            totals[field] += row[field]
+
+    return {
+        **totals,
+        "by_status": dict(by_status),
+        "by_payment_status": dict(by_payment_status),
+        "by_assignment_status": dict(by_assignment_status),
+        "days": list(days.values()),
+    }
@@ -1,9 +1,158 @@
-from django.db.models.signals import post_delete
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
 from django.dispatch import receiver
-from bookings_app.models import QuoteImage
+from bookings_app.models import Booking, QuoteImage, QuoteRequest, AssignmentLog
+from bookings_app.serializers.utils.assignment_utils import (
+    decrement_accepted_count,
+)
+from bookings_app.services.search import (
+    refresh_booking_search,
+    refresh_quote_search,
+)
+from bookings_app.services.stats import booking_day
+from bookings_app.tasks import refresh_booking_stats, refresh_service_search
+from services_app.models import Service
+from services_app.utils.image_derivatives import (
+    queue_image_derivatives,
+    release_image,
+)
+from users_app.models import User
 
 
 @receiver(post_delete, sender=QuoteImage)
 def delete_quote_image_file(sender, instance, **kwargs):
-    if instance.image:
-        instance.image.delete(save=False)
+    # the file may be shared with other quote images (same upload):
+    # only the last reference removes it, checked once the delete commits
+    release_image(
+        QuoteImage, "image", instance.image.name, instance.image_variants
+    )
+
+
+@receiver(post_save, sender=QuoteImage)
+def queue_quote_image(sender, instance, **kwargs):
+    queue_image_derivatives(instance, "image")
+
+
+@receiver(post_delete, sender=AssignmentLog)
+def release_accepted_slot(sender, instance, **kwargs):
+    if instance.status == "accepted":
+        decrement_accepted_count(instance.booking_id)
+
+
+# ==========================
+# SEARCH DOCUMENTS
+# ==========================
+# queryset.update() / bulk_create skip these, call the
+# refresh_*_search helpers explicitly after them.
+def _touches(update_fields, fields):
+    return update_fields is None or bool(set(update_fields) & fields)
+
+
+def _booking_search_key(booking):
+    return booking.booking_code, booking.customer_id, booking.service_id
+
+
+@receiver(post_init, sender=Booking)
+def remember_search_key(sender, instance, **kwargs):
+    # a plain save() only re-indexes when one of these changed
+    loaded = instance.__dict__
+    if instance.pk and all(
+        field in loaded for field in ("booking_code", "customer_id", "service_id")
+    ):
+        instance._search_key = _booking_search_key(instance)
+    else:
+        instance._search_key = None
+
+
+@receiver(post_save, sender=Booking)
+def index_booking(sender, instance, created, update_fields, **kwargs):
+    key = _booking_search_key(instance)
+    if update_fields is None:
+        changed = created or instance._search_key != key
+    else:
+        changed = _touches(update_fields, {"booking_code", "customer", "service"})
+
+    if changed:
+        refresh_booking_search(Booking.objects.filter(pk=instance.pk))
+    instance._search_key = key
+
+
+@receiver(post_save, sender=QuoteRequest)
+def index_quote_request(sender, instance, created, update_fields, **kwargs):
+    if created or _touches(
+        update_fields, {"quote_code", "customer", "service_name"}
+    ):
+        refresh_quote_search(QuoteRequest.objects.filter(pk=instance.pk))
+
+
+@receiver(post_init, sender=User)
+def remember_customer_name(sender, instance, **kwargs):
+    # a plain save() (profile edit, availability toggle) only re-indexes
+    # the customer's bookings / quotes when the name changed
+    loaded = instance.__dict__
+    if instance.pk and "full_name" in loaded:
+        instance._search_name = instance.full_name
+    else:
+        instance._search_name = None
+
+
+@receiver(post_save, sender=User)
+def reindex_customer(sender, instance, created, update_fields, **kwargs):
+    if update_fields is None:
+        changed = not created and instance._search_name != instance.full_name
+    else:
+        changed = not created and _touches(update_fields, {"full_name"})
+    instance._search_name = instance.full_name
+
+    if changed:
+        refresh_booking_search(Booking.objects.filter(customer=instance))
+        refresh_quote_search(QuoteRequest.objects.filter(customer=instance))
+
+
+@receiver(post_save, sender=Service)
+def reindex_service(sender, instance, created, update_fields, **kwargs):
+    if created or not _touches(update_fields, {"name"}):
+        return
+    # can be a lot of bookings: do it off the request
+    service_id = instance.pk
+    transaction.on_commit(lambda: refresh_service_search.delay(service_id))
+
+
+# ==========================
+# DASHBOARD ROLLUP
+# ==========================
+# (day, service) rows the booking counts towards; remembered on load so
+# a reschedule / service change also refreshes the row it left.
+def _stats_key(booking):
+    if booking.scheduled_at is None or booking.service_id is None:
+        return None
+    return booking_day(booking).isoformat(), booking.service_id
+
+
+def _refresh_stats(*keys):
+    for key in set(filter(None, keys)):
+        transaction.on_commit(
+            lambda key=key: refresh_booking_stats.delay(*key)
+        )
+
+
+@receiver(post_init, sender=Booking)
+def remember_stats_key(sender, instance, **kwargs):
+    # deferred fields (.only()) would cost a query each: skip those
+    loaded = instance.__dict__
+    if instance.pk and "scheduled_at" in loaded and "service_id" in loaded:
+        instance._stats_key = _stats_key(instance)
+    else:
+        instance._stats_key = None
+
+
+@receiver(post_save, sender=Booking)
+def update_booking_stats(sender, instance, **kwargs):
+    key = _stats_key(instance)
+    _refresh_stats(instance._stats_key, key)
+    instance._stats_key = key
+
+
+@receiver(post_delete, sender=Booking)
+def remove_booking_stats(sender, instance, **kwargs):
+    _refresh_stats(instance._stats_key, _stats_key(instance))
@@ -0,0 +1,148 @@
+# bookings_app/tasks.py
+
+from datetime import date
+
+from celery import chain, shared_task
+
+from bookings_app.models import Booking
+from bookings_app.services.broadcast import (
+    fail_broadcast,
+    plan_broadcast,
+    send_broadcast_chunk,
+)
+from bookings_app.services.expiry import sweep_expired_requests
+from bookings_app.services.matching import match_bookings, run_auto_matching
+from bookings_app.services.search import refresh_booking_search
+from bookings_app.services.stats import refresh_daily_stats, refresh_recent_stats
+
+
+@shared_task
+def auto_match_open_bookings(limit=None):
+    """
+    Send ranked auto requests for every booking still waiting on taaskrs.
+    """
+    return run_auto_matching(limit)
+
+
+@shared_task
+def auto_match_bookings(booking_ids):
+    bookings = Booking.objects.select_related(
+        "service__category", "address"
+    ).filter(
+        id__in=booking_ids,
+        assignment_status__in=["auto_assign_pending", "partially_assigned"],
+    )
+    return match_bookings(list(bookings))
+
+
+@shared_task
+def expire_assignment_requests():
+    """
+    Beat task: move overdue requests out of "requested" and retry
+    bookings that were left without any live request.
+    """
+    result = sweep_expired_requests()
+
+    if result["retry"]:
+        auto_match_bookings.delay(result["retry"])
+
+    return {"expired": result["expired"], "retried": len(result["retry"])}
+
+
+# --------------------------------------------------
+# BROADCAST FAN-OUT
+# --------------------------------------------------
+@shared_task
+def run_broadcast(broadcast_id):
+    """
+    Pick eligible taaskrs, then send them chunk by chunk.
+    Chunks run one after another so a filled / cancelled broadcast
+    stops at the next chunk boundary.
+    """
+    try:
+        chunks = plan_broadcast(broadcast_id)
+    except Exception:
+        fail_broadcast(broadcast_id)
+        raise
+
+    if chunks:
+        chain(
+            broadcast_chunk.si(broadcast_id, chunk) for chunk in chunks
+        ).apply_async()
+    return len(chunks)
+
+
+@shared_task
+def broadcast_chunk(broadcast_id, taaskr_ids):
+    # a raising chunk stops the chain; don't leave the broadcast running
+    try:
+        sent = send_broadcast_chunk(broadcast_id, taaskr_ids)
+    except Exception:
+        fail_broadcast(broadcast_id)
+        raise
+
+    if sent:
+        notify_assignment_requests.delay(broadcast_id, sent)
+    return len(sent)
+
+
+@shared_task
+def notify_assignment_requests(broadcast_id, taaskr_ids):
+    from notifications_app.models import Notification
+    from bookings_app.models import AssignmentBroadcast
+
+    booking = AssignmentBroadcast.objects.select_related(
+        "booking__service"
+    ).get(pk=broadcast_id).booking
+
+    message = (
+        f"New job request {booking.booking_code}: {booking.service.name} "
+        f"on {booking.scheduled_at:%d %b, %H:%M}"
+    )
+    Notification.objects.bulk_create(
+        [
+            Notification(
+                user_id=taaskr_id,
+                message=message,
+                type="assignment_request",
+            )
+            for taaskr_id in taaskr_ids
+        ],
+        batch_size=1000,
+    )
+    return len(taaskr_ids)
+
+
+# --------------------------------------------------
+# SEARCH DOCUMENTS
+# --------------------------------------------------
+@shared_task
+def refresh_service_search(service_id, batch_size=5000):
+    """Service renamed: rewrite search_text on its bookings in batches."""
+    last_id, total = 0, 0
+    while True:
+        ids = list(
+            Booking.objects.filter(service_id=service_id, id__gt=last_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return total
+        total += refresh_booking_search(Booking.objects.filter(id__in=ids))
+        last_id = ids[-1]
+
+
+# --------------------------------------------------
+# DASHBOARD ROLLUP
+# --------------------------------------------------
+@shared_task
+def refresh_booking_stats(day, service_id):
+    """One (day, service) rollup row, queued by booking signals."""
+    return refresh_daily_stats(
+        date.fromisoformat(day), service_id=service_id
+    )
+
+
+@shared_task
+def refresh_recent_booking_stats():
+    return refresh_recent_stats()
@@ -0,0 +1,41 @@
+# bookings_app/tests/factories.py
+
+from datetime import timedelta
+
+from django.utils import timezone
+
+from bookings_app.models import AssignmentLog, Booking
+from users_app.tests.factories import make_address, make_user
+
+
+def make_booking(service, customer=None, **fields):
+    """Booking for tomorrow (a new customer unless given)."""
+    fields.setdefault("scheduled_at", timezone.now() + timedelta(days=1))
+    fields.setdefault("total_price", 100)
+    return Booking.objects.create(
+        customer=customer or make_user(), service=service, **fields
+    )
+
+
+def make_bookings(count, service, taaskrs=(), **fields):
+    """
+    `count` bookings, each with its own customer and address, `taaskrs`
+    accepted and one slot still open.
+    """
+    bookings = []
+    for i in range(count):
+        customer = make_user(full_name=f"Customer {i}")
+        booking = make_booking(
+            service, customer,
+            address=make_address(customer),
+            required_taaskrs=len(taaskrs) + 1,
+            accepted_count=len(taaskrs),
+            **fields,
+        )
+        for taaskr in taaskrs:
+            AssignmentLog.objects.create(
+                booking=booking, taaskr=taaskr, assigned_by=customer,
+                status="accepted",
+            )
+        bookings.append(booking)
+    return bookings
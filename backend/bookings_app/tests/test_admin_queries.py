@@ -0,0 +1,96 @@
+# bookings_app/tests/test_admin_queries.py
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from bookings_app.models import AssignmentLog
+from bookings_app.tests.factories import make_bookings
+from services_app.tests.factories import make_service
+from users_app.tests.factories import make_admin, make_user
+from users_app.utils.rbac import bump_rbac_version
+
+
+# ==========================
+# ADMIN BOOKING SERIALIZERS
+# ==========================
+class AdminBookingQueryCountTests(TestCase):
+    """
+    The admin booking list / detail / needy endpoints run a fixed
+    number of queries however many bookings or assignments they show:
+    customer / service / address are joined, accepted assignments are
+    prefetched and accepted_count is a column.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_admin("ops@example.com", ["booking.view"])
+        cls.service = make_service()
+        cls.taaskrs = [make_user(full_name=f"T{i}") for i in range(3)]
+
+    def setUp(self):
+        bump_rbac_version()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        # warm the admin's RBAC cache: one query, not under test here
+        self.client.get("/api/bookings/admin/needy-assignments/")
+
+    def assertQueriesFlat(self, url, queries, add_rows):
+        with self.assertNumQueries(queries):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+
+        add_rows()
+        with self.assertNumQueries(queries):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response
+
+    def test_list(self):
+        # COUNT + page rows
+        make_bookings(2, self.service, self.taaskrs[:1])
+        response = self.assertQueriesFlat(
+            "/api/bookings/admin/bookings/", 2,
+            lambda: make_bookings(5, self.service, self.taaskrs),
+        )
+        self.assertEqual(response.json()["count"], 7)
+        self.assertEqual(response.json()["results"][0]["accepted_taaskrs"], 3)
+
+    def test_list_cursor(self):
+        # keyset page only, no COUNT
+        make_bookings(2, self.service, self.taaskrs[:1])
+        response = self.assertQueriesFlat(
+            "/api/bookings/admin/bookings/?cursor=", 1,
+            lambda: make_bookings(5, self.service, self.taaskrs),
+        )
+        self.assertEqual(len(response.json()["results"]), 7)
+
+    def test_detail(self):
+        # booking + accepted assignments + review + warranty
+        booking = make_bookings(1, self.service)[0]
+
+        def accept_more():
+            for taaskr in self.taaskrs:
+                AssignmentLog.objects.create(
+                    booking=booking, taaskr=taaskr, status="accepted",
+                    assigned_by=self.admin,
+                )
+
+        response = self.assertQueriesFlat(
+            f"/api/bookings/admin/bookings/{booking.id}/", 4, accept_more,
+        )
+        assigned = response.json()["assigned_taaskrs"]
+        self.assertEqual(len(assigned), 3)
+        self.assertEqual(assigned[0]["assigned_by"], "Admin")
+
+    def test_needy(self):
+        # COUNT + page rows
+        make_bookings(2, self.service, assignment_status="requested")
+        response = self.assertQueriesFlat(
+            "/api/bookings/admin/needy-assignments/", 2,
+            lambda: make_bookings(
+                5, self.service, self.taaskrs[:1],
+                assignment_status="partially_assigned",
+            ),
+        )
+        self.assertEqual(response.json()["count"], 7)
+        self.assertEqual(response.json()["results"][0]["city"], "Pune")
@@ -0,0 +1,55 @@
+# bookings_app/tests/test_admin_radius.py
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from bookings_app.models import AssignmentBroadcast
+from bookings_app.tests.factories import make_booking
+from services_app.tests.factories import make_service
+from users_app.tests.factories import make_address, make_admin, make_user
+from users_app.utils.rbac import bump_rbac_version
+
+
+class AdminRadiusValidationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_admin(
+            "dispatch@example.com",
+            ["booking.view", "booking.assign", "taaskr.view"],
+        )
+        customer = make_user()
+        cls.booking = make_booking(
+            make_service(), customer,
+            address=make_address(customer, at=(18.5204, 73.8567)),
+        )
+
+    def setUp(self):
+        bump_rbac_version()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def nearby(self, radius_km):
+        return self.client.get(
+            f"/api/bookings/admin/bookings/{self.booking.id}/nearby_taaskrs/",
+            {"radius_km": radius_km},
+        )
+
+    def broadcast(self, radius_km):
+        return self.client.post(
+            f"/api/bookings/admin/bookings/{self.booking.id}/broadcast/",
+            {"radius_km": radius_km},
+            format="json",
+        )
+
+    def test_nearby_rejects_non_finite_radius(self):
+        for value in ("nan", "inf", "-inf", "Infinity"):
+            with self.subTest(value=value):
+                self.assertEqual(self.nearby(value).status_code, 400)
+        self.assertEqual(self.nearby("5").status_code, 200)
+
+    def test_broadcast_rejects_non_finite_radius(self):
+        for value in ("nan", "inf", "-Infinity"):
+            with self.subTest(value=value):
+                self.assertEqual(self.broadcast(value).status_code, 400)
+        self.assertFalse(AssignmentBroadcast.objects.exists())
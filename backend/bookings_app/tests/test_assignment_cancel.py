@@ -0,0 +1,71 @@
+# bookings_app/tests/test_assignment_cancel.py
+
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from bookings_app.models import AssignmentLog
+from bookings_app.tests.factories import make_booking
+from bookings_app.views.admin.assignment_viewset import AdminAssignmentViewSet
+from services_app.tests.factories import make_service
+from users_app.tests.factories import make_admin, make_user
+from users_app.utils.rbac import bump_rbac_version
+
+
+class CancelRequestTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_admin("dispatch@example.com", ["booking.assign"])
+        cls.booking = make_booking(make_service())
+        cls.taaskr = make_user()
+
+    def setUp(self):
+        bump_rbac_version()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        self.log = AssignmentLog.objects.create(
+            booking=self.booking, taaskr=self.taaskr, status="requested",
+            expires_at=timezone.now() + timedelta(hours=1),
+        )
+
+    def cancel(self):
+        return self.client.patch(
+            f"/api/bookings/admin/assignment-logs/{self.log.id}/cancel/"
+        )
+
+    def status_of_log(self):
+        self.log.refresh_from_db()
+        return self.log.status
+
+    def test_cancels_pending_request(self):
+        response = self.cancel()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.status_of_log(), "cancelled")
+
+    def test_expired_request_is_not_cancelled(self):
+        AssignmentLog.objects.filter(pk=self.log.pk).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        self.assertEqual(self.cancel().status_code, 400)
+        self.assertEqual(self.status_of_log(), "requested")
+
+    def test_claim_between_read_and_cancel_wins(self):
+        stale = AssignmentLog.objects.get(pk=self.log.pk)
+
+        def read_then_claim(view):
+            # the taaskr's accept commits right after the view read the row
+            AssignmentLog.objects.filter(pk=stale.pk).update(status="accepted")
+            return stale
+
+        with mock.patch.object(
+            AdminAssignmentViewSet, "get_object", autospec=True,
+            side_effect=read_then_claim,
+        ):
+            response = self.cancel()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.status_of_log(), "accepted")
@@ -0,0 +1,107 @@
+# bookings_app/tests/test_broadcast.py
+
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from bookings_app.models import AssignmentBroadcast, AssignmentLog
+from bookings_app.services.broadcast import (
+    create_broadcast,
+    eligible_taaskr_ids,
+    plan_broadcast,
+    send_broadcast_chunk,
+)
+from bookings_app.tasks import broadcast_chunk
+from bookings_app.tests.factories import make_booking
+from services_app.tests.factories import make_service
+from taaskr_app.models import TaaskrProfile
+from users_app.tests.factories import make_address, make_admin, make_user
+from users_app.utils.rbac import bump_rbac_version
+
+
+PUNE = (18.5204, 73.8567)
+MUMBAI = (19.0760, 72.8777)
+
+
+class BroadcastTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_admin("dispatch@example.com", ["booking.assign"])
+        customer = make_user()
+        cls.booking = make_booking(
+            make_service(), customer, address=make_address(customer, at=PUNE)
+        )
+
+        # 3 cleaners in Pune, 1 in Mumbai (~120 km away)
+        cls.taaskrs = []
+        for i, at in enumerate([PUNE] * 3 + [MUMBAI]):
+            taaskr = make_user()
+            TaaskrProfile.objects.create(
+                user=taaskr, skill_tags=["Deep Cleaning"], verified=True,
+                rating_avg=5 - i,
+            )
+            make_address(taaskr, at=at)
+            cls.taaskrs.append(taaskr)
+        cls.pune_ids = [t.id for t in cls.taaskrs[:3]]
+
+    def test_radius_must_be_positive(self):
+        bump_rbac_version()
+        client = APIClient()
+        client.force_authenticate(self.admin)
+
+        for value in (0, -5, "0"):
+            with self.subTest(value=value):
+                response = client.post(
+                    f"/api/bookings/admin/bookings/{self.booking.id}/broadcast/",
+                    {"radius_km": value},
+                    format="json",
+                )
+                self.assertEqual(response.status_code, 400)
+        self.assertFalse(AssignmentBroadcast.objects.exists())
+
+    def test_radius_applies_whenever_given(self):
+        self.assertEqual(eligible_taaskr_ids(self.booking, 25), self.pune_ids)
+        self.assertEqual(
+            eligible_taaskr_ids(self.booking, None),
+            [t.id for t in self.taaskrs],
+        )
+
+    def test_already_asked_taaskrs_are_not_eligible(self):
+        for taaskr, status in zip(self.taaskrs, ["rejected", "expired"]):
+            AssignmentLog.objects.create(
+                booking=self.booking, taaskr=taaskr, status=status
+            )
+        self.assertEqual(eligible_taaskr_ids(self.booking, 25), self.pune_ids[2:])
+
+    def test_chunk_does_not_revive_rejections(self):
+        broadcast = create_broadcast(self.booking, self.admin, 25)
+        chunks = plan_broadcast(broadcast.id)
+        self.assertEqual(chunks, [self.pune_ids])
+
+        # said no to another request after the plan was made
+        AssignmentLog.objects.create(
+            booking=self.booking, taaskr=self.taaskrs[0], status="rejected"
+        )
+        sent = send_broadcast_chunk(broadcast.id, chunks[0])
+
+        self.assertEqual(sent, self.pune_ids[1:])
+        self.assertEqual(
+            AssignmentLog.objects.get(taaskr=self.taaskrs[0]).status, "rejected"
+        )
+
+    def test_raising_chunk_marks_broadcast_failed(self):
+        broadcast = create_broadcast(self.booking, self.admin, 25)
+        chunks = plan_broadcast(broadcast.id)
+
+        with mock.patch(
+            "bookings_app.tasks.send_broadcast_chunk",
+            side_effect=RuntimeError("boom"),
+        ):
+            with self.assertRaises(RuntimeError):
+                broadcast_chunk(broadcast.id, chunks[0])
+
+        broadcast.refresh_from_db()
+        self.assertEqual(broadcast.status, "failed")
+        self.assertIsNotNone(broadcast.finished_at)
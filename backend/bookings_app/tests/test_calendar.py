@@ -0,0 +1,79 @@
+# bookings_app/tests/test_calendar.py
+
+from datetime import datetime, timezone as dt_timezone
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from bookings_app.tests.factories import make_booking
+from services_app.tests.factories import make_service
+from users_app.tests.factories import make_admin, make_user
+from users_app.utils.rbac import bump_rbac_version
+
+
+CALENDAR_URL = "/api/bookings/admin/calendar/"
+
+
+class CalendarTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_admin("calendar@example.com", ["booking.view"])
+        cls.customer = make_user(full_name="Asha")
+        cls.booking = make_booking(
+            make_service(), cls.customer,
+            scheduled_at=datetime(2026, 3, 4, 9, 30, 15, 123456, dt_timezone.utc),
+            required_taaskrs=2,
+            accepted_count=1,
+        )
+
+    def setUp(self):
+        bump_rbac_version()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def expected(self):
+        return {
+            "id": self.booking.id,
+            "booking_code": self.booking.booking_code,
+            "scheduled_at": "2026-03-04T09:30:15.123456Z",  # DRF format
+            "service_name": "Deep clean",
+            "status": self.booking.status,
+            "assignment_status": self.booking.assignment_status,
+            "customer_name": "Asha",
+            "priority": self.booking.priority,
+            "required_taaskrs": 2,
+            "accepted_taaskr_count": 1,
+            "is_fully_assigned": False,
+            "urgency_level": "medium",
+        }
+
+    def test_calendar_range(self):
+        self.client.get(CALENDAR_URL)  # warm the RBAC cache
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                f"{CALENDAR_URL}calendar/",
+                {"start_date": "2026-03-01", "end_date": "2026-03-07"},
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [self.expected()])
+
+        response = self.client.get(
+            f"{CALENDAR_URL}calendar/",
+            {"start_date": "2026-03-05", "end_date": "2026-03-07"},
+        )
+        self.assertEqual(response.json(), [])
+
+    def test_list_and_retrieve_render_the_same_rows(self):
+        self.assertEqual(self.client.get(CALENDAR_URL).json(), [self.expected()])
+        self.assertEqual(
+            self.client.get(f"{CALENDAR_URL}{self.booking.id}/").json(),
+            self.expected(),
+        )
+
+    def test_customer_is_forbidden(self):
+        self.client.force_authenticate(self.customer)
+        for url in (CALENDAR_URL, f"{CALENDAR_URL}{self.booking.id}/",
+                    f"{CALENDAR_URL}calendar/?start_date=2026-03-01&end_date=2026-03-07"):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 403)
@@ -0,0 +1,126 @@
+# bookings_app/tests/test_claim_concurrency.py
+#
+# Real concurrent transactions (TransactionTestCase), so this needs
+# Postgres. CLAIM_STRESS_THREADS / CLAIM_STRESS_CONNECTIONS env vars
+# resize the run; connections stay below Postgres' default
+# max_connections (100).
+
+import os
+import threading
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from bookings_app.models import AssignmentLog
+from bookings_app.serializers.utils.assignment_utils import (
+    CLAIM_ACCEPTED,
+    CLAIM_FULL,
+    CLAIM_NOT_PENDING,
+    claim_assignment,
+    send_assignment_requests,
+)
+from bookings_app.tests.factories import make_booking
+from services_app.tests.factories import make_service
+from users_app.models import User
+
+
+STRESS_THREADS = int(os.getenv("CLAIM_STRESS_THREADS", "200"))
+STRESS_CONNECTIONS = int(os.getenv("CLAIM_STRESS_CONNECTIONS", "80"))
+REQUIRED_TAASKRS = 5
+SENDERS = 20
+
+
+class ConcurrentAcceptTests(TransactionTestCase):
+    """
+    STRESS_THREADS taaskrs accept the same booking at once while
+    admins keep re-requesting taaskrs for it: exactly
+    REQUIRED_TAASKRS accepts win, and no transaction deadlocks.
+    """
+
+    def setUp(self):
+        now = timezone.now()
+        self.booking = make_booking(
+            make_service(), required_taaskrs=REQUIRED_TAASKRS
+        )
+
+        taaskrs = User.objects.bulk_create(
+            User(email=f"taaskr{i}@example.com")
+            for i in range(STRESS_THREADS + SENDERS)
+        )
+        self.claimers = taaskrs[:STRESS_THREADS]
+        self.late = taaskrs[STRESS_THREADS:]
+
+        self.logs = AssignmentLog.objects.bulk_create(
+            AssignmentLog(
+                booking=self.booking,
+                taaskr=taaskr,
+                status="requested",
+                expires_at=now + timedelta(hours=1),
+            )
+            for taaskr in self.claimers
+        )
+
+    def run_concurrently(self, jobs):
+        start = threading.Barrier(len(jobs))
+        slots = threading.BoundedSemaphore(STRESS_CONNECTIONS)
+        results, errors = [None] * len(jobs), []
+
+        def worker(index, job):
+            start.wait()
+            with slots:
+                try:
+                    results[index] = job()
+                except Exception as exc:
+                    errors.append(exc)
+                finally:
+                    connection.close()
+
+        threads = [
+            threading.Thread(target=worker, args=(index, job))
+            for index, job in enumerate(jobs)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_concurrent_accepts(self):
+        booking_id = self.booking.id
+
+        jobs = [
+            lambda log=log: claim_assignment(log)
+            for log in self.logs
+        ]
+        # each send locks a live claimer row and inserts a new request,
+        # touching the booking row the winning claim holds
+        jobs += [
+            lambda i=i: send_assignment_requests([
+                (booking_id, self.claimers[i].id),
+                (booking_id, self.late[i].id),
+            ])
+            for i in range(SENDERS)
+        ]
+
+        results, errors = self.run_concurrently(jobs)
+
+        self.assertEqual(errors, [])
+        claims = results[:STRESS_THREADS]
+        self.assertEqual(claims.count(CLAIM_ACCEPTED), REQUIRED_TAASKRS)
+        self.assertEqual(
+            claims.count(CLAIM_FULL) + claims.count(CLAIM_NOT_PENDING),
+            STRESS_THREADS - REQUIRED_TAASKRS,
+        )
+
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.accepted_count, REQUIRED_TAASKRS)
+        self.assertEqual(self.booking.assignment_status, "assigned")
+        self.assertEqual(self.booking.status, "confirmed")
+        self.assertEqual(
+            AssignmentLog.objects.filter(
+                booking=self.booking, status="accepted"
+            ).count(),
+            REQUIRED_TAASKRS,
+        )
@@ -0,0 +1,69 @@
+# bookings_app/tests/test_expiry.py
+
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from bookings_app.models import AssignmentLog
+from bookings_app.services.expiry import sweep_expired_requests
+from bookings_app.tests.factories import make_booking
+from services_app.tests.factories import make_service
+from users_app.tests.factories import make_user
+
+
+@override_settings(MATCHING_MAX_ATTEMPTS=3)
+class ExpirySweepTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = make_service()
+        cls.taaskrs = [make_user() for _ in range(3)]
+
+    def make_booking(self, accepted=0, attempts=0):
+        """Two slots, `accepted` of them taken, one overdue request."""
+        past = timezone.now() - timedelta(minutes=1)
+        booking = make_booking(
+            self.service,
+            required_taaskrs=2,
+            accepted_count=accepted,
+            assignment_status="requested",
+            assignment_attempts=attempts,
+        )
+        for taaskr in self.taaskrs[:accepted]:
+            AssignmentLog.objects.create(
+                booking=booking, taaskr=taaskr, status="accepted"
+            )
+        AssignmentLog.objects.create(
+            booking=booking, taaskr=self.taaskrs[2],
+            status="requested", expires_at=past,
+        )
+        return booking
+
+    def status_of(self, booking):
+        booking.refresh_from_db()
+        return booking.assignment_status
+
+    def test_unaccepted_booking_goes_back_to_auto_assign(self):
+        booking = self.make_booking()
+        result = sweep_expired_requests()
+
+        self.assertEqual(result["expired"], 1)
+        self.assertEqual(result["retry"], [booking.id])
+        self.assertEqual(self.status_of(booking), "auto_assign_pending")
+
+    def test_partially_accepted_booking_stays_partially_assigned(self):
+        booking = self.make_booking(accepted=1)
+        result = sweep_expired_requests()
+
+        self.assertEqual(result["retry"], [booking.id])
+        self.assertEqual(self.status_of(booking), "partially_assigned")
+
+    def test_out_of_attempts(self):
+        failed = self.make_booking(attempts=3)
+        partial = self.make_booking(accepted=1, attempts=3)
+        result = sweep_expired_requests()
+
+        self.assertEqual(result["retry"], [])
+        self.assertEqual(self.status_of(failed), "failed")
+        self.assertEqual(self.status_of(partial), "partially_assigned")
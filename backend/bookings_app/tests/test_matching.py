@@ -0,0 +1,81 @@
+# bookings_app/tests/test_matching.py
+
+from django.test import TestCase
+
+from bookings_app.models import AssignmentLog, Booking
+from bookings_app.services.matching import TaaskrIndex, match_bookings
+from bookings_app.tests.factories import make_booking
+from services_app.tests.factories import make_service
+from taaskr_app.models import TaaskrProfile
+from users_app.tests.factories import make_address, make_user
+
+
+PUNE = (18.5204, 73.8567)
+MUMBAI = (19.0760, 72.8777)
+
+
+class MatchBookingsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = make_service()
+        cls.customer = make_user()
+        cls.address = make_address(cls.customer, at=PUNE)
+
+        # 3 cleaners in Pune, 2 in Mumbai (~120 km away)
+        for i, (lat, lng) in enumerate([PUNE] * 3 + [MUMBAI] * 2):
+            taaskr = make_user()
+            TaaskrProfile.objects.create(
+                user=taaskr, skill_tags=["deep cleaning"], verified=True,
+                rating_avg=4.0 + i / 10,
+            )
+            make_address(taaskr, at=(lat + i / 1000, lng))
+
+    def make_booking(self, **fields):
+        return make_booking(
+            self.service, self.customer, address=self.address, **fields
+        )
+
+    def test_narrowed_index_ranks_like_the_full_index(self):
+        booking = self.make_booking(required_taaskrs=2)
+        full = TaaskrIndex.build()
+        narrowed = TaaskrIndex.for_booking(booking)
+
+        self.assertEqual(len(full.rating), 5)
+        self.assertEqual(len(narrowed.rating), 3)
+
+        tokens = {"deep", "clean", "cleaning"}
+        self.assertEqual(
+            sorted(narrowed.nearby(*PUNE, 25, tokens)),
+            sorted(full.nearby(*PUNE, 25, tokens)),
+        )
+
+    def test_single_booking_requests_nearby_taaskrs(self):
+        booking = self.make_booking()
+        result = match_bookings([booking])
+
+        self.assertEqual(result["requests"], 3)
+        self.assertEqual(result["stale"], 0)
+        booking.refresh_from_db()
+        self.assertEqual(booking.assignment_status, "requested")
+        self.assertEqual(booking.assignment_attempts, 1)
+
+    def test_nothing_to_match_has_the_same_result_shape(self):
+        result = match_bookings([self.make_booking()])
+        self.assertEqual(match_bookings([]), dict.fromkeys(result, 0))
+
+    def test_booking_changed_during_ranking_is_left_alone(self):
+        booking = self.make_booking(required_taaskrs=1)
+        # claimed / cancelled after the batch was loaded
+        Booking.objects.filter(pk=booking.pk).update(
+            accepted_count=1, assignment_status="assigned", status="confirmed",
+        )
+
+        result = match_bookings([booking])
+
+        self.assertEqual(result["stale"], 1)
+        self.assertEqual(result["requests"], 0)
+        self.assertFalse(AssignmentLog.objects.filter(booking=booking).exists())
+        booking.refresh_from_db()
+        self.assertEqual(booking.assignment_status, "assigned")
+        self.assertEqual(booking.assignment_attempts, 0)
@@ -0,0 +1,97 @@
+# bookings_app/tests/test_quote_images.py
+#
+# Real concurrent transactions (TransactionTestCase) on the Postgres
+# advisory lock around shared quote image files.
+
+import shutil
+import tempfile
+import threading
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.test import TransactionTestCase, override_settings
+
+from bookings_app.models import QuoteImage, QuoteRequest
+from daytaask_backend.storage import content_addressed_storage
+from users_app.tests.factories import make_user
+
+
+PHOTO = b"same photo bytes"
+
+
+@mock.patch("bookings_app.signals.queue_image_derivatives")
+class SharedQuoteImageTests(TransactionTestCase):
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.quote = QuoteRequest.objects.create(
+            customer=make_user(), service_name="Deep clean",
+            problem_description="Stained sofa",
+        )
+
+    def upload(self, name):
+        return QuoteImage.objects.create(
+            quote_request=self.quote, image=ContentFile(PHOTO, name=name)
+        )
+
+    def test_last_reference_deletes_file(self, queue):
+        first, second = self.upload("a.jpg"), self.upload("b.jpg")
+        name = first.image.name
+        self.assertEqual(second.image.name, name)
+
+        first.delete()
+        self.assertTrue(content_addressed_storage.exists(name))
+        second.delete()
+        self.assertFalse(content_addressed_storage.exists(name))
+
+    def test_release_waits_for_identical_upload(self, queue):
+        first = self.upload("a.jpg")
+        name = first.image.name
+        written, proceed = threading.Event(), threading.Event()
+        errors = []
+
+        def upload_again():
+            try:
+                with transaction.atomic():
+                    self.upload("b.jpg")
+                    written.set()
+                    proceed.wait(10)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        def delete_first():
+            written.wait(10)
+            try:
+                first.delete()  # releases the file on commit
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        uploader = threading.Thread(target=upload_again)
+        deleter = threading.Thread(target=delete_first)
+        uploader.start()
+        deleter.start()
+
+        written.wait(10)
+        deleter.join(0.5)
+        # file written, row not committed yet: the release must wait
+        self.assertTrue(deleter.is_alive())
+
+        proceed.set()
+        uploader.join()
+        deleter.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            list(QuoteImage.objects.values_list("image", flat=True)), [name]
+        )
+        self.assertTrue(content_addressed_storage.exists(name))
@@ -0,0 +1,66 @@
+# bookings_app/tests/test_search.py
+
+from django.db import connection, transaction
+from django.test import TestCase
+
+from bookings_app.filters import filter_bookings
+from bookings_app.models import Booking
+from bookings_app.tests.factories import make_booking
+from services_app.tests.factories import make_service
+from users_app.models import User
+from users_app.tests.factories import make_user
+
+
+class BookingSearchTextTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = make_service()
+        cls.asha = make_user(full_name="Asha Rao")
+        cls.ravi = make_user(full_name="Ravi Iyer")
+        cls.booking = make_booking(cls.service, cls.asha)
+
+    def test_created_booking_is_indexed(self):
+        self.booking.refresh_from_db()
+        self.assertIn("asha rao", self.booking.search_text)
+        self.assertIn("deep clean", self.booking.search_text)
+
+    def test_plain_save_skips_refresh_when_nothing_indexed_changed(self):
+        booking = Booking.objects.get(pk=self.booking.pk)
+        booking.location_notes = "Gate 2"
+        with self.assertNumQueries(1):  # the save's own UPDATE
+            booking.save()
+
+    def test_plain_save_refreshes_when_customer_changes(self):
+        booking = Booking.objects.get(pk=self.booking.pk)
+        booking.customer = self.ravi
+        with self.assertNumQueries(2):
+            booking.save()
+
+        booking.refresh_from_db()
+        self.assertIn("ravi iyer", booking.search_text)
+        self.assertNotIn("asha", booking.search_text)
+
+    def test_plain_customer_save_skips_refresh_when_name_unchanged(self):
+        customer = User.objects.get(pk=self.asha.pk)
+        customer.phone = "9000000000"
+        with self.assertNumQueries(1):  # the save's own UPDATE
+            customer.save()
+
+    def test_plain_customer_save_refreshes_when_name_changes(self):
+        customer = User.objects.get(pk=self.asha.pk)
+        customer.full_name = "Asha Menon"
+        with self.assertNumQueries(3):  # UPDATE + bookings + quotes
+            customer.save()
+
+        self.booking.refresh_from_db()
+        self.assertIn("asha menon", self.booking.search_text)
+
+    def test_search_uses_trigram_index(self):
+        queryset = filter_bookings(Booking.objects.all(), {"search": "asha rao"})
+        with transaction.atomic(), connection.cursor() as cursor:
+            # tiny table: make the planner show what it *can* use
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+        self.assertIn("booking_search_trgm_idx", plan)
+        self.assertEqual(list(queryset), [self.booking])
@@ -0,0 +1,74 @@
+# bookings_app/tests/test_stats.py
+
+import threading
+from datetime import date, datetime, time, timedelta
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from bookings_app.models import Booking, BookingDailyStats
+from bookings_app.services.stats import refresh_daily_stats
+from services_app.tests.factories import make_service
+from users_app.tests.factories import make_user
+
+
+DAY = date(2026, 3, 4)
+
+
+class DailyStatsRefreshTests(TransactionTestCase):
+    """Real transactions: refreshes race each other from threads."""
+
+    def setUp(self):
+        self.services = [make_service(f"S{i}") for i in range(3)]
+        customer = make_user()
+        at = datetime.combine(DAY, time(10), tzinfo=timezone.get_current_timezone())
+        # created with .update() semantics: no signal-queued refreshes
+        Booking.objects.bulk_create(
+            Booking(customer=customer, service=service, scheduled_at=at,
+                    total_price=100)
+            for service in self.services
+            for _ in range(2)
+        )
+
+    def test_concurrent_refreshes_of_the_same_day(self):
+        start = threading.Barrier(8)
+        errors = []
+
+        def worker(n):
+            try:
+                start.wait()
+                for _ in range(5):
+                    if n % 2:
+                        refresh_daily_stats(DAY, service_id=self.services[0].id)
+                    else:
+                        refresh_daily_stats(DAY - timedelta(days=1), DAY)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            sorted(BookingDailyStats.objects.values_list("service_id", "bookings")),
+            sorted((service.id, 2) for service in self.services),
+        )
+
+    def test_rows_without_bookings_are_dropped(self):
+        refresh_daily_stats(DAY)
+        moved = self.services[1]
+        Booking.objects.filter(service=moved).update(
+            scheduled_at=timezone.now() + timedelta(days=400)
+        )
+
+        self.assertEqual(refresh_daily_stats(DAY), 2)
+        self.assertCountEqual(
+            BookingDailyStats.objects.values_list("service_id", flat=True),
+            [self.services[0].id, self.services[2].id],
+        )
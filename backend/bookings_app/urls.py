@@ -12,6 +12,9 @@ from bookings_app.views.admin.admin_assignment_action_viewset import (
 )
 from bookings_app.views.admin.booking_calendar_viewset import AdminBookingCalendarViewSet
 from bookings_app.views.admin.needy_assignment_viewset import NeedyAssignmentViewSet
+from bookings_app.views.admin.assignment_broadcast_viewset import (
+    AdminAssignmentBroadcastViewSet,
+)
 
 from bookings_app.views.taaskr.taaskr_assignment_viewset import (
     TaaskrAssignmentActionViewSet,
@@ -22,6 +25,7 @@ from bookings_app.views.admin.quote_request_viewset import (
     AdminQuoteRequestViewSet,
 )
 from bookings_app.views.admin.custom_service_viewset import AdminCustomServiceViewSet
+from bookings_app.views.admin.dashboard_stats_viewset import AdminDashboardStatsViewSet
 
 
 router = DefaultRouter()
@@ -69,6 +73,15 @@ router.register(
     basename="admin-needy-assignments"
 )
 
+# Broadcast runs started from admin/bookings/{id}/broadcast/
+# - Progress: total taaskrs, chunks done, requests sent
+# - POST admin/broadcasts/{id}/cancel/ stops the remaining chunks
+router.register(
+    r"admin/broadcasts",
+    AdminAssignmentBroadcastViewSet,
+    basename="admin-broadcasts"
+)
+
 
 # ────────────────────────────────────────────────
 # TAASKR (WORKER / SERVICE PROVIDER) ROUTES
@@ -113,6 +126,14 @@ router.register(
     basename="admin-booking-calendar",
 )
 
+# Dashboard tiles (counts by status / payment / assignment, revenue)
+# - Served from the booking_daily_stats rollup, not live bookings
+router.register(
+    r"admin/dashboard-stats",
+    AdminDashboardStatsViewSet,
+    basename="admin-dashboard-stats",
+)
+
 
 # --------------------------------------------------
 # Quote Requests (Admin)
@@ -4,11 +4,15 @@ from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.decorators import action
 
 from bookings_app.models import AssignmentLog, Booking
 from bookings_app.serializers.admin.assign_taaskr_serializer import (
     AssignTaaskrSerializer
 )
+from bookings_app.serializers.admin.bulk_assign_taaskr_serializer import (
+    BulkAssignTaaskrSerializer
+)
 from users_app.permissions import HasCustomPermission
 
 
@@ -16,6 +20,7 @@ class AdminAssignmentActionViewSet(ModelViewSet):
     """
     Admin assignment ACTIONS
     - POST → send assignment requests
+    - POST bulk/ → many bookings in one call, per-row results
     """
 
     serializer_class = AssignTaaskrSerializer
@@ -34,3 +39,14 @@ class AdminAssignmentActionViewSet(ModelViewSet):
             {"detail": "Assignment request(s) sent successfully"},
             status=status.HTTP_201_CREATED
         )
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        serializer = BulkAssignTaaskrSerializer(
+            data=request.data,
+            context={"request": request}
+        )
+        serializer.is_valid(raise_exception=True)
+        result = serializer.save()
+
+        return Response(result, status=status.HTTP_200_OK)
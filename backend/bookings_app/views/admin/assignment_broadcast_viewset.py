@@ -0,0 +1,53 @@
+# bookings_app/views/admin/assignment_broadcast_viewset.py
+
+from rest_framework.viewsets import ReadOnlyModelViewSet
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+
+from bookings_app.models import AssignmentBroadcast
+from bookings_app.serializers.admin.assignment_broadcast_serializer import (
+    AssignmentBroadcastSerializer,
+)
+from bookings_app.services.broadcast import cancel_broadcast
+from users_app.permissions import HasCustomPermission
+
+
+class AdminAssignmentBroadcastViewSet(ReadOnlyModelViewSet):
+    """
+    Broadcast runs (progress of the chunked fan-out)
+    - List / retrieve, filter by booking: ?booking=<id>
+    - Cancel a queued / running broadcast
+    """
+
+    queryset = AssignmentBroadcast.objects.select_related(
+        "booking",
+        "created_by",
+    )
+
+    serializer_class = AssignmentBroadcastSerializer
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    required_permissions = "booking.assign"
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        booking_id = self.request.query_params.get("booking")
+        if booking_id:
+            qs = qs.filter(booking_id=booking_id)
+        return qs
+
+    @action(detail=True, methods=["post"])
+    def cancel(self, request, pk=None):
+        broadcast = self.get_object()
+
+        if not cancel_broadcast(broadcast.id):
+            return Response(
+                {"detail": f"Broadcast is already {broadcast.status}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response({
+            "detail": "Broadcast cancelled",
+            "broadcast_id": broadcast.id,
+        })
@@ -4,10 +4,12 @@ from rest_framework.viewsets import ReadOnlyModelViewSet
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
+from django.db.models import Q
 from django.utils import timezone
 from rest_framework.permissions import IsAuthenticated
 
 from bookings_app.models import AssignmentLog, Booking
+from bookings_app.pagination import KeysetPagination
 from bookings_app.serializers.admin.assignment_list_serializer import (
     AssignmentListSerializer,
 )
@@ -26,13 +28,12 @@ class AdminAssignmentViewSet(ReadOnlyModelViewSet):
         "booking",
         "taaskr",
         "assigned_by",
-    ).order_by("-created_at")
+    ).order_by("-created_at", "-id")
 
     serializer_class = AssignmentListSerializer
-
-    def get_permissions(self):
-        HasCustomPermission.required_permissions = "booking.assign"
-        return [IsAuthenticated(), HasCustomPermission()]
+    pagination_class = KeysetPagination
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    required_permissions = "booking.assign"
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -51,26 +52,26 @@ class AdminAssignmentViewSet(ReadOnlyModelViewSet):
         except AssignmentLog.DoesNotExist:
             return Response({"detail": "Assignment not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        if log.status != "requested":
-            return Response(
-                {"detail": "Only pending (requested) assignments can be cancelled"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        # one conditional UPDATE: a claim committing between a read and
+        # a save would otherwise get its "accepted" overwritten
+        now = timezone.now()
+        cancelled = AssignmentLog.objects.filter(
+            Q(expires_at__isnull=True) | Q(expires_at__gt=now),
+            pk=log.pk,
+            status="requested",
+        ).update(status="cancelled", updated_at=now)
 
-        if log.expires_at and log.expires_at < timezone.now():
+        if not cancelled:
             return Response(
-                {"detail": "This request has already expired"},
+                {"detail": "Only pending (requested), unexpired assignments can be cancelled"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        log.status = "cancelled"
-        log.save(update_fields=["status"])
-
         # Optional: check if booking still needs more taaskrs
         # If needed, you can update booking.assignment_status here
 
         return Response({
             "detail": "Assignment request cancelled",
             "assignment_id": log.id,
-            "new_status": log.status
+            "new_status": "cancelled"
         })
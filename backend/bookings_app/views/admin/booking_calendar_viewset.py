@@ -1,17 +1,23 @@
 # bookings_app/views/admin/booking_calendar_viewset.py
 
-from django.db.models import Count, Q
 from rest_framework.viewsets import ReadOnlyModelViewSet
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework import status
 
-from bookings_app.models import Booking
 from bookings_app.serializers.admin.booking_calendar_serializer import (
     BookingCalendarSerializer,
 )
+from bookings_app.services.calendar import (
+    CalendarRangeError,
+    calendar_day_summary,
+    calendar_range,
+    calendar_rows,
+    in_range,
+)
 from users_app.permissions import HasCustomPermission
+from users_app.authentication import ClaimsJWTAuthentication
 
 
 class AdminBookingCalendarViewSet(ReadOnlyModelViewSet):
@@ -23,20 +29,13 @@ class AdminBookingCalendarViewSet(ReadOnlyModelViewSet):
 
     serializer_class = BookingCalendarSerializer
     pagination_class = None
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated, HasCustomPermission]
+    required_permissions = "booking.view"
 
     def get_queryset(self):
-        return (
-            Booking.objects
-            .select_related("customer", "service")
-            .annotate(
-                accepted_taaskr_count=Count(
-                    "assignments",
-                    filter=Q(assignments__status="accepted"),
-                    distinct=True,
-                )
-            ).order_by("scheduled_at")
-        )
+        # .values() rows: list / retrieve / calendar all render them
+        return calendar_rows()
 
     # ---------------------------
     # CALENDAR (MONTH / WEEK)
@@ -47,6 +46,10 @@ class AdminBookingCalendarViewSet(ReadOnlyModelViewSet):
         Required query params:
         - start_date (YYYY-MM-DD)
         - end_date (YYYY-MM-DD)
+
+        Optional:
+        - tz (e.g. Asia/Kolkata, defaults to server time zone)
+        - group=day → per-day counts by status / priority (month view)
         """
 
         start_date = request.query_params.get("start_date")
@@ -58,14 +61,20 @@ class AdminBookingCalendarViewSet(ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        queryset = (
-            self.get_queryset()
-            .filter(
-                scheduled_at__date__gte=start_date,
-                scheduled_at__date__lte=end_date,
+        try:
+            start, end, tz = calendar_range(
+                start_date, end_date, request.query_params.get("tz")
+            )
+        except CalendarRangeError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            .order_by("scheduled_at")
-        )
 
-        serializer = self.get_serializer(queryset, many=True)
+        if request.query_params.get("group") == "day":
+            return Response(calendar_day_summary(start, end, tz))
+
+        serializer = self.get_serializer(
+            in_range(self.get_queryset(), start, end), many=True
+        )
         return Response(serializer.data)
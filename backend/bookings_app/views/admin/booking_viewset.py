@@ -1,13 +1,18 @@
 # bookings_app/views/admin/booking_viewset.py
 
-from django.db.models import Q
+import math
+
+from django.conf import settings
+from django.db import transaction
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
 
+from bookings_app.filters import filter_bookings
 from bookings_app.models import Booking, AssignmentLog
+from bookings_app.pagination import KeysetPagination
 from bookings_app.serializers.admin.booking_list_serializer import (
     BookingAdminListSerializer,
 )
@@ -20,7 +25,16 @@ from bookings_app.serializers.admin.admin_booking_create_serializer import (
 from bookings_app.serializers.admin.admin_booking_update_serializer import (
     AdminBookingUpdateSerializer,
 )
+from bookings_app.serializers.utils.assignment_utils import (
+    with_accepted_assignments,
+)
+from bookings_app.services.broadcast import create_broadcast
+from bookings_app.services.export import export_response
+from bookings_app.services.matching import match_bookings
+from bookings_app.tasks import run_broadcast
+from users_app.models import Address
 from users_app.permissions import HasCustomPermission
+from users_app.utils.geo import within_radius
 
 
 class AdminBookingViewSet(ModelViewSet):
@@ -35,10 +49,17 @@ class AdminBookingViewSet(ModelViewSet):
         "customer",
         "service",
         "address",
-    ).prefetch_related(
-        "assignments__taaskr",
-        "assignments__assigned_by",   # 🔥 THIS LINE FIXES IT
-    ).order_by("-created_at")
+    ).order_by("-created_at", "-id")
+
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        if self.action == "retrieve":
+            queryset = with_accepted_assignments(queryset)
+
+        return queryset
 
     # ---------------------------
     # SERIALIZER
@@ -55,43 +76,45 @@ class AdminBookingViewSet(ModelViewSet):
     # ---------------------------
     # PERMISSIONS
     # ---------------------------
-    def get_permissions(self):
-        permission_map = {
-            "list": "booking.view",
-            "retrieve": "booking.view",
-            "create": "booking.create",
-            "update": "booking.update",
-            "partial_update": "booking.update",
-            "destroy": "booking.delete",
-        }
-
-        HasCustomPermission.required_permissions = permission_map.get(
-            self.action
-        )
-        return [IsAuthenticated(), HasCustomPermission()]
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        "list": "booking.view",
+        "retrieve": "booking.view",
+        "create": "booking.create",
+        "update": "booking.update",
+        "partial_update": "booking.update",
+        "destroy": "booking.delete",
+        "cancel": "booking.cancel",
+        "auto_assign": "booking.assign",
+        "broadcast": "booking.assign",
+        "nearby_taaskrs": ["booking.view", "taaskr.view"],
+        "export": "booking.view",
+    }
+
+    export_columns = [
+        ("id", "id"),
+        ("booking_code", "booking_code"),
+        ("created_at", "created_at"),
+        ("scheduled_at", "scheduled_at"),
+        ("status", "status"),
+        ("assignment_status", "assignment_status"),
+        ("payment_status", "payment_status"),
+        ("priority", "priority"),
+        ("customer_name", "customer__full_name"),
+        ("customer_phone", "customer__phone"),
+        ("service_name", "service__name"),
+        ("category_name", "service__category__name"),
+        ("required_taaskrs", "required_taaskrs"),
+        ("accepted_taaskrs", "accepted_count"),
+        ("total_price", "total_price"),
+        ("paid_amount", "paid_amount"),
+    ]
 
     # ---------------------------
     # LIST (Search + Filters)
     # ---------------------------
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-
-        search = request.query_params.get("search")
-        status_filter = request.query_params.get("status")
-        assignment_status = request.query_params.get("assignment_status")
-
-        if search:
-            queryset = queryset.filter(
-                Q(booking_code__icontains=search) |
-                Q(customer__full_name__icontains=search) |
-                Q(service__name__icontains=search)
-            )
-
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
-
-        if assignment_status:
-            queryset = queryset.filter(assignment_status=assignment_status)
+        queryset = filter_bookings(self.get_queryset(), request.query_params)
 
         page = self.paginate_queryset(queryset)
         serializer = self.get_serializer(
@@ -101,6 +124,20 @@ class AdminBookingViewSet(ModelViewSet):
         )
         return self.get_paginated_response(serializer.data)
 
+    # ---------------------------
+    # EXPORT (streamed, same filters as list)
+    # ---------------------------
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        GET /admin/bookings/export/?file_format=csv|ndjson
+            &search=&status=&assignment_status=&created_from=&created_to=
+        """
+        queryset = filter_bookings(Booking.objects.all(), request.query_params)
+        return export_response(
+            request, queryset, self.export_columns, "bookings"
+        )
+
     # ---------------------------
     # CANCEL BOOKING
     # ---------------------------
@@ -125,6 +162,165 @@ class AdminBookingViewSet(ModelViewSet):
 
         return Response({"detail": "Booking cancelled"})
 
+    # ---------------------------
+    # AUTO ASSIGN (matching engine)
+    # ---------------------------
+    @action(detail=True, methods=["post"])
+    def auto_assign(self, request, pk=None):
+        booking = self.get_object()
+
+        if booking.status in ["cancelled", "completed"]:
+            return Response(
+                {"detail": f"Booking is {booking.status}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if booking.open_slots == 0:
+            return Response(
+                {"detail": "All required taaskrs have already been assigned."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        result = match_bookings([booking])
+
+        if result["stale"]:
+            return Response(
+                {"detail": "Booking changed while matching, please retry."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        return Response({
+            "detail": "Auto assignment requests sent"
+            if result["requests"] else "No matching taaskrs found",
+            "requests_sent": result["requests"],
+            "assignment_status": booking.assignment_status,
+        })
+
+    # ---------------------------
+    # BROADCAST (chunked fan-out via celery)
+    # ---------------------------
+    @action(detail=True, methods=["post"])
+    def broadcast(self, request, pk=None):
+        """
+        POST /admin/bookings/{id}/broadcast/  {"radius_km": 10}
+        Queues requests to every eligible taaskr; returns immediately.
+        """
+        booking = self.get_object()
+
+        if booking.status in ["cancelled", "completed"]:
+            return Response(
+                {"detail": f"Booking is {booking.status}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if booking.open_slots == 0:
+            return Response(
+                {"detail": "All required taaskrs have already been assigned."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            radius_km = float(request.data.get(
+                "radius_km", settings.BROADCAST_DEFAULT_RADIUS_KM
+            ))
+        except (TypeError, ValueError):
+            return Response(
+                {"detail": "radius_km must be a number"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        # nan / inf parse as floats and slip through min() / max();
+        # 0 would silently mean "no radius" further down
+        if not math.isfinite(radius_km) or radius_km <= 0:
+            return Response(
+                {"detail": "radius_km must be a positive number"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        radius_km = min(radius_km, settings.PROXIMITY_MAX_RADIUS_KM)
+
+        with transaction.atomic():
+            broadcast = create_broadcast(booking, request.user, radius_km)
+            transaction.on_commit(lambda: run_broadcast.delay(broadcast.id))
+
+        return Response(
+            {
+                "detail": "Broadcast queued",
+                "broadcast_id": broadcast.id,
+                "status": broadcast.status,
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    # ---------------------------
+    # NEARBY TAASKRS (proximity search)
+    # ---------------------------
+    @action(detail=True, methods=["get"])
+    def nearby_taaskrs(self, request, pk=None):
+        """
+        GET /admin/bookings/{id}/nearby_taaskrs/?radius_km=10&limit=50
+        """
+        booking = self.get_object()
+        address = booking.address
+
+        if not address or address.latitude is None or address.longitude is None:
+            return Response(
+                {"detail": "Booking address has no coordinates"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            radius_km = float(request.query_params.get("radius_km", 10))
+            limit = int(request.query_params.get("limit", 50))
+        except ValueError:
+            return Response(
+                {"detail": "radius_km and limit must be numbers"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not math.isfinite(radius_km):
+            return Response(
+                {"detail": "radius_km must be a finite number"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        radius_km = min(max(radius_km, 0), settings.PROXIMITY_MAX_RADIUS_KM)
+        limit = min(max(limit, 1), settings.PROXIMITY_MAX_RESULTS)
+
+        addresses = within_radius(
+            Address.objects.filter(
+                user__taaskrprofile__isnull=False,
+            ).select_related("user", "user__taaskrprofile"),
+            address.latitude,
+            address.longitude,
+            radius_km,
+        )
+
+        # nearest address per taaskr
+        results, seen = [], set()
+        for taaskr_address in addresses.iterator(chunk_size=limit * 2):
+            if taaskr_address.user_id in seen:
+                continue
+            seen.add(taaskr_address.user_id)
+
+            taaskr = taaskr_address.user
+            profile = taaskr.taaskrprofile
+            results.append({
+                "taaskr_id": taaskr.id,
+                "taaskr_name": taaskr.full_name,
+                "taaskr_phone": taaskr.phone,
+                "distance_km": round(taaskr_address.distance_km, 2),
+                "city": taaskr_address.city,
+                "skill_tags": profile.skill_tags,
+                "rating_avg": profile.rating_avg,
+                "verified": profile.verified,
+            })
+            if len(results) >= limit:
+                break
+
+        return Response({
+            "booking_id": booking.id,
+            "radius_km": radius_km,
+            "results": results,
+        })
+
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         self.perform_destroy(instance)
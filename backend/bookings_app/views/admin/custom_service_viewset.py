@@ -51,21 +51,17 @@ class AdminCustomServiceViewSet(ModelViewSet):
 
         return AdminCustomServiceSerializer
 
-    def get_permissions(self):
-        permission_map = {
-            "list": "quote.view",
-            "retrieve": "quote.view",
-            "create": "quote.update",
-            "update": "quote.update",
-            "partial_update": "quote.update",
-            "destroy": "quote.delete",
-            "attach_booking": "booking.update",
-        }
-
-        HasCustomPermission.required_permissions = permission_map.get(
-            self.action
-        )
-        return [IsAuthenticated(), HasCustomPermission()]
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        "list": "quote.view",
+        "retrieve": "quote.view",
+        "create": "quote.update",
+        "update": "quote.update",
+        "partial_update": "quote.update",
+        "destroy": "quote.delete",
+        "attach_booking": "booking.update",
+        "send_to_customer": "quote.update",
+    }
 
     @action(detail=True, methods=["post"])
     def attach_booking(self, request, pk=None):
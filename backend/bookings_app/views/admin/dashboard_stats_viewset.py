@@ -0,0 +1,64 @@
+# bookings_app/views/admin/dashboard_stats_viewset.py
+
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.viewsets import ViewSet
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status
+
+from bookings_app.services.stats import dashboard_stats
+from users_app.permissions import HasCustomPermission
+
+
+class AdminDashboardStatsViewSet(ViewSet):
+    """
+    Dashboard tiles from the booking_daily_stats rollup
+    GET /admin/dashboard-stats/?start_date=&end_date=&service=&category=
+    - dates are service days (scheduled_at), default: last 30 days
+    - cost grows with days in range, not with bookings
+    """
+
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    required_permissions = "dashboard.stats"
+
+    def list(self, request):
+        params = request.query_params
+        today = timezone.localdate()
+
+        try:
+            end = date.fromisoformat(params.get("end_date", today.isoformat()))
+            start = date.fromisoformat(
+                params.get("start_date", (end - timedelta(days=29)).isoformat())
+            )
+        except ValueError:
+            return Response(
+                {"detail": "Dates must be YYYY-MM-DD"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if end < start or (end - start).days >= settings.STATS_MAX_DAYS:
+            return Response(
+                {"detail": f"Range must be 1-{settings.STATS_MAX_DAYS} days"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        service_id, category_id = params.get("service"), params.get("category")
+        if not all(v is None or v.isdigit() for v in (service_id, category_id)):
+            return Response(
+                {"detail": "service and category must be ids"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response({
+            "start_date": start,
+            "end_date": end,
+            **dashboard_stats(
+                start,
+                end,
+                service_id=service_id,
+                category_id=category_id,
+            ),
+        })
@@ -4,6 +4,7 @@ from rest_framework.permissions import IsAuthenticated
 from bookings_app.models import Booking
 from bookings_app.serializers.admin.needy_assignment_serializer import NeedyAssignmentSerializer
 from users_app.permissions import HasCustomPermission
+from users_app.authentication import ClaimsJWTAuthentication
 
 
 class NeedyAssignmentViewSet(ReadOnlyModelViewSet):
@@ -12,21 +13,16 @@ class NeedyAssignmentViewSet(ReadOnlyModelViewSet):
     Used by Assignment Management page.
     """
     serializer_class = NeedyAssignmentSerializer
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated, HasCustomPermission]
+    required_permissions = "booking.view"
 
     def get_queryset(self):
-        HasCustomPermission.required_permissions = "booking.view"
-
         return Booking.objects.select_related(
             "customer", "service", "address"
-        ).prefetch_related(
-            "assignments"
         ).filter(
             assignment_status__in=["unassigned",
                                    "requested", "partially_assigned"]
         ).exclude(
             status__in=["cancelled", "completed"]
         ).order_by("-created_at")
-
-    def get_permissions(self):
-        return [IsAuthenticated(), HasCustomPermission()]
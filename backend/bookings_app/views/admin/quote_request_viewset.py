@@ -24,6 +24,7 @@ from bookings_app.serializers.admin.quote_request_create_serializer import (
 )
 
 from users_app.permissions import HasCustomPermission
+from users_app.utils.search import SearchDocumentFilter
 
 
 class AdminQuoteRequestViewSet(ModelViewSet):
@@ -41,6 +42,10 @@ class AdminQuoteRequestViewSet(ModelViewSet):
         .order_by("-created_at")
     )
 
+    # ?search= over quote code / customer name / service name
+    filter_backends = [SearchDocumentFilter]
+    search_prefix_field = "quote_code"
+
     # ---------------------------
     # SERIALIZERS
     # ---------------------------
@@ -56,20 +61,16 @@ class AdminQuoteRequestViewSet(ModelViewSet):
     # ---------------------------
     # PERMISSIONS
     # ---------------------------
-    def get_permissions(self):
-        permission_map = {
-            "list": "quote.view",
-            "retrieve": "quote.view",
-            "create": "quote.create",
-            "partial_update": "quote.update",
-            "upload_image": "quote.update",
-            "create_custom_service": "quote.update",
-            "destroy": "quote.delete",
-        }
-
-        HasCustomPermission.required_permissions = permission_map.get(
-            self.action)
-        return [IsAuthenticated(), HasCustomPermission()]
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        "list": "quote.view",
+        "retrieve": "quote.view",
+        "create": "quote.create",
+        "partial_update": "quote.update",
+        "upload_image": "quote.update",
+        "create_custom_service": "quote.update",
+        "destroy": "quote.delete",
+    }
 
     # ---------------------------
     # UPLOAD QUOTE IMAGE
@@ -123,11 +124,9 @@ class AdminQuoteRequestViewSet(ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # 🧹 DELETE IMAGE FILES + ROWS
+        # 🧹 DELETE IMAGE ROWS (post_delete releases shared files)
         images = QuoteImage.objects.filter(quote_request=quote)
         for img in images:
-            if img.image:
-                img.image.delete(save=False)  # 🔥 deletes file from storage
             img.delete()
 
         quote.delete()
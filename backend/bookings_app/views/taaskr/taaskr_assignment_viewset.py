@@ -1,6 +1,5 @@
 # bookings_app/views/taaskr/taaskr_assignment_views.py
 
-from django.db.models import Count, Q
 from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.permissions import IsAuthenticated
@@ -25,6 +24,7 @@ class TaaskrPendingAssignmentsViewSet(viewsets.ReadOnlyModelViewSet):
     """
     serializer_class = TaaskrPendingAssignmentSerializer
     permission_classes = [IsAuthenticated, HasCustomPermission]
+    required_permissions = "booking.view"
 
     def get_queryset(self):
         return AssignmentLog.objects.filter(
@@ -37,12 +37,6 @@ class TaaskrPendingAssignmentsViewSet(viewsets.ReadOnlyModelViewSet):
             "booking__service",
             "booking__customer",
             "booking__address",
-        ).annotate(
-            # Count only accepted assignments for this booking
-            accepted_count=Count(
-                "booking__assignments",
-                filter=Q(booking__assignments__status="accepted")
-            )
         ).order_by("expires_at")  # soonest expiring first → good UX
 
 
@@ -52,6 +46,7 @@ class TaaskrAssignmentsHistoryViewSet(viewsets.ReadOnlyModelViewSet):
     """
     serializer_class = TaaskrAssignmentHistorySerializer
     permission_classes = [IsAuthenticated, HasCustomPermission]
+    required_permissions = "booking.view"
 
     def get_queryset(self):
         return AssignmentLog.objects.filter(
@@ -71,6 +66,7 @@ class TaaskrAssignmentActionViewSet(viewsets.GenericViewSet):
     queryset = AssignmentLog.objects.none()
     serializer_class = TaaskrAssignmentActionSerializer
     permission_classes = [IsAuthenticated, HasCustomPermission]
+    required_permissions = "booking.update"
     lookup_field = "pk"
 
     def get_object(self):
@@ -7,3 +7,14 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "daytaask_backend.settings")
 app = Celery("daytaask_backend")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+app.conf.beat_schedule = {
+    "expire-assignment-requests": {
+        "task": "bookings_app.tasks.expire_assignment_requests",
+        "schedule": 60.0,  # seconds
+    },
+    "refresh-recent-booking-stats": {
+        "task": "bookings_app.tasks.refresh_recent_booking_stats",
+        "schedule": 600.0,
+    },
+}
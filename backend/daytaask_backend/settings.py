@@ -22,8 +22,17 @@ load_dotenv(BASE_DIR / ".env")
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
 GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
 GOOGLE_REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI")
-GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
-GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v3/userinfo"
+GOOGLE_TOKEN_URL = os.getenv(
+    "GOOGLE_TOKEN_URL", "https://oauth2.googleapis.com/token")
+GOOGLE_USERINFO_URL = os.getenv(
+    "GOOGLE_USERINFO_URL", "https://www.googleapis.com/oauth2/v3/userinfo")
+GOOGLE_JWKS_URL = os.getenv(
+    "GOOGLE_JWKS_URL", "https://www.googleapis.com/oauth2/v3/certs")
+GOOGLE_ISSUERS = os.getenv(
+    "GOOGLE_ISSUERS", "https://accounts.google.com,accounts.google.com"
+).split(",")
+GOOGLE_JWKS_CACHE_TIMEOUT = 60 * 60 * 6  # Google rotates keys ~daily
+GOOGLE_HTTP_POOL_SIZE = 20
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -199,6 +208,72 @@ CACHES = {
 }
 
 OTP_EXPIRY = 300  # 5 min
+OTP_MAX_ATTEMPTS = 5
+OTP_RATE_WINDOW = 60 * 10  # sliding window (seconds)
+OTP_SEND_LIMIT_PER_PHONE = 3
+OTP_SEND_LIMIT_PER_IP = 20
+OTP_VERIFY_LIMIT_PER_PHONE = 10
+OTP_VERIFY_LIMIT_PER_IP = 50
+
+# OTP SMS are queued in redis and sent in batches by celery
+SMS_PROVIDER = os.getenv("SMS_PROVIDER", "auth_app.services.sms.FakeSMSProvider")
+OTP_SMS_BATCH_SIZE = 100
+OTP_SMS_BATCH_DELAY = 1  # seconds to collect a batch
+
+# Auto matching (bookings_app.services.matching)
+MATCHING_MAX_DISTANCE_KM = 25
+MATCHING_REQUESTS_PER_SLOT = 3  # ranked requests sent per open slot
+MATCHING_MAX_ATTEMPTS = 3  # runs before a booking is marked failed
+MATCHING_REQUEST_EXPIRY_MINUTES = 30
+MATCHING_VERIFIED_ONLY = True
+MATCHING_WEIGHTS = {"skill": 0.4, "distance": 0.3, "rating": 0.2, "load": 0.1}
+
+# Proximity search (users_app.utils.geo)
+PROXIMITY_MAX_RADIUS_KM = 50
+PROXIMITY_MAX_RESULTS = 200
+
+# Bulk assignment API (admin/assign-taaskr/bulk/)
+ASSIGNMENT_BULK_MAX_REQUESTS = 1000
+
+# Expiry sweeper for assignment requests (celery beat)
+ASSIGNMENT_EXPIRY_BATCH_SIZE = 500
+ASSIGNMENT_EXPIRY_MAX_BATCHES = 20  # per run, bounds one sweep
+
+# Admin calendar (admin/calendar/calendar/)
+CALENDAR_MAX_DAYS = 62
+
+# Dashboard rollup (booking_daily_stats)
+STATS_REFRESH_DAYS_BACK = 7  # periodic rebuild window around today
+STATS_REFRESH_DAYS_AHEAD = 30
+STATS_MAX_DAYS = 366  # per dashboard request
+
+# Streaming exports (?file_format=csv|ndjson)
+EXPORT_CHUNK_SIZE = 2000  # rows per server-side cursor fetch
+
+# Broadcast fan-out (admin/bookings/{id}/broadcast/)
+BROADCAST_CHUNK_SIZE = 500  # requests per celery task
+BROADCAST_DEFAULT_RADIUS_KM = 25
+BROADCAST_REQUEST_EXPIRY_MINUTES = 30
+
+# RBAC permission sets cached per user (invalidated by version bump)
+RBAC_CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+# Authenticated User rows cached per access token (invalidated on save)
+AUTH_USER_CACHE_TIMEOUT = 60  # 1 min
+
+# Public catalog snapshot (services_app.utils.catalog_snapshot)
+CATALOG_CACHE_TIMEOUT = 60 * 60 * 24  # versioned, so long-lived is safe
+CATALOG_BUILD_LOCK_TIMEOUT = 10  # seconds one rebuild may hold the lock
+CATALOG_BUILD_WAIT = 2  # seconds others wait for it before building too
+# scheme://host the snapshots' absolute URLs are built for; requests
+# arriving under any other Host are answered uncached
+CATALOG_ORIGIN = os.getenv("CATALOG_ORIGIN", "http://localhost:8000")
+
+# Image derivatives, rendered by Celery after upload
+# (services_app.utils.image_derivatives)
+IMAGE_THUMBNAIL_SIZE = (320, 320)  # cropped to fill
+IMAGE_RESPONSIVE_WIDTHS = (480, 960, 1600)  # only those narrower than the original
+IMAGE_DERIVATIVE_QUALITY = 80
 
 AUTHENTICATION_BACKENDS = [
     'django.contrib.auth.backends.ModelBackend',
@@ -230,6 +305,10 @@ AUTH_COOKIE_SECURE = False              # True in prod (HTTPS)
 AUTH_COOKIE_HTTP_ONLY = True
 AUTH_COOKIE_SAMESITE = "Lax"            # None in prod (cross-domain)
 
+# Embed role ids + permission bitmap in access tokens
+# (read by users_app.authentication.ClaimsJWTAuthentication)
+RBAC_TOKEN_CLAIMS = os.getenv("RBAC_TOKEN_CLAIMS", "False") == "True"
+
 # ==========================
 # SESSION (optional but safe)
 # ==========================
@@ -0,0 +1,117 @@
+# daytaask_backend/storage.py
+
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.db import connection, transaction
+from django.utils.deconstruct import deconstructible
+
+
+# ==========================
+# CONTENT-ADDRESSED STORAGE
+# ==========================
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Stores each upload once, named by the SHA-256 of its bytes:
+
+        quotes/images/IMG_0412.jpg -> quotes/images/3f/3fa9...c2.jpg
+
+    The digest is computed while the upload streams to a temp file, so
+    the same photo uploaded again maps to the file that already exists.
+    Several rows can then point at one file: never delete one directly,
+    use release_blob() once the row is gone. Save the referencing row in
+    the same transaction as the file (see lock_blob()).
+    """
+
+    def _save(self, name, content):
+        directory, filename = os.path.split(name)
+        extension = os.path.splitext(filename)[1].lower()
+
+        full_directory = self.path(directory)
+        os.makedirs(full_directory, exist_ok=True)
+
+        digest = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(dir=full_directory, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+            os.chmod(temp_path, self.file_permissions_mode or 0o644)
+
+            hexdigest = digest.hexdigest()
+            name = os.path.join(directory, hexdigest[:2], hexdigest + extension)
+            name = name.replace("\\", "/")
+            os.makedirs(os.path.dirname(self.path(name)), exist_ok=True)
+
+            # same bytes, same name: replacing an existing blob is a no-op
+            # for readers; the lock keeps a release of this name from
+            # deleting it before our row commits
+            lock_blob(name)
+            os.replace(temp_path, self.path(name))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return name
+
+    def get_available_name(self, name, max_length=None):
+        # the final name comes from the digest in _save()
+        return name
+
+
+content_addressed_storage = ContentAddressedStorage()
+
+# Files named after something deduplicated (e.g. image derivatives of a
+# blob): deterministic names, rewritten in place, never renamed.
+derivative_storage = FileSystemStorage(allow_overwrite=True)
+
+
+# ==========================
+# LOCKING
+# ==========================
+# A blob is written before the row referencing it commits, so a release
+# counting references in between would delete a file that is about to
+# be referenced again. Upload and release take a transaction-scoped
+# advisory lock on the blob name: the upload holds it until its row
+# commits (models using release_blob() save atomically, see
+# QuoteImage), the release while it counts and deletes. hashtext() runs
+# in Postgres, so every process derives the same key (Python's hash()
+# is salted per process).
+def lock_blob(name):
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [name])
+
+
+# ==========================
+# REFERENCES
+# ==========================
+# The reference count of a blob is the number of rows pointing at it
+# (indexed lookup on the file column); it can't drift the way a stored
+# counter would with cascades or raw updates.
+def blob_references(model, field, name):
+    if not name:
+        return 0
+    return model.objects.filter(**{field: name}).count()
+
+
+def release_blob(storage, model, field, name):
+    """
+    Delete the file if no row of `model` references it anymore.
+    Call after the referencing row is deleted (post_delete, on commit);
+    inside an outer atomic block the lock is held until it commits.
+    """
+    if not name:
+        return False
+    with transaction.atomic():
+        lock_blob(name)
+        if blob_references(model, field, name):
+            return False
+        storage.delete(name)
+    return True
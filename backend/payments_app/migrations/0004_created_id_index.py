@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings_app', '0017_created_id_index'),
+        ('payments_app', '0003_refund'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['created_at', 'id'], name='payment_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='refund',
+            index=models.Index(fields=['created_at', 'id'], name='refund_created_id_idx'),
+        ),
+    ]
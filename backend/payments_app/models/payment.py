@@ -71,5 +71,13 @@ class Payment(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # keyset pagination for admin lists (newest first)
+            models.Index(
+                fields=["created_at", "id"], name="payment_created_id_idx"
+            ),
+        ]
+
     def __str__(self):
         return f"{self.booking.id} - {self.amount} - {self.payment_status}"
@@ -44,5 +44,13 @@ class Refund(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # keyset pagination for admin lists (newest first)
+            models.Index(
+                fields=["created_at", "id"], name="refund_created_id_idx"
+            ),
+        ]
+
     def __str__(self):
         return f"Refund {self.id} for Payment {self.payment.id}"
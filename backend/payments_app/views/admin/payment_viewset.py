@@ -1,6 +1,10 @@
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.decorators import action
 
+from bookings_app.filters import filter_bookings
+from bookings_app.pagination import KeysetPagination
+from bookings_app.services.export import export_response
 from payments_app.models import Payment
 from payments_app.serializers.admin.payment_serializers import (
     AdminPaymentSerializer,
@@ -24,9 +28,11 @@ class AdminPaymentViewSet(ModelViewSet):
             "booking",
             "booking__customer"
         )
-        .order_by("-created_at")
+        .order_by("-created_at", "-id")
     )
 
+    pagination_class = KeysetPagination
+
     http_method_names = ["get", "post", "patch"]
 
     # ---------------------------
@@ -42,16 +48,47 @@ class AdminPaymentViewSet(ModelViewSet):
     # ---------------------------
     # PERMISSIONS
     # ---------------------------
-    def get_permissions(self):
-        permission_map = {
-            "list": "payment.view",
-            "retrieve": "payment.view",
-            "create": "payment.create",
-            "update": "payment.update",
-            "partial_update": "payment.update",
-        }
-
-        HasCustomPermission.required_permissions = permission_map.get(
-            self.action
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        "list": "payment.view",
+        "retrieve": "payment.view",
+        "create": "payment.create",
+        "update": "payment.update",
+        "partial_update": "payment.update",
+        "export": "payment.view",
+    }
+
+    # ---------------------------
+    # EXPORT (streamed)
+    # ---------------------------
+    export_columns = [
+        ("id", "id"),
+        ("booking_code", "booking__booking_code"),
+        ("customer_name", "booking__customer__full_name"),
+        ("amount", "amount"),
+        ("payment_mode", "payment_mode"),
+        ("payment_status", "payment_status"),
+        ("provider", "provider"),
+        ("provider_order_id", "provider_order_id"),
+        ("provider_payment_id", "provider_payment_id"),
+        ("created_by_admin", "created_by_admin"),
+        ("created_at", "created_at"),
+    ]
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        GET /admin/payments/export/?file_format=csv|ndjson
+            &payment_status=&created_from=&created_to=
+            + booking list filters (search / status / assignment_status)
+        """
+        params = request.query_params
+        queryset = filter_bookings(
+            Payment.objects.all(), params, path="booking__"
+        )
+        if params.get("payment_status"):
+            queryset = queryset.filter(payment_status=params["payment_status"])
+
+        return export_response(
+            request, queryset, self.export_columns, "payments"
         )
-        return [IsAuthenticated(), HasCustomPermission()]
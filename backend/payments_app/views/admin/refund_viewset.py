@@ -1,8 +1,12 @@
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.decorators import action
 from rest_framework import status
 
+from bookings_app.filters import filter_bookings
+from bookings_app.pagination import KeysetPagination
+from bookings_app.services.export import export_response
 from payments_app.models import Refund
 from payments_app.serializers.admin.refund_serializers import (
     AdminRefundSerializer,
@@ -15,7 +19,9 @@ class AdminRefundViewSet(ModelViewSet):
     queryset = Refund.objects.select_related(
         "payment",
         "payment__booking"
-    ).order_by("-created_at")
+    ).order_by("-created_at", "-id")
+
+    pagination_class = KeysetPagination
 
     http_method_names = ["get", "post"]
 
@@ -24,17 +30,43 @@ class AdminRefundViewSet(ModelViewSet):
             return AdminRefundCreateSerializer
         return AdminRefundSerializer
 
-    def get_permissions(self):
-        permission_map = {
-            "list": "payment.view",
-            "retrieve": "payment.view",
-            "create": "payment.refund",
-        }
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        "list": "payment.view",
+        "retrieve": "payment.view",
+        "create": "payment.refund",
+        "export": "payment.view",
+    }
+
+    export_columns = [
+        ("id", "id"),
+        ("payment_id", "payment_id"),
+        ("booking_code", "payment__booking__booking_code"),
+        ("amount", "amount"),
+        ("refund_mode", "refund_mode"),
+        ("refund_status", "refund_status"),
+        ("provider_refund_id", "provider_refund_id"),
+        ("reason", "reason"),
+        ("created_at", "created_at"),
+    ]
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        GET /admin/refunds/export/?file_format=csv|ndjson
+            &refund_status=&created_from=&created_to=
+            + booking list filters (search / status / assignment_status)
+        """
+        params = request.query_params
+        queryset = filter_bookings(
+            Refund.objects.all(), params, path="payment__booking__"
+        )
+        if params.get("refund_status"):
+            queryset = queryset.filter(refund_status=params["refund_status"])
 
-        HasCustomPermission.required_permissions = permission_map.get(
-            self.action
+        return export_response(
+            request, queryset, self.export_columns, "refunds"
         )
-        return [IsAuthenticated(), HasCustomPermission()]
 
     def perform_create(self, serializer):
         refund = serializer.save(refund_status="processed")
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ServicesAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'services_app'
+
+    def ready(self):
+        import services_app.signals
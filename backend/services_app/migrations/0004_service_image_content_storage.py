@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 11:02
+
+import daytaask_backend.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services_app', '0003_image_variants'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='service',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=daytaask_backend.storage.ContentAddressedStorage(), upload_to='services/images/'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['image'], name='service_image_idx'),
+        ),
+    ]
@@ -11,6 +11,7 @@ class Addon(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     description = models.CharField(max_length=250, blank=True)
     is_active = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.name} - {self.service.name}"
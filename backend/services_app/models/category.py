@@ -7,6 +7,9 @@ class Category(models.Model):
         upload_to='category/icons/', blank=True, null=True)
     banner = models.ImageField(
         upload_to='category/banners/', blank=True, null=True)
+    # thumbnails / responsive widths, see utils/image_derivatives.py
+    icon_variants = models.JSONField(default=dict, blank=True, editable=False)
+    banner_variants = models.JSONField(default=dict, blank=True, editable=False)
     description = models.CharField(max_length=250, blank=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
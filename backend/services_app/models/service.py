@@ -1,6 +1,7 @@
-from django.db import models
+from django.db import models, transaction
 from .category import Category
 from django.contrib.postgres.fields import ArrayField
+from daytaask_backend.storage import content_addressed_storage
 
 
 class Service(models.Model):
@@ -15,7 +16,8 @@ class Service(models.Model):
         max_length=50, default="fixed")  # fixed/hourly/custom
     duration_minutes = models.PositiveIntegerField(default=60)
     image = models.ImageField(
-        upload_to='services/images/', blank=True, null=True)
+        upload_to='services/images/', blank=True, null=True,
+        storage=content_addressed_storage)
     is_active = models.BooleanField(default=True)
     warranty_days = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -23,9 +25,20 @@ class Service(models.Model):
         max_length=255), default=list, blank=True)
     slug = models.SlugField(max_length=200, unique=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # thumbnails / responsive widths, see utils/image_derivatives.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            # rows sharing a deduplicated file (daytaask_backend.storage)
+            models.Index(fields=["image"], name="service_image_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # file write and row in one transaction, see QuoteImage.save()
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     def __str__(self):
         return self.name
@@ -1,11 +1,15 @@
 from rest_framework import serializers
 from services_app.models import Category
+from services_app.utils.image_derivatives import ImageDerivativesField
 
 
 class CategorySerializer(serializers.ModelSerializer):
     icon = serializers.ImageField(use_url=True, required=False)
     banner = serializers.ImageField(use_url=True, required=False)
+    icon_variants = ImageDerivativesField("icon")
+    banner_variants = ImageDerivativesField("banner")
 
     class Meta:
         model = Category
-        fields = ['id', 'name', 'description', 'icon', 'banner', 'is_active']
+        fields = ['id', 'name', 'description', 'icon', 'banner',
+                  'icon_variants', 'banner_variants', 'is_active']
@@ -1,20 +1,40 @@
+from django.db.models import Prefetch
 from rest_framework import serializers
-from services_app.models import Service
+from services_app.models import Addon, Service
 from services_app.serializers.addon import AddonSerializer
+from services_app.utils.image_derivatives import ImageDerivativesField
+
+
+def with_active_addons(queryset):
+    """
+    Prefetch active addons for every service in one query
+    (read by ServiceSerializer.get_addons).
+    """
+    return queryset.prefetch_related(
+        Prefetch(
+            "addons",
+            queryset=Addon.objects.filter(is_active=True),
+            to_attr="active_addons",
+        )
+    )
 
 
 class ServiceSerializer(serializers.ModelSerializer):
     image = serializers.ImageField(use_url=True, required=False)
+    image_variants = ImageDerivativesField("image")
     addons = serializers.SerializerMethodField()
 
     class Meta:
         model = Service
         fields = [
             'id', 'category', 'name', 'short_description', 'description',
-            'base_price', 'price_unit', 'duration_minutes', 'image',
+            'base_price', 'price_unit', 'duration_minutes', 'image', 'image_variants',
             'warranty_days', 'addons', 'is_active', 'whats_included',
         ]
 
     def get_addons(self, obj):
-        addons_qs = obj.addons.filter(is_active=True)
-        return AddonSerializer(addons_qs, many=True).data
+        addons = getattr(obj, "active_addons", None)
+        if addons is None:
+            # not prefetched (single object outside the catalog views)
+            addons = obj.addons.filter(is_active=True)
+        return AddonSerializer(addons, many=True).data
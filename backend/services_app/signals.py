@@ -0,0 +1,75 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from services_app.models import Addon, Category, Service
+from services_app.tasks import rebuild_catalog_snapshot
+from services_app.utils.catalog_snapshot import bump_catalog_version
+from services_app.utils.image_derivatives import (
+    queue_image_derivatives,
+    release_image,
+)
+
+
+# ==========================
+# CATALOG SNAPSHOT INVALIDATION
+# ==========================
+# queryset.update() skips these, call bump_catalog_version() after it.
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+@receiver(post_save, sender=Addon)
+@receiver(post_delete, sender=Addon)
+def invalidate_catalog_snapshot(sender, **kwargs):
+    transaction.on_commit(refresh_catalog_snapshot)
+
+
+def refresh_catalog_snapshot():
+    # after commit so the rebuild can't re-cache old rows; the bump
+    # itself never waits for a worker, only the re-warm does
+    bump_catalog_version()
+    rebuild_catalog_snapshot.delay()
+
+
+# ==========================
+# IMAGE DERIVATIVES
+# ==========================
+@receiver(post_save, sender=Service)
+def queue_service_image(sender, instance, **kwargs):
+    queue_image_derivatives(instance, "image")
+
+
+# ==========================
+# SHARED SERVICE IMAGES
+# ==========================
+# Service.image is deduplicated by content (daytaask_backend.storage):
+# a replaced or deleted image is released, not deleted outright.
+def _stored_image(service):
+    loaded = service.__dict__
+    if service.pk and "image" in loaded and "image_variants" in loaded:
+        return service.image.name, service.image_variants
+    return None
+
+
+@receiver(post_init, sender=Service)
+def remember_service_image(sender, instance, **kwargs):
+    instance._stored_image = _stored_image(instance)
+
+
+@receiver(post_save, sender=Service)
+def release_replaced_service_image(sender, instance, **kwargs):
+    stored = instance._stored_image
+    if stored and stored[0] != instance.image.name:
+        release_image(Service, "image", *stored)
+    instance._stored_image = _stored_image(instance)
+
+
+@receiver(post_delete, sender=Service)
+def delete_service_image_file(sender, instance, **kwargs):
+    release_image(Service, "image", instance.image.name, instance.image_variants)
+
+
+@receiver(post_save, sender=Category)
+def queue_category_images(sender, instance, **kwargs):
+    queue_image_derivatives(instance, "icon", "banner")
@@ -0,0 +1,45 @@
+# services_app/tasks.py
+
+from celery import shared_task
+from django.urls import reverse
+
+from services_app.utils.catalog_snapshot import (
+    bump_catalog_version,
+    snapshot_request,
+)
+from services_app.utils.image_derivatives import build_image_derivatives
+
+
+@shared_task
+def rebuild_catalog_snapshot():
+    """
+    Re-render the busiest responses for the canonical origin after a
+    catalog change (the version is bumped by the caller, on commit), so
+    visitors don't hit a cold cache. Everything else is rebuilt on
+    first request (single flight).
+    """
+    from services_app.views.category import CategoryListView
+    from services_app.views.service import HomePageAPI, ServiceListView
+
+    views = [
+        (HomePageAPI.as_view(), reverse("services-home")),
+        (CategoryListView.as_view(), reverse("service-categories")),
+        (ServiceListView.as_view(), reverse("service-list")),
+    ]
+    for view, path in views:
+        view(snapshot_request(path))
+
+
+@shared_task
+def generate_image_derivatives(label, pk, field):
+    """
+    Thumbnails / responsive widths for one uploaded image
+    (queued by queue_image_derivatives after commit).
+    """
+    built = build_image_derivatives(label, pk, field)
+
+    # stored with .update(): refresh the catalog snapshot ourselves
+    if built and label.startswith("services_app."):
+        bump_catalog_version()
+        rebuild_catalog_snapshot()
+    return built
@@ -0,0 +1,17 @@
+# services_app/tests/factories.py
+
+import itertools
+
+from services_app.models import Category, Service
+
+
+_sequence = itertools.count(1)
+
+
+def make_service(name="Deep clean", category=None, **fields):
+    """Active service (in a new "Cleaning" category unless given)."""
+    if category is None:
+        category = Category.objects.create(name="Cleaning")
+    fields.setdefault("slug", f"service-{next(_sequence)}")
+    fields.setdefault("base_price", 100)
+    return Service.objects.create(category=category, name=name, **fields)
@@ -0,0 +1,104 @@
+# services_app/tests/test_addon_prefetch.py
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from services_app.models import Addon, Category, Service
+from services_app.serializers.service import ServiceSerializer, with_active_addons
+from services_app.tests.factories import make_service
+from services_app.utils.catalog_snapshot import (
+    bump_catalog_version,
+    catalog_validators,
+)
+
+
+@override_settings(CATALOG_ORIGIN="http://testserver")
+class AddonPrefetchTests(TestCase):
+    """
+    Catalog endpoints load active addons with one prefetch query for
+    the whole page, not one query per service.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name="Cleaning")
+        cls.services = []
+        cls.add_services(3)
+
+    @classmethod
+    def add_services(cls, count):
+        for _ in range(count):
+            service = make_service(f"Service {len(cls.services)}", cls.category)
+            Addon.objects.bulk_create([
+                Addon(service=service, name="Balcony", price=50),
+                Addon(service=service, name="Windows", price=80),
+                Addon(service=service, name="Retired", price=10, is_active=False),
+            ])
+            cls.services.append(service)
+
+    def setUp(self):
+        # fresh snapshots; the validators' aggregates are not under test
+        bump_catalog_version()
+        catalog_validators()
+        self.client = APIClient()
+
+    def assertQueriesFlat(self, queries, fetch):
+        """Same count with 3 services and with 12."""
+        with self.assertNumQueries(queries):
+            first = fetch()
+        self.add_services(9)
+        bump_catalog_version()
+        catalog_validators()
+        with self.assertNumQueries(queries):
+            second = fetch()
+        return first, second
+
+    def get(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_serializer_reads_prefetched_active_addons(self):
+        def serialize():
+            services = with_active_addons(Service.objects.order_by("id"))
+            return ServiceSerializer(services, many=True).data
+
+        # services + addons
+        first, second = self.assertQueriesFlat(2, serialize)
+        self.assertEqual(len(second), 12)
+        for service in first:
+            self.assertEqual(
+                [addon["name"] for addon in service["addons"]],
+                ["Balcony", "Windows"],
+            )
+
+    def test_all_services(self):
+        # COUNT + page + addons, snapshot cold and uncached query
+        _, page = self.assertQueriesFlat(
+            3, lambda: self.get("/api/services/all-services/", page=1)
+        )
+        self.assertEqual(len(page["results"]), 10)
+        self.assertEqual(len(page["results"][0]["addons"]), 2)
+
+        with self.assertNumQueries(3):
+            self.get("/api/services/all-services/", page_size=20)
+        with self.assertNumQueries(0):  # snapshot
+            self.get("/api/services/all-services/", page=1)
+
+    def test_category_services(self):
+        url = f"/api/services/category/{self.category.id}/services/"
+        _, page = self.assertQueriesFlat(3, lambda: self.get(url, page=1))
+        self.assertEqual(page["count"], 12)
+
+    def test_service_detail(self):
+        service = self.services[0]
+        url = f"/api/services/services-detail/{service.id}/"
+        with self.assertNumQueries(2):  # service + addons
+            detail = self.get(url)
+        self.assertEqual(len(detail["addons"]), 2)
+
+    def test_home(self):
+        # services + addons + categories
+        _, home = self.assertQueriesFlat(3, lambda: self.get("/api/services/home/"))
+        self.assertEqual(len(home["top_services"]), 6)
+        self.assertEqual(len(home["top_services"][0]["addons"]), 2)
@@ -0,0 +1,56 @@
+# services_app/tests/test_catalog_snapshot.py
+
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from services_app.tests.factories import make_service
+from services_app.utils.catalog_snapshot import bump_catalog_version
+
+
+HOME_URL = "/api/services/home/"
+
+
+@override_settings(CATALOG_ORIGIN="http://testserver")
+@mock.patch("services_app.signals.rebuild_catalog_snapshot")
+class CatalogSnapshotTests(TestCase):
+    """
+    Public catalog responses are served from a versioned snapshot that
+    any catalog write invalidates.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = make_service()
+
+    def setUp(self):
+        bump_catalog_version()
+        self.client = APIClient()
+
+    def test_snapshot_hit_runs_no_queries(self, rebuild):
+        first = self.client.get(HOME_URL)
+        with self.assertNumQueries(0):
+            second = self.client.get(HOME_URL)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+
+    def test_service_save_invalidates_snapshot(self, rebuild):
+        self.client.get(HOME_URL)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.name = "Sofa shampoo"
+            self.service.save()
+
+        home = self.client.get(HOME_URL).json()
+        self.assertEqual(home["top_services"][0]["name"], "Sofa shampoo")
+        # the re-warm is queued, the bump didn't wait for it
+        rebuild.delay.assert_called_once_with()
+
+    def test_other_hosts_are_not_cached(self, rebuild):
+        self.client.get(HOME_URL, HTTP_HOST="evil.example")
+        with self.assertNumQueries(3):  # services + addons + categories
+            self.client.get(HOME_URL, HTTP_HOST="evil.example")
+        with self.assertNumQueries(3):  # canonical snapshot still cold
+            self.client.get(HOME_URL)
@@ -0,0 +1,56 @@
+# services_app/tests/test_conditional_get.py
+
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from services_app.models import Addon
+from services_app.tests.factories import make_service
+from services_app.utils.catalog_snapshot import bump_catalog_version
+
+
+HOME_URL = "/api/services/home/"
+CATEGORIES_URL = "/api/services/categories/"
+
+
+@override_settings(CATALOG_ORIGIN="http://testserver")
+@mock.patch("services_app.signals.rebuild_catalog_snapshot")
+class CatalogConditionalGetTests(TestCase):
+    """
+    Catalog responses carry an ETag built from the catalog state:
+    a matching If-None-Match is a 304 without touching the database,
+    any catalog write changes it.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.addon = Addon.objects.create(
+            service=make_service(), name="Balcony", price=50
+        )
+
+    def setUp(self):
+        bump_catalog_version()
+        self.client = APIClient()
+
+    def test_matching_if_none_match_is_304(self, rebuild):
+        etag = self.client.get(CATEGORIES_URL)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(CATEGORIES_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_addon_edit_changes_etag(self, rebuild):
+        etag = self.client.get(HOME_URL)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.addon.price = 60
+            self.addon.save()
+
+        response = self.client.get(HOME_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        addons = response.json()["top_services"][0]["addons"]
+        self.assertEqual(addons[0]["price"], "60.00")
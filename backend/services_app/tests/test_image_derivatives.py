@@ -0,0 +1,91 @@
+# services_app/tests/test_image_derivatives.py
+
+import shutil
+import tempfile
+from io import BytesIO
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIRequestFactory
+
+from daytaask_backend.storage import derivative_storage
+from services_app.models import Category
+from services_app.serializers.service import ServiceSerializer
+from services_app.tests.factories import make_service
+from services_app.utils.image_derivatives import (
+    build_image_derivatives,
+    delete_derivatives,
+)
+
+
+def photo(color, size=(1000, 700)):
+    buffer = BytesIO()
+    Image.new("RGB", size, color).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+@mock.patch("services_app.signals.rebuild_catalog_snapshot")
+@mock.patch("services_app.signals.queue_image_derivatives")
+@override_settings(
+    IMAGE_THUMBNAIL_SIZE=(32, 32), IMAGE_RESPONSIVE_WIDTHS=(480, 1600)
+)
+class ImageDerivativeTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name="Cleaning")
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def add_service(self, slug, content):
+        service = make_service(
+            slug, self.category, slug=slug,
+            image=ContentFile(content, name=f"{slug}.jpg"),
+        )
+        build_image_derivatives("services_app.Service", service.pk, "image")
+        service.refresh_from_db()
+        return service
+
+    def test_variants_are_named_after_the_source(self, queue, rebuild):
+        service = self.add_service("sofa", photo("red"))
+        base = service.image.name.rsplit(".", 1)[0]
+
+        self.assertEqual(service.image_variants, {
+            "source": service.image.name,
+            # 1600 is wider than the original: skipped
+            "thumb": {"webp": f"{base}__thumb.webp", "jpeg": f"{base}__thumb.jpg"},
+            "w480": {"webp": f"{base}__w480.webp", "jpeg": f"{base}__w480.jpg"},
+        })
+        with derivative_storage.open(f"{base}__w480.jpg") as f:
+            self.assertEqual(Image.open(f).size, (480, 336))
+
+    def test_serializer_urls(self, queue, rebuild):
+        service = self.add_service("sofa", photo("red"))
+        base = service.image.name.rsplit(".", 1)[0]
+        request = APIRequestFactory().get("/")
+
+        data = ServiceSerializer(service, context={"request": request}).data
+
+        self.assertEqual(
+            data["image_variants"]["thumb"]["webp"],
+            f"http://testserver/media/{base}__thumb.webp",
+        )
+        self.assertEqual(set(data["image_variants"]), {"thumb", "w480"})
+
+    def test_identical_thumbnails_of_different_sources_are_separate(self, queue, rebuild):
+        # same 32x32 crop from two different photos
+        first = self.add_service("sofa", photo("red"))
+        second = self.add_service("couch", photo("red", size=(1000, 701)))
+        self.assertNotEqual(first.image.name, second.image.name)
+
+        delete_derivatives(first.image_variants)
+
+        for path in second.image_variants["thumb"].values():
+            self.assertTrue(derivative_storage.exists(path))
@@ -0,0 +1,68 @@
+# services_app/tests/test_service_images.py
+
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+
+from daytaask_backend.storage import content_addressed_storage
+from services_app.models import Category, Service
+from services_app.tests.factories import make_service
+
+
+@mock.patch("services_app.signals.rebuild_catalog_snapshot")
+@mock.patch("services_app.signals.queue_image_derivatives")
+class SharedServiceImageTests(TestCase):
+    """
+    Service images are deduplicated: replacing or deleting one only
+    removes the file once no service shows it anymore.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name="Cleaning")
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def add_service(self, slug, content):
+        with self.captureOnCommitCallbacks(execute=True):
+            return make_service(
+                slug, self.category, slug=slug,
+                image=ContentFile(content, name=f"{slug}.jpg"),
+            )
+
+    def replace_image(self, service, content):
+        service = Service.objects.get(pk=service.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            service.image = ContentFile(content, name="new.jpg")
+            service.save()
+        return service
+
+    def test_replaced_image_is_released(self, queue, rebuild):
+        service = self.add_service("sofa", b"old photo")
+        old = service.image.name
+
+        service = self.replace_image(service, b"new photo")
+
+        self.assertFalse(content_addressed_storage.exists(old))
+        self.assertTrue(content_addressed_storage.exists(service.image.name))
+
+    def test_shared_image_survives_until_last_reference(self, queue, rebuild):
+        first = self.add_service("sofa", b"same photo")
+        second = self.add_service("couch", b"same photo")
+        name = first.image.name
+        self.assertEqual(second.image.name, name)
+
+        self.replace_image(first, b"new photo")
+        self.assertTrue(content_addressed_storage.exists(name))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Service.objects.get(pk=second.pk).delete()
+        self.assertFalse(content_addressed_storage.exists(name))
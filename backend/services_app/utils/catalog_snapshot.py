@@ -0,0 +1,142 @@
+# services_app/utils/catalog_snapshot.py
+
+import io
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.wsgi import WSGIRequest
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+
+from services_app.models import Addon, Category, Service
+from users_app.utils.conditional import weak_etag
+
+
+CATALOG_VERSION_KEY = "catalog:version"
+
+
+# ==========================
+# CATALOG VERSION
+# ==========================
+def get_catalog_version():
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, 1, timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY, 1)
+    return version
+
+
+def bump_catalog_version():
+    """
+    Invalidate every snapshot at once (category / service / addon
+    changed). Old blobs are never read again and simply expire.
+    """
+    cache.add(CATALOG_VERSION_KEY, 1, timeout=None)
+    return cache.incr(CATALOG_VERSION_KEY)
+
+
+# ==========================
+# CONDITIONAL GET VALIDATORS
+# ==========================
+def catalog_validators():
+    """
+    (weak ETag, Last-Modified) for every public catalog response, from
+    max(updated_at) + row count of categories / services / addons.
+    Cached per version, so revalidating is a cache read; the aggregates
+    only run once after each change.
+    """
+    key = f"catalog:{get_catalog_version()}:validators"
+    validators = cache.get(key)
+    if validators is not None:
+        return validators
+
+    parts, last_modified = [], None
+    for model in (Category, Service, Addon):
+        state = model.objects.aggregate(last=Max("updated_at"), count=Count("id"))
+        parts += [state["count"], state["last"]]
+        if state["last"] and (last_modified is None or state["last"] > last_modified):
+            last_modified = state["last"]
+
+    validators = (weak_etag("catalog", *parts), last_modified)
+    cache.set(key, validators, timeout=settings.CATALOG_CACHE_TIMEOUT)
+    return validators
+
+
+# ==========================
+# ORIGIN
+# ==========================
+# Image and pagination URLs are absolute, so a blob is only valid for
+# one origin. Only settings.CATALOG_ORIGIN is cached: the Host header
+# is client-controlled, keying on it would let anyone mint blobs.
+def request_origin(request):
+    return f"{request.scheme}://{request.get_host()}"
+
+
+def snapshot_request(path):
+    """GET request for `path` on the canonical origin (re-warming)."""
+    origin = urlsplit(settings.CATALOG_ORIGIN)
+    return WSGIRequest({
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "SERVER_NAME": origin.hostname,
+        "SERVER_PORT": str(origin.port or (443 if origin.scheme == "https" else 80)),
+        "HTTP_HOST": origin.netloc,
+        "wsgi.url_scheme": origin.scheme,
+        "wsgi.input": io.BytesIO(),
+    })
+
+
+def _snapshot_key(version, name):
+    return f"catalog:{version}:{name}"
+
+
+def _render(build):
+    data = build()
+    return None if data is None else JSONRenderer().render(data)
+
+
+# ==========================
+# SNAPSHOT READ / BUILD
+# ==========================
+def get_snapshot(request, name, build):
+    """
+    Rendered JSON bytes for one catalog response.
+    `build()` returns the response data, or None when the response
+    must not be cached (e.g. 404).
+
+    Single flight: on a miss only the request holding the build lock
+    queries / serializes; the others wait for its blob.
+    """
+    if request_origin(request) != settings.CATALOG_ORIGIN:
+        return _render(build)
+    key = _snapshot_key(get_catalog_version(), name)
+
+    blob = cache.get(key)
+    if blob is not None:
+        return blob
+
+    lock_key = f"{key}:lock"
+    if not cache.add(lock_key, 1, timeout=settings.CATALOG_BUILD_LOCK_TIMEOUT):
+        deadline = time.monotonic() + settings.CATALOG_BUILD_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            blob = cache.get(key)
+            if blob is not None:
+                return blob
+        # builder is slow or died: answer this request without caching
+        return _render(build)
+
+    try:
+        blob = _render(build)
+        if blob is not None:
+            cache.set(key, blob, timeout=settings.CATALOG_CACHE_TIMEOUT)
+        return blob
+    finally:
+        cache.delete(lock_key)
+
+
+def snapshot_response(blob):
+    return HttpResponse(blob, content_type="application/json")
@@ -0,0 +1,231 @@
+# services_app/utils/image_derivatives.py
+
+import os
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+from rest_framework import serializers
+
+from daytaask_backend.storage import derivative_storage, lock_blob, release_blob
+
+
+# format -> (file extension, Pillow save options)
+DERIVATIVE_FORMATS = {
+    "webp": ("webp", {"format": "WEBP", "method": 4}),
+    "jpeg": ("jpg", {"format": "JPEG", "optimize": True, "progressive": True}),
+}
+
+
+# ==========================
+# RENDERING
+# ==========================
+# Derivatives are saved next to the original as <name>__<variant>.<ext>
+# on derivative_storage, which keeps that name: a deduplicated source
+# (services/images/3f/3fa9...c2.jpg) gives one set of derivatives per
+# content, removed with the source. Recorded on the row as
+# <field>_variants:
+#   {"source": "services/images/3f/3fa9...c2.jpg",
+#    "thumb": {"webp": "...", "jpeg": "..."}, "w480": {...}, ...}
+def _open(field_file):
+    with field_file.storage.open(field_file.name) as f:
+        image = Image.open(f)
+        # JPEG: let the decoder downscale while reading (much cheaper)
+        largest = max(settings.IMAGE_RESPONSIVE_WIDTHS)
+        image.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        image.load()
+    return image
+
+
+def _encode(image, fmt):
+    extension, options = DERIVATIVE_FORMATS[fmt]
+    if fmt == "jpeg" and image.mode != "RGB":
+        # no alpha in JPEG: flatten transparent icons onto white
+        flat = Image.new("RGB", image.size, "white")
+        rgba = image.convert("RGBA")
+        flat.paste(rgba, mask=rgba.getchannel("A"))
+        image = flat
+    elif image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    buffer = BytesIO()
+    image.save(buffer, quality=settings.IMAGE_DERIVATIVE_QUALITY, **options)
+    return extension, buffer.getvalue()
+
+
+def _save(base, variant, image):
+    paths = {}
+    for fmt in DERIVATIVE_FORMATS:
+        extension, content = _encode(image, fmt)
+        paths[fmt] = derivative_storage.save(
+            f"{base}__{variant}.{extension}", ContentFile(content)
+        )
+    return paths
+
+
+def render_derivatives(field_file):
+    """
+    Thumbnail (cropped to IMAGE_THUMBNAIL_SIZE) plus one resize per
+    IMAGE_RESPONSIVE_WIDTHS narrower than the original, each as WebP
+    and JPEG. Returns the <field>_variants dict.
+    """
+    image = _open(field_file)
+    base = os.path.splitext(field_file.name)[0]
+
+    variants = {"source": field_file.name}
+    variants["thumb"] = _save(
+        base, "thumb",
+        ImageOps.fit(image, settings.IMAGE_THUMBNAIL_SIZE, Image.LANCZOS),
+    )
+
+    for width in settings.IMAGE_RESPONSIVE_WIDTHS:
+        if width >= image.width:
+            continue
+        height = round(image.height * width / image.width)
+        variants[f"w{width}"] = _save(
+            base, f"w{width}",
+            image.resize((width, height), Image.LANCZOS),
+        )
+    return variants
+
+
+def _paths(variants):
+    return {
+        path
+        for name, paths in variants.items() if name != "source"
+        for path in paths.values()
+    }
+
+
+def delete_derivatives(variants, keep=()):
+    for path in _paths(variants) - set(keep):
+        derivative_storage.delete(path)
+
+
+# ==========================
+# PIPELINE
+# ==========================
+def queue_image_derivatives(instance, *fields):
+    """
+    post_save helper: render derivatives for every image field whose
+    file changed, in Celery after commit, so uploads return at once.
+    """
+    from services_app.tasks import generate_image_derivatives
+
+    label, pk = instance._meta.label, instance.pk
+    for field in fields:
+        field_file = getattr(instance, field)
+        variants = getattr(instance, f"{field}_variants") or {}
+        if field_file and variants.get("source") != field_file.name:
+            transaction.on_commit(
+                lambda field=field: generate_image_derivatives.delay(label, pk, field)
+            )
+
+
+def release_image(model, field, name, variants):
+    """
+    post_delete / replacement helper for deduplicated image fields:
+    once the change commits, delete the file and its derivatives if no
+    row of `model` references it anymore (daytaask_backend.storage).
+    """
+    if not name:
+        return
+    storage = model._meta.get_field(field).storage
+    if (variants or {}).get("source") != name:
+        variants = {}  # rendered for another file, released with it
+
+    def release():
+        # derivatives go under the same lock as the source
+        with transaction.atomic():
+            if release_blob(storage, model, field, name):
+                delete_derivatives(variants)
+
+    transaction.on_commit(release)
+
+
+def build_image_derivatives(label, pk, field):
+    """
+    Render and record derivatives for one row / field. Returns False if
+    the row is gone or its image was replaced meanwhile (the newer
+    upload has its own job queued).
+    """
+    model = apps.get_model(label)
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None:
+        return False
+
+    field_file = getattr(instance, field)
+    variants_field = f"{field}_variants"
+    old_variants = getattr(instance, variants_field) or {}
+    if not field_file or old_variants.get("source") == field_file.name:
+        return False
+
+    # same file already rendered for another row (deduplicated upload)
+    shared = model.objects.filter(
+        **{field: field_file.name, f"{variants_field}__source": field_file.name}
+    ).exclude(pk=pk).values_list(variants_field, flat=True).first()
+    variants = shared or render_derivatives(field_file)
+
+    # .update(): no post_save, so no re-queue; only if still the same file
+    changes = {variants_field: variants}
+    if any(f.name == "updated_at" for f in model._meta.concrete_fields):
+        changes["updated_at"] = timezone.now()  # new ETag for clients
+    updated = model.objects.filter(pk=pk, **{field: field_file.name}).update(**changes)
+
+    if not updated:
+        if not shared:
+            _release_derivatives(model, field, variants, keep=_paths(old_variants))
+        return False
+    if old_variants:
+        # on a plain storage a re-upload with the same stem (sofa.jpg ->
+        # sofa.png) rewrites the same derivative names; keep those
+        _release_derivatives(model, field, old_variants, keep=_paths(variants))
+    return True
+
+
+def _release_derivatives(model, field, variants, keep=()):
+    # other rows may still show the same (deduplicated) source; same
+    # lock as release_blob() so a new upload of it can't slip in between
+    with transaction.atomic():
+        lock_blob(variants["source"])
+        if not model.objects.filter(**{field: variants["source"]}).exists():
+            delete_derivatives(variants, keep)
+
+
+# ==========================
+# SERIALIZER FIELD
+# ==========================
+class ImageDerivativesField(serializers.Field):
+    """
+    Absolute URLs of an image's derivatives:
+    {"thumb": {"webp": url, "jpeg": url}, "w480": {...}, ...}
+    Empty until the Celery job has run; clients use the original then.
+    """
+
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        field_file = getattr(instance, self.image_field)
+        variants = getattr(instance, f"{self.image_field}_variants") or {}
+        if not field_file or variants.get("source") != field_file.name:
+            return {}
+
+        request = self.context.get("request")
+        urls = {}
+        for name, paths in variants.items():
+            if name == "source":
+                continue
+            urls[name] = {}
+            for fmt, path in paths.items():
+                url = derivative_storage.url(path)
+                urls[name][fmt] = request.build_absolute_uri(url) if request else url
+        return urls
@@ -15,25 +15,16 @@ class AdminAddonViewSet(ModelViewSet):
     serializer_class = AddonSerializer
     lookup_field = "id"
 
-    def get_permissions(self):
-        permission_map = {
-            "list": "addon.view",
-            "retrieve": "addon.view",
-            "create": "addon.create",
-            "update": "addon.update",
-            "partial_update": "addon.update",
-            "destroy": "addon.delete",
-            "toggle_active": "addon.update",
-        }
-
-        perm = permission_map.get(self.action)
-
-        permissions = [IsAuthenticated()]
-
-        if perm:
-            permissions.append(HasCustomPermission())
-
-        return permissions
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        "list": "addon.view",
+        "retrieve": "addon.view",
+        "create": "addon.create",
+        "update": "addon.update",
+        "partial_update": "addon.update",
+        "destroy": "addon.delete",
+        "toggle_active": "addon.update",
+    }
 
     @action(detail=True, methods=["patch"])
     def toggle_active(self, request, id=None):
@@ -17,25 +17,16 @@ class AdminCategoryViewSet(ModelViewSet):
     serializer_class = CategorySerializer
     lookup_field = "id"
 
-    def get_permissions(self):
-        permission_map = {
-            "list": "category.view",
-            "retrieve": "category.view",
-            "create": "category.create",
-            "update": "category.update",
-            "partial_update": "category.update",
-            "destroy": "category.delete",
-            "toggle_active": "category.update",
-        }
-
-        perm = permission_map.get(self.action)
-
-        permissions = [IsAuthenticated()]
-
-        if perm:
-            permissions.append(HasCustomPermission())
-
-        return permissions
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        "list": "category.view",
+        "retrieve": "category.view",
+        "create": "category.create",
+        "update": "category.update",
+        "partial_update": "category.update",
+        "destroy": "category.delete",
+        "toggle_active": "category.update",
+    }
 
     @action(detail=True, methods=["patch"])
     def toggle_active(self, request, id=None):
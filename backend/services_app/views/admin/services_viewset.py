@@ -18,32 +18,22 @@ class AdminServiceViewSet(ModelViewSet):
     filter_backends = [SearchFilter]
     search_fields = ["name", "short_description", "description"]
 
-    def get_permissions(self):
-        permission_map = {
-            "list": "service.view",
-            "retrieve": "service.view",
-            "create": "service.create",
-            "update": "service.update",
-            "partial_update": "service.update",
-            "destroy": "service.delete",
-            "toggle_active": "service.update",
-        }
-
-        perm = permission_map.get(self.action)
-
-        if perm:
-            HasCustomPermission.required_permissions = perm
-
-        return [
-            IsAuthenticated(),
-            HasCustomPermission(),
-        ]
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        "list": "service.view",
+        "retrieve": "service.view",
+        "create": "service.create",
+        "update": "service.update",
+        "partial_update": "service.update",
+        "destroy": "service.delete",
+        "toggle_active": "service.update",
+    }
 
     @action(detail=True, methods=["patch"])
     def toggle_active(self, request, id=None):
         service = self.get_object()
         service.is_active = not service.is_active
-        service.save(update_fields=["is_active"])
+        service.save(update_fields=["is_active", "updated_at"])
 
         return Response(
             {
@@ -1,15 +1,25 @@
 from rest_framework.views import APIView
-from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from services_app.models import Category
 from services_app.serializers.category import CategorySerializer
+from services_app.utils.catalog_snapshot import (
+    catalog_validators,
+    get_snapshot,
+    snapshot_response,
+)
+from users_app.utils.conditional import conditional_response
 
 
 class CategoryListView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        categories = Category.objects.filter(is_active=True)
-        serializer = CategorySerializer(
-            categories, many=True, context={'request': request})
-        return Response(serializer.data)
+        def build():
+            categories = Category.objects.filter(is_active=True)
+            return CategorySerializer(
+                categories, many=True, context={'request': request}).data
+
+        return conditional_response(
+            request, *catalog_validators(),
+            lambda: snapshot_response(get_snapshot(request, "categories", build)),
+        )
@@ -2,11 +2,17 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework import generics
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from services_app.models.service import Service
 from services_app.models.category import Category
-from services_app.models.addon import Addon
-from services_app.serializers.service import ServiceSerializer
+from services_app.serializers.service import ServiceSerializer, with_active_addons
+from services_app.utils.catalog_snapshot import (
+    catalog_validators,
+    get_snapshot,
+    snapshot_response,
+)
+from users_app.utils.conditional import conditional_response
 
 # Pagination class can also be global via settings (shown later)
 
@@ -16,26 +22,71 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 100
 
+
+class SnapshotListMixin:
+    """
+    Serve ?page=N (default page size) as pre-rendered bytes from the
+    catalog snapshot; any other query falls through to the database.
+    Conditional GETs are answered with 304 before either.
+    """
+
+    def get_snapshot_name(self):
+        raise NotImplementedError
+
+    def list(self, request, *args, **kwargs):
+        return conditional_response(
+            request, *catalog_validators(),
+            lambda: self.snapshot_list(request, *args, **kwargs),
+        )
+
+    def snapshot_list(self, request, *args, **kwargs):
+        page = request.query_params.get("page", "1")
+        if set(request.query_params) - {"page"} or not page.isdigit():
+            return super().list(request, *args, **kwargs)
+
+        def build():
+            try:
+                return super(SnapshotListMixin, self).list(
+                    request, *args, **kwargs).data
+            except NotFound:
+                return None
+
+        blob = get_snapshot(
+            request, f"{self.get_snapshot_name()}:page:{page}", build)
+        if blob is None:
+            return super().list(request, *args, **kwargs)
+        return snapshot_response(blob)
+
 # All services with pagination (for "All Services" page)
 
 
-class ServiceListView(generics.ListAPIView):
+class ServiceListView(SnapshotListMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
-    queryset = Service.objects.filter(is_active=True).order_by('-created_at')
+    queryset = with_active_addons(
+        Service.objects.filter(is_active=True).order_by('-created_at')
+    )
     serializer_class = ServiceSerializer
     pagination_class = StandardResultsSetPagination
 
+    def get_snapshot_name(self):
+        return "services"
+
 # List services by category (paginated)
 
 
-class ServiceListByCategoryView(generics.ListAPIView):
+class ServiceListByCategoryView(SnapshotListMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     serializer_class = ServiceSerializer
     pagination_class = StandardResultsSetPagination
 
     def get_queryset(self):
         category_id = self.kwargs.get('category_id')
-        return Service.objects.filter(category_id=category_id, is_active=True).order_by('-created_at')
+        return with_active_addons(
+            Service.objects.filter(category_id=category_id, is_active=True).order_by('-created_at')
+        )
+
+    def get_snapshot_name(self):
+        return f"category:{self.kwargs.get('category_id')}:services"
 
 # Service detail view
 
@@ -44,13 +95,21 @@ class ServiceDetailView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request, service_id):
-        try:
-            service = Service.objects.get(id=service_id, is_active=True)
-        except Service.DoesNotExist:
-            return Response({"error": "Service not found"}, status=404)
-
-        serializer = ServiceSerializer(service, context={'request': request})
-        return Response(serializer.data)
+        def build():
+            try:
+                service = with_active_addons(Service.objects).get(
+                    id=service_id, is_active=True)
+            except Service.DoesNotExist:
+                return None
+            return ServiceSerializer(service, context={'request': request}).data
+
+        def respond():
+            blob = get_snapshot(request, f"service:{service_id}", build)
+            if blob is None:
+                return Response({"error": "Service not found"}, status=404)
+            return snapshot_response(blob)
+
+        return conditional_response(request, *catalog_validators(), respond)
 
 # Home page limited endpoint (no pagination, limited items)
 
@@ -59,16 +118,22 @@ class HomePageAPI(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        top_services = Service.objects.filter(
-            is_active=True).order_by('-created_at')[:6]
+        return conditional_response(
+            request, *catalog_validators(),
+            lambda: snapshot_response(
+                get_snapshot(request, "home", lambda: self.build(request))
+            ),
+        )
+
+    def build(self, request):
+        top_services = with_active_addons(Service.objects.filter(
+            is_active=True).order_by('-created_at'))[:6]
         categories = Category.objects.filter(
             is_active=True).order_by('name')[:8]
 
-        from services_app.serializers.service import ServiceSerializer
         from services_app.serializers.category import CategorySerializer
 
-        data = {
+        return {
             "top_services": ServiceSerializer(top_services, many=True, context={'request': request}).data,
             "categories": CategorySerializer(categories, many=True, context={'request': request}).data
         }
-        return Response(data)
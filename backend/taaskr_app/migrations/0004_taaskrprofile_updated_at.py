@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taaskr_app', '0003_alter_availability_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='taaskrprofile',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
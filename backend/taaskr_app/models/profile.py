@@ -14,6 +14,7 @@ class TaaskrProfile(models.Model):
     total_jobs = models.PositiveIntegerField(default=0)
 
     verified = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"id: {self.id}, TaaskrProfile({self.user}), user_id: {self.user.id}"
@@ -15,18 +15,14 @@ class AdminAvailabilityViewSet(viewsets.ModelViewSet):
         "taaskr__full_name", "taaskr__email",
     )
     serializer_class = AvailabilitySerializer
+    permission_classes = [IsAuthenticated, HasCustomPermission]
 
-    def get_permissions(self):
-        if self.action in ["list", "retrieve"]:
-            perm = "taaskr.availability.view"
-        elif self.action == "create":
-            perm = "taaskr.availability.create"
-        elif self.action in ["update", "partial_update"]:
-            perm = "taaskr.availability.update"
-        elif self.action == "destroy":
-            perm = "taaskr.availability.delete"
-        else:
-            perm = "taaskr.availability.view"
-
-        HasCustomPermission.required_permissions = perm
-        return [IsAuthenticated(), HasCustomPermission()]
+    permission_map = {
+        "list": "taaskr.availability.view",
+        "retrieve": "taaskr.availability.view",
+        "create": "taaskr.availability.create",
+        "update": "taaskr.availability.update",
+        "partial_update": "taaskr.availability.update",
+        "destroy": "taaskr.availability.delete",
+    }
+    required_permissions = "taaskr.availability.view"
@@ -19,8 +19,5 @@ class AdminAssignmentViewSet(ReadOnlyModelViewSet):
     )
 
     serializer_class = AssignmentListSerializer
-
-    def get_permissions(self):
-        permission_classes = [IsAuthenticated, HasCustomPermission]
-        HasCustomPermission.required_permissions = "booking.assign"
-        return [permission() for permission in permission_classes]
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    required_permissions = "booking.assign"
@@ -48,42 +48,29 @@ class AdminBookingViewSet(ModelViewSet):
 
         return BookingAdminDetailSerializer
 
-    def get_permissions(self):
-        if self.action in ["list", "retrieve"]:
-            permission_classes = [IsAuthenticated, HasCustomPermission]
-            HasCustomPermission.required_permissions = "booking.view"
-
-        elif self.action == "create":
-            permission_classes = [IsAuthenticated, HasCustomPermission]
-            HasCustomPermission.required_permissions = "booking.create"
-
-        elif self.action in ["update", "partial_update"]:
-            permission_classes = [IsAuthenticated, HasCustomPermission]
-            HasCustomPermission.required_permissions = "booking.update"
-
-        elif self.action == "assign_taaskr":
-            permission_classes = [IsAuthenticated, HasCustomPermission]
-            HasCustomPermission.required_permissions = "booking.assign"
-
-        else:
-            permission_classes = [IsAuthenticated]
-
-        return [permission() for permission in permission_classes]
+    # -------------------------
+    # PERMISSIONS
+    # -------------------------
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        "list": "booking.view",
+        "retrieve": "booking.view",
+        "create": "booking.create",
+        "update": "booking.update",
+        "partial_update": "booking.update",
+        "destroy": "booking.delete",
+        "assign_taaskr": "booking.assign",
+        "change_status": "booking.update",
+    }
 
     def perform_create(self, serializer):
         serializer.save()
 
-    @action(
-        detail=False,
-        methods=["post"],
-        permission_classes=[IsAuthenticated, HasCustomPermission],
-    )
+    @action(detail=False, methods=["post"])
     def assign_taaskr(self, request):
         """
         POST /api/bookings/admin/bookings/assign_taaskr/
         """
-        HasCustomPermission.required_permissions = "booking.assign"
-
         serializer = AssignTaaskrSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         booking = serializer.save()
@@ -93,20 +80,14 @@ class AdminBookingViewSet(ModelViewSet):
             status=status.HTTP_200_OK,
         )
 
-    # if request.data.get("auto_assign"):
-    #             # distance + availability logic
+    # auto assignment (distance + availability) lives in
+    # bookings_app.services.matching → admin/bookings/{id}/auto_assign/
 
-    @action(
-        detail=True,
-        methods=["patch"],
-        permission_classes=[IsAuthenticated, HasCustomPermission],
-    )
+    @action(detail=True, methods=["patch"])
     def change_status(self, request, pk=None):
         """
         PATCH /admin/bookings/{id}/change_status/
         """
-        HasCustomPermission.required_permissions = "booking.update"
-
         booking = self.get_object()
         new_status = request.data.get("status")
 
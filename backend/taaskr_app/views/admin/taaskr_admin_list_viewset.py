@@ -4,6 +4,7 @@ from rest_framework.permissions import IsAuthenticated
 from users_app.models import User
 from taaskr_app.serializers.admin.taaskr_admin_list_serializer import TaaskrAdminListSerializer
 from users_app.permissions import HasCustomPermission
+from users_app.authentication import ClaimsJWTAuthentication
 
 
 class TaaskrAdminListViewSet(ReadOnlyModelViewSet):
@@ -12,16 +13,14 @@ class TaaskrAdminListViewSet(ReadOnlyModelViewSet):
     Used in Assignment page for selection
     """
     serializer_class = TaaskrAdminListSerializer
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated, HasCustomPermission]
+    required_permissions = "booking.assign"
 
     def get_queryset(self):
-        HasCustomPermission.required_permissions = "booking.assign"
         # Only users with TaaskrProfile
         return User.objects.filter(taaskrprofile__isnull=False).select_related(
             "taaskrprofile"
         ).prefetch_related(
             "availabilities"
         ).order_by("-taaskrprofile__rating_avg", "full_name")
-
-    def get_permissions(self):
-        return [IsAuthenticated(), HasCustomPermission()]
@@ -11,6 +11,7 @@ from taaskr_app.serializers.register_taaskr_serializer import RegisterTaaskrSeri
 from taaskr_app.serializers.taaskr_serializer import TaaskrReadSerializer
 from taaskr_app.serializers.update_taaskr_serializer import UpdateTaaskrSerializer
 from users_app.permissions import HasCustomPermission
+from users_app.utils.conditional import conditional_response, weak_etag
 
 
 class TaaskrViewSet(ModelViewSet):
@@ -41,21 +42,21 @@ class TaaskrViewSet(ModelViewSet):
     # -------------------------
     # PERMISSIONS
     # -------------------------
+    permission_map = {
+        "list": "taaskr.view",
+        "retrieve": "taaskr.view",
+        "update": "taaskr.update",
+        "partial_update": "taaskr.update",
+        "destroy": "taaskr.delete",
+        "verify": "taaskr.verify",
+    }
+
     def get_permissions(self):
         if self.action == "create":
             permission_classes = [AllowAny]
 
-        elif self.action in ["list", "retrieve"]:
-            permission_classes = [IsAuthenticated, HasCustomPermission]
-            HasCustomPermission.required_permissions = "taaskr.view"
-
-        elif self.action in ["update", "partial_update"]:
-            permission_classes = [IsAuthenticated, HasCustomPermission]
-            HasCustomPermission.required_permissions = "taaskr.update"
-
-        elif self.action == "destroy":
+        elif self.action in self.permission_map:
             permission_classes = [IsAuthenticated, HasCustomPermission]
-            HasCustomPermission.required_permissions = "taaskr.delete"
 
         else:
             permission_classes = [IsAuthenticated]
@@ -113,28 +114,32 @@ class TaaskrViewSet(ModelViewSet):
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     def me(self, request):
-        profile = get_object_or_404(TaaskrProfile, user=request.user)
-        serializer = TaaskrReadSerializer(profile)
-        return Response(serializer.data)
+        user = request.user
+        profile_updated_at = get_object_or_404(
+            TaaskrProfile.objects.values_list("updated_at", flat=True), user=user
+        )
+        etag = weak_etag("taaskr", user.pk, user.updated_at, profile_updated_at)
+
+        def build():
+            profile = TaaskrProfile.objects.select_related("user").get(user=user)
+            return Response(TaaskrReadSerializer(profile).data)
+
+        return conditional_response(
+            request, etag, max(user.updated_at, profile_updated_at), build
+        )
 
    # -------------------------
     # VERIFY TAASKR ENDPOINT
     # -------------------------
-    @action(
-        detail=True,
-        methods=["patch"],
-        permission_classes=[IsAuthenticated, HasCustomPermission],
-    )
+    @action(detail=True, methods=["patch"])
     def verify(self, request, pk=None):
         """
         PATCH /taaskrcrud/{id}/verify/
         Toggle taaskr verification status
         """
-        HasCustomPermission.required_permissions = "taaskr.verify"
-
         taaskr = self.get_object()
         taaskr.verified = not taaskr.verified
-        taaskr.save(update_fields=["verified"])
+        taaskr.save(update_fields=["verified", "updated_at"])
 
         return Response(
             {
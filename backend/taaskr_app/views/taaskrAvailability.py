@@ -11,22 +11,20 @@ from users_app.permissions import HasCustomPermission
 
 class AvailabilityViewSet(viewsets.ModelViewSet):
     serializer_class = AvailabilitySerializer
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        "list": "taaskr_availability.view",
+        "retrieve": "taaskr_availability.view",
+        "create": "taaskr_availability.change",
+        "update": "taaskr_availability.change",
+        "partial_update": "taaskr_availability.change",
+        "destroy": "taaskr_availability.change",
+    }
 
     def get_queryset(self):
         """Only return availability for the current authenticated taaskr"""
         return Availability.objects.filter(taaskr=self.request.user)
 
-    def get_permissions(self):
-        """Apply custom permissions based on action"""
-        if self.action in ["list", "retrieve"]:
-            HasCustomPermission.required_permissions = "taaskr_availability.view"
-            return [IsAuthenticated(), HasCustomPermission()]
-        elif self.action in ["create", "update", "partial_update", "destroy"]:
-            HasCustomPermission.required_permissions = "taaskr_availability.change"
-            return [IsAuthenticated(), HasCustomPermission()]
-        return [IsAuthenticated()]
-
     def perform_create(self, serializer):
         """Ensure taaskr is set to current user"""
         serializer.save(taaskr=self.request.user)
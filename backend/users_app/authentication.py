@@ -1,4 +1,20 @@
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from users_app.utils.rbac import get_rbac_version, decode_permission_bitmap
+from users_app.utils.tokens import (
+    RBAC_VERSION_CLAIM,
+    ROLES_CLAIM,
+    PERMISSIONS_CLAIM,
+)
+from users_app.utils.user_cache import (
+    get_cached_user,
+    set_cached_user,
+    record_auth_event,
+)
 
 
 class CookieJWTAuthentication(JWTAuthentication):
@@ -10,7 +26,98 @@ class CookieJWTAuthentication(JWTAuthentication):
 
         try:
             validated_token = self.get_validated_token(access_token)
-            user = self.get_user(validated_token)
-            return (user, validated_token)
-        except:
+        except InvalidToken:
+            record_auth_event("invalid_token")
+            return None
+
+        try:
+            user = self.get_cached_or_db_user(validated_token)
+        except (InvalidToken, AuthenticationFailed):
+            # unknown / inactive user → treat as anonymous
+            record_auth_event("auth_failed")
+            return None
+
+        return (user, validated_token)
+
+    def get_cached_or_db_user(self, validated_token):
+        """
+        User row cached per (user id, jti) for AUTH_USER_CACHE_TIMEOUT,
+        dropped whenever the user is saved (users_app.signals).
+        Falls back to the DB when the cache is unreachable.
+        """
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+
+        if user_id is None or jti is None:
+            return self.get_user(validated_token)
+
+        user, generation = get_cached_user(user_id, jti)
+        if user is not None:
+            record_auth_event("hit")
+            return user
+
+        record_auth_event("miss")
+        user = self.get_user(validated_token)
+        set_cached_user(user, jti, generation)
+        return user
+
+
+class ClaimsUser(TokenUser):
+    """
+    Lightweight request.user built from access token claims.
+    Only for endpoints that never need the User row itself.
+    """
+
+    def __init__(self, token, permissions):
+        super().__init__(token)
+        # picked up by users_app.utils.rbac.get_user_permission_set
+        self._rbac_permissions = permissions
+
+    @property
+    def role_ids(self):
+        return self.token.get(ROLES_CLAIM, [])
+
+
+class ClaimsJWTAuthentication(CookieJWTAuthentication):
+    """
+    Permission checks without RBAC queries for read-only admin endpoints.
+
+    Tokens minted with RBAC_TOKEN_CLAIMS carry the permission bitmap;
+    those are trusted only while their RBAC version is current.
+    The user row still goes through the per-token user cache, so a
+    deactivated user (save bumps its generation) is rejected at once;
+    on a warm cache this costs no query.
+    Tokens without claims get the normal cached user.
+    """
+
+    def authenticate(self, request):
+        access_token = request.COOKIES.get("access_token")
+
+        if not access_token:
             return None
+
+        try:
+            validated_token = self.get_validated_token(access_token)
+        except InvalidToken:
+            record_auth_event("invalid_token")
+            return None
+
+        try:
+            # raises for unknown / inactive users, like the DB lookup
+            user = self.get_cached_or_db_user(validated_token)
+        except (InvalidToken, AuthenticationFailed):
+            record_auth_event("auth_failed")
+            return None
+
+        if PERMISSIONS_CLAIM not in validated_token:
+            return (user, validated_token)
+
+        version = get_rbac_version()
+        if validated_token.get(RBAC_VERSION_CLAIM) != version:
+            # roles/permissions changed since minting → force a refresh
+            raise InvalidToken("Token permissions are out of date")
+
+        permissions = decode_permission_bitmap(
+            validated_token[PERMISSIONS_CLAIM], version
+        )
+        return (ClaimsUser(validated_token, permissions), validated_token)
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:24
+
+from django.db import migrations, models
+
+from users_app.utils.geo import geohash_encode
+
+
+def backfill_geohash(apps, schema_editor):
+    Address = apps.get_model('users_app', 'Address')
+
+    batch = []
+    for address in Address.objects.filter(
+        latitude__isnull=False, longitude__isnull=False
+    ).only('id', 'latitude', 'longitude').iterator(chunk_size=2000):
+        address.geohash = geohash_encode(address.latitude, address.longitude)
+        batch.append(address)
+        if len(batch) >= 2000:
+            Address.objects.bulk_update(batch, ['geohash'])
+            batch = []
+
+    if batch:
+        Address.objects.bulk_update(batch, ['geohash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users_app', '0002_user_is_available'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='address',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=12),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
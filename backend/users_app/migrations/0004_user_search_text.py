@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:38
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users_app', '0003_address_geohash'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='user',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunSQL(
+            "UPDATE users_app_user"
+            " SET search_text = lower(concat_ws(' ', full_name, email, phone))",
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_text'], name='user_search_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
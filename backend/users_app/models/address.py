@@ -1,6 +1,8 @@
 # users_app/models/address.py
 from django.db import models
 
+from users_app.utils.geo import geohash_encode
+
 
 class Address(models.Model):
     user = models.ForeignKey(
@@ -17,5 +19,23 @@ class Address(models.Model):
     longitude = models.DecimalField(
         max_digits=9, decimal_places=6, null=True, blank=True)
 
+    # kept in step with latitude/longitude on save (proximity search)
+    geohash = models.CharField(
+        max_length=12, blank=True, default="", db_index=True, editable=False)
+
+    def save(self, *args, **kwargs):
+        if self.latitude is not None and self.longitude is not None:
+            self.geohash = geohash_encode(self.latitude, self.longitude)
+        else:
+            self.geohash = ""
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and (
+            {"latitude", "longitude"} & set(update_fields)
+        ):
+            kwargs["update_fields"] = set(update_fields) | {"geohash"}
+
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.label} - {self.user} - "
@@ -6,6 +6,7 @@ from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.utils import timezone
 
 from users_app.managers.user_manager import UserManager
+from users_app.utils.search import search_document, search_index
 
 
 class User(AbstractBaseUser, PermissionsMixin):
@@ -31,6 +32,9 @@ class User(AbstractBaseUser, PermissionsMixin):
     updated_at = models.DateTimeField(auto_now=True)
     is_available = models.BooleanField(default=True)
 
+    # lowercased name / email / phone for admin search (pg_trgm)
+    search_text = models.TextField(blank=True, default="", editable=False)
+
     # Custom manager
     objects = UserManager()
 
@@ -38,5 +42,21 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
 
+    class Meta:
+        indexes = [search_index("user_search_trgm_idx")]
+
+    def save(self, *args, **kwargs):
+        self.search_text = search_document(
+            self.full_name, self.email, self.phone
+        )
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and (
+            {"full_name", "email", "phone"} & set(update_fields)
+        ):
+            kwargs["update_fields"] = set(update_fields) | {"search_text"}
+
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.id} - {self.full_name} - {self.email} - {self.phone}"
@@ -1,11 +1,33 @@
 from rest_framework.permissions import BasePermission
-from users_app.utils.rbac import user_has_permission
+from users_app.utils.rbac import user_has_permissions
+
+
+def get_required_permissions(view):
+    """
+    Permission code(s) a view declares for the current action.
+
+    - permission_map = {"list": "booking.view", ...}   per action
+    - required_permissions = "booking.assign"          whole view / fallback
+    """
+    permission_map = getattr(view, "permission_map", None) or {}
+    action = getattr(view, "action", None)
+
+    if action in permission_map:
+        return permission_map[action]
+
+    return getattr(view, "required_permissions", None)
 
 
 class HasCustomPermission(BasePermission):
-    required_permissions = None
+    """
+    Resolved per request from the view's declarations, nothing is
+    stored on this class → safe under threaded / ASGI workers.
+    A list of codes means all of them are required; an action the view
+    declares nothing for is denied.
+    """
 
     def has_permission(self, request, view):
-        if not self.required_permissions:
-            return True
-        return user_has_permission(request.user, self.required_permissions)
+        required = get_required_permissions(view)
+        if not required:
+            return False
+        return user_has_permissions(request.user, required)
@@ -0,0 +1,36 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from users_app.models import User, Role, UserRole, Permission, RolePermission
+from users_app.utils.rbac import bump_rbac_version
+from users_app.utils.user_cache import invalidate_cached_user
+
+
+# ==========================
+# RBAC CACHE INVALIDATION
+# ==========================
+# bulk_create / queryset.update() skip these signals,
+# call bump_rbac_version() explicitly after them.
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+@receiver(post_save, sender=Permission)
+@receiver(post_delete, sender=Permission)
+@receiver(post_save, sender=RolePermission)
+@receiver(post_delete, sender=RolePermission)
+def invalidate_rbac_cache(sender, **kwargs):
+    # bump after commit so a concurrent request can't re-cache old rows
+    transaction.on_commit(bump_rbac_version)
+
+
+# ==========================
+# AUTHENTICATED USER CACHE
+# ==========================
+# e.g. toggle_active, ChangePasswordView, profile edits
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_cached_user(user_id))
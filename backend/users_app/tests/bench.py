@@ -0,0 +1,260 @@
+# users_app/tests/bench.py
+#
+# Benchmarks. Not part of the default test run (module name doesn't
+# match test*.py); run explicitly:
+#
+#     python manage.py test users_app.tests.bench
+#     python manage.py test users_app.tests.bench.ProximityBenchmark
+#
+# Login burst: LOGIN_BENCH_COUNT / LOGIN_BENCH_RATE / LOGIN_BENCH_THREADS
+# resize it. MD5 hashing keeps the numbers about the login path itself:
+# password hashing costs the same per CPU before and after the RBAC work.
+#
+# Proximity: PROXIMITY_BENCH_ADDRESSES (default 1M) synthetic addresses,
+# PROXIMITY_BENCH_QUERIES searches per radius.
+
+import os
+import random
+import statistics
+import threading
+import time
+
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from taaskr_app.models import TaaskrProfile
+from users_app.models import (
+    Address,
+    Permission,
+    Role,
+    RolePermission,
+    User,
+    UserRole,
+)
+from users_app.utils.geo import (
+    distance_km_expression,
+    geohash_encode,
+    within_radius,
+)
+from users_app.utils.rbac import bump_rbac_version
+
+
+LOGIN_URL = "/api/users/login/"
+BENCH_COUNT = int(os.getenv("LOGIN_BENCH_COUNT", "500"))
+BENCH_RATE = int(os.getenv("LOGIN_BENCH_RATE", "500"))  # logins / second
+BENCH_THREADS = int(os.getenv("LOGIN_BENCH_THREADS", "32"))
+BENCH_USERS = 50
+
+PROXIMITY_ADDRESSES = int(os.getenv("PROXIMITY_BENCH_ADDRESSES", "1000000"))
+PROXIMITY_QUERIES = int(os.getenv("PROXIMITY_BENCH_QUERIES", "200"))
+PROXIMITY_RADII_KM = (2, 10, 25)
+ADDRESSES_PER_USER = 10
+TAASKR_EVERY = 10  # one user in ten has a taaskr profile
+
+# (lat, lng) of the cities most addresses cluster around
+CITIES = [
+    (19.0760, 72.8777), (28.7041, 77.1025), (12.9716, 77.5946),
+    (22.5726, 88.3639), (13.0827, 80.2707), (17.3850, 78.4867),
+    (18.5204, 73.8567), (23.0225, 72.5714), (26.9124, 75.7873),
+    (21.1702, 72.8311),
+]
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+class LoginBurstBenchmark(TransactionTestCase):
+
+    def setUp(self):
+        roles = []
+        for n in range(3):
+            role = Role.objects.create(name=f"bench-role-{n}", is_admin_role=True)
+            for code in range(10):
+                permission, _ = Permission.objects.get_or_create(
+                    code_name=f"bench.{n}.{code}"
+                )
+                RolePermission.objects.create(role=role, permission=permission)
+            roles.append(role)
+
+        self.emails = []
+        for n in range(BENCH_USERS):
+            user = User.objects.create_user(
+                email=f"bench{n}@example.com", password="secret"
+            )
+            for role in roles[: n % 3 + 1]:
+                UserRole.objects.create(user=user, role=role)
+            self.emails.append(user.email)
+
+        bump_rbac_version()
+
+    def login(self, client, email):
+        client.cookies.clear()
+        return client.post(
+            LOGIN_URL, {"email": email, "password": "secret"}, format="json"
+        )
+
+    def test_login_burst(self):
+        client = APIClient()
+
+        # queries per login, cold then warm RBAC cache
+        with CaptureQueriesContext(connection) as cold:
+            self.login(client, self.emails[0])
+        with CaptureQueriesContext(connection) as warm:
+            self.login(client, self.emails[0])
+
+        # burst: login i is due at i / BENCH_RATE seconds; latency is
+        # measured from when it was due, so queueing counts
+        bump_rbac_version()
+        latencies, statuses = [], []
+        lock = threading.Lock()
+        start = time.perf_counter() + 0.1
+
+        def worker(offset):
+            client = APIClient()
+            try:
+                for i in range(offset, BENCH_COUNT, BENCH_THREADS):
+                    due = start + i / BENCH_RATE
+                    time.sleep(max(0, due - time.perf_counter()))
+                    response = self.login(client, self.emails[i % BENCH_USERS])
+                    with lock:
+                        latencies.append(time.perf_counter() - due)
+                        statuses.append(response.status_code)
+            finally:
+                connections.close_all()
+
+        threads = [
+            threading.Thread(target=worker, args=(n,))
+            for n in range(BENCH_THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(statuses, [200] * BENCH_COUNT)
+
+        latencies.sort()
+        print(
+            f"\nqueries/login: {len(cold)} cold RBAC cache, {len(warm)} warm\n"
+            f"{BENCH_COUNT} logins due at {BENCH_RATE}/s, {BENCH_THREADS} threads: "
+            f"done in {elapsed:.2f}s ({BENCH_COUNT / elapsed:.0f}/s), "
+            f"p50 {statistics.median(latencies) * 1000:.1f}ms, "
+            f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f}ms, "
+            f"max {latencies[-1] * 1000:.1f}ms"
+        )
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+class ProximityBenchmark(TestCase):
+    """
+    within_radius() over PROXIMITY_ADDRESSES addresses: 80% clustered
+    around ten cities, 20% spread over the country. Compared with the
+    same haversine filter without the geohash / bounding-box prefilter
+    (a full scan).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(12)
+        started = time.perf_counter()
+
+        user_count = max(PROXIMITY_ADDRESSES // ADDRESSES_PER_USER, 1)
+        users = User.objects.bulk_create(
+            (User(email=f"geo{n}@example.com") for n in range(user_count)),
+            batch_size=10000,
+        )
+        TaaskrProfile.objects.bulk_create(
+            (TaaskrProfile(user=user) for user in users[::TAASKR_EVERY]),
+            batch_size=10000,
+        )
+
+        def point():
+            if rng.random() < 0.8:
+                lat, lng = rng.choice(CITIES)
+                return rng.gauss(lat, 0.15), rng.gauss(lng, 0.15)
+            return rng.uniform(8.0, 35.0), rng.uniform(68.0, 97.0)
+
+        batch = []
+        for n in range(PROXIMITY_ADDRESSES):
+            lat, lng = point()
+            lat, lng = round(lat, 6), round(lng, 6)
+            batch.append(Address(
+                user=users[n % user_count],
+                street="x", city="x", state="x", pincode="x",
+                latitude=lat, longitude=lng,
+                geohash=geohash_encode(lat, lng),
+            ))
+            if len(batch) == 10000:
+                Address.objects.bulk_create(batch)
+                batch = []
+        Address.objects.bulk_create(batch)
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE users_app_address")
+
+        cls.load_seconds = time.perf_counter() - started
+        cls.points = [
+            (rng.gauss(lat, 0.1), rng.gauss(lng, 0.1))
+            for lat, lng in (
+                rng.choice(CITIES) for _ in range(PROXIMITY_QUERIES)
+            )
+        ]
+
+    def search(self, lat, lng, radius_km):
+        # the nearby_taaskrs query, fully fetched
+        return list(within_radius(
+            Address.objects.filter(
+                user__taaskrprofile__isnull=False,
+            ).select_related("user", "user__taaskrprofile"),
+            lat, lng, radius_km,
+        ))
+
+    def full_scan(self, lat, lng, radius_km):
+        return list(
+            Address.objects.filter(user__taaskrprofile__isnull=False)
+            .select_related("user", "user__taaskrprofile")
+            .annotate(distance_km=distance_km_expression(lat, lng))
+            .filter(distance_km__lte=radius_km)
+            .order_by("distance_km")
+        )
+
+    def test_radius_search(self):
+        lines = [
+            f"\n{PROXIMITY_ADDRESSES} addresses loaded in "
+            f"{self.load_seconds:.1f}s"
+        ]
+
+        for radius_km in PROXIMITY_RADII_KM:
+            latencies, rows = [], []
+            for lat, lng in self.points:
+                started = time.perf_counter()
+                found = self.search(lat, lng, radius_km)
+                latencies.append(time.perf_counter() - started)
+                rows.append(len(found))
+
+            # same answer as the unindexed query
+            lat, lng = self.points[0]
+            baseline_started = time.perf_counter()
+            baseline = self.full_scan(lat, lng, radius_km)
+            baseline_seconds = time.perf_counter() - baseline_started
+            self.assertEqual(
+                [a.pk for a in self.search(lat, lng, radius_km)],
+                [a.pk for a in baseline],
+            )
+
+            lines.append(
+                f"{radius_km:>3} km: {len(self.points)} searches, "
+                f"avg {statistics.mean(rows):.0f} taaskr addresses, "
+                f"p50 {statistics.median(latencies) * 1000:.1f}ms, "
+                f"p95 {_percentile(latencies, 0.95) * 1000:.1f}ms "
+                f"(full scan {baseline_seconds * 1000:.0f}ms)"
+            )
+
+        print("\n".join(lines))
@@ -0,0 +1,36 @@
+# users_app/tests/factories.py
+#
+# Test data shared by every app's tests. Emails are numbered, so each
+# helper can be called any number of times in one test.
+
+import itertools
+
+from users_app.models import Address, Permission, Role, RolePermission, User, UserRole
+
+
+_sequence = itertools.count(1)
+
+
+def make_user(full_name="", **fields):
+    fields.setdefault("email", f"user{next(_sequence)}@example.com")
+    return User.objects.create_user(password="x", full_name=full_name, **fields)
+
+
+def make_admin(email, codes):
+    admin = User.objects.create_user(email=email, password="x", full_name="Admin")
+    role = Role.objects.create(name=f"role-{email}", is_admin_role=True)
+    UserRole.objects.create(user=admin, role=role)
+    for code in codes:
+        permission, _ = Permission.objects.get_or_create(code_name=code)
+        RolePermission.objects.create(role=role, permission=permission)
+    return admin
+
+
+def make_address(user, at=None, **fields):
+    """Pune street address; `at` = (latitude, longitude)."""
+    if at is not None:
+        fields["latitude"], fields["longitude"] = at
+    return Address.objects.create(
+        user=user, street="1 Main St", city="Pune", state="MH",
+        pincode="411001", **fields,
+    )
@@ -0,0 +1,86 @@
+# users_app/tests/test_login.py
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from users_app.models import Permission, Role, RolePermission, User, UserRole
+from users_app.utils.rbac import bump_rbac_version, get_login_context
+
+
+LOGIN_URL = "/api/users/login/"
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+class LoginQueryCountTests(TestCase):
+    """
+    A login is the authenticate() user query plus at most one RBAC
+    query (roles LEFT JOIN permissions); none with a warm RBAC cache.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="login@example.com", password="secret", full_name="Login"
+        )
+        for name, codes in (("support", ["booking.view"]),
+                            ("ops", ["booking.view", "booking.assign"])):
+            role = Role.objects.create(name=name, is_admin_role=True)
+            UserRole.objects.create(user=cls.user, role=role)
+            for code in codes:
+                permission, _ = Permission.objects.get_or_create(code_name=code)
+                RolePermission.objects.create(role=role, permission=permission)
+
+    def setUp(self):
+        # start every test on a cold RBAC cache
+        bump_rbac_version()
+        self.client = APIClient()
+
+    def login(self):
+        return self.client.post(
+            LOGIN_URL,
+            {"email": "login@example.com", "password": "secret"},
+            format="json",
+        )
+
+    def test_login_cold_rbac_cache(self):
+        with self.assertNumQueries(2):
+            response = self.login()
+
+        self.assertEqual(response.status_code, 200)
+        user = response.json()["user"]
+        self.assertCountEqual(
+            [role["role__name"] for role in user["roles"]], ["support", "ops"]
+        )
+        self.assertCountEqual(
+            user["permissions"], ["booking.view", "booking.assign"]
+        )
+
+    def test_login_warm_rbac_cache(self):
+        self.login()
+        self.client.cookies.clear()  # a fresh client, not a re-login
+
+        with self.assertNumQueries(1):
+            response = self.login()
+        self.assertEqual(response.status_code, 200)
+
+    def test_wrong_password(self):
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                LOGIN_URL,
+                {"email": "login@example.com", "password": "nope"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 401)
+
+    def test_login_context(self):
+        with self.assertNumQueries(1):
+            cold = get_login_context(self.user)
+        with self.assertNumQueries(0):
+            warm = get_login_context(self.user)
+
+        self.assertEqual(cold["permissions"], warm["permissions"])
+        self.assertEqual(
+            self.user._rbac_permissions, {"booking.view", "booking.assign"}
+        )
@@ -0,0 +1,37 @@
+# users_app/tests/test_permissions.py
+
+from types import SimpleNamespace
+
+from django.test import TestCase
+
+from users_app.models import Permission, Role, RolePermission, User, UserRole
+from users_app.permissions import HasCustomPermission
+from users_app.utils.rbac import bump_rbac_version
+
+
+class HasCustomPermissionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="staff@example.com", password="x")
+        role = Role.objects.create(name="support", is_admin_role=True)
+        UserRole.objects.create(user=cls.user, role=role)
+        permission = Permission.objects.create(code_name="booking.view")
+        RolePermission.objects.create(role=role, permission=permission)
+
+    def setUp(self):
+        bump_rbac_version()
+
+    def allowed(self, **view):
+        request = SimpleNamespace(user=self.user)
+        view = SimpleNamespace(action="list", **view)
+        return HasCustomPermission().has_permission(request, view)
+
+    def test_declared_permissions_are_checked(self):
+        self.assertTrue(self.allowed(required_permissions="booking.view"))
+        self.assertFalse(self.allowed(required_permissions="booking.assign"))
+        self.assertTrue(self.allowed(permission_map={"list": "booking.view"}))
+
+    def test_undeclared_action_is_denied(self):
+        self.assertFalse(self.allowed())
+        self.assertFalse(self.allowed(permission_map={"retrieve": "booking.view"}))
@@ -0,0 +1,42 @@
+# users_app/utils/conditional.py
+
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+# ==========================
+# VALIDATORS
+# ==========================
+# Built from max(updated_at) + row counts (a delete lowers the count
+# without touching any updated_at), so checking them never serializes.
+def weak_etag(*parts):
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _timestamp(last_modified):
+    return int(last_modified.timestamp()) if last_modified else None
+
+
+# ==========================
+# CONDITIONAL GET
+# ==========================
+def conditional_response(request, etag, last_modified, build):
+    """
+    304 (no body) when If-None-Match / If-Modified-Since still match,
+    otherwise `build()`. 200 responses carry ETag / Last-Modified.
+    """
+    response = get_conditional_response(
+        request, etag=etag, last_modified=_timestamp(last_modified)
+    )
+    if response is None:
+        response = build()
+        if response.status_code != 200:
+            return response
+
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(_timestamp(last_modified))
+    return response
@@ -0,0 +1,147 @@
+# users_app/utils/geo.py
+
+import math
+
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import ASin, Cast, Cos, Power, Radians, Sin, Sqrt
+
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.0
+
+GEOHASH_PRECISION = 9  # ~5m cells, stored on Address
+GEOHASH_MAX_PREFIXES = 16  # cells OR-ed together in one proximity query
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+# ==========================
+# GEOHASH
+# ==========================
+def geohash_encode(lat, lng, precision=GEOHASH_PRECISION):
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    lat, lng = float(lat), float(lng)
+
+    chars = []
+    bits, bit_count, even = 0, 0, True
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            if lng >= mid:
+                bits = bits << 1 | 1
+                lng_lo = mid
+            else:
+                bits <<= 1
+                lng_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                bits = bits << 1 | 1
+                lat_lo = mid
+            else:
+                bits <<= 1
+                lat_hi = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits, bit_count = 0, 0
+
+    return "".join(chars)
+
+
+def geohash_cell_size(precision):
+    """(lat degrees, lng degrees) covered by one cell."""
+    total_bits = 5 * precision
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+
+
+def bounding_box(lat, lng, radius_km):
+    """(min_lat, max_lat, min_lng, max_lng) around a point."""
+    lat_delta = radius_km / KM_PER_DEGREE
+    # widest longitude span is at the poleward edge
+    edge_lat = min(abs(lat) + lat_delta, 89.9)
+    lng_delta = radius_km / (
+        KM_PER_DEGREE * math.cos(math.radians(edge_lat))
+    )
+    return (
+        max(lat - lat_delta, -90.0),
+        min(lat + lat_delta, 90.0),
+        max(lng - lng_delta, -180.0),
+        min(lng + lng_delta, 180.0),
+    )
+
+
+def covering_geohashes(box, max_cells=GEOHASH_MAX_PREFIXES):
+    """
+    Smallest set of geohash prefixes (finest precision that stays
+    under max_cells) whose cells cover the bounding box.
+    """
+    min_lat, max_lat, min_lng, max_lng = box
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_step, lng_step = geohash_cell_size(precision)
+        rows = math.floor(max_lat / lat_step) - math.floor(min_lat / lat_step) + 1
+        cols = math.floor(max_lng / lng_step) - math.floor(min_lng / lng_step) + 1
+        if rows * cols <= max_cells:
+            break
+
+    # one sample per cell step (plus the far edge) hits every cell
+    lats = [min_lat + i * lat_step for i in range(rows)] + [max_lat]
+    lngs = [min_lng + i * lng_step for i in range(cols)] + [max_lng]
+
+    return sorted({
+        geohash_encode(min(a, max_lat), min(b, max_lng), precision)
+        for a in lats
+        for b in lngs
+    })
+
+
+# ==========================
+# PROXIMITY QUERIES
+# ==========================
+def distance_km_expression(lat, lng):
+    """Haversine distance (km) from a point, computed in SQL."""
+    lat_rad, lng_rad = math.radians(lat), math.radians(lng)
+    row_lat = Radians(Cast(F("latitude"), FloatField()))
+    row_lng = Radians(Cast(F("longitude"), FloatField()))
+
+    a = (
+        Power(Sin((row_lat - lat_rad) / 2), 2)
+        + math.cos(lat_rad) * Cos(row_lat)
+        * Power(Sin((row_lng - lng_rad) / 2), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * ASin(Sqrt(a))
+
+
+def within_radius(queryset, lat, lng, radius_km):
+    """
+    Address rows within radius_km of a point, annotated with
+    `distance_km`, nearest first.
+
+    1. geohash prefixes covering the bounding box (indexed LIKE 'x%')
+    2. exact bounding box on latitude / longitude
+    3. haversine over what's left, in the same query
+    """
+    lat, lng = float(lat), float(lng)
+    box = bounding_box(lat, lng, radius_km)
+    min_lat, max_lat, min_lng, max_lng = box
+
+    cells = Q()
+    for geohash in covering_geohashes(box):
+        cells |= Q(geohash__startswith=geohash)
+
+    return (
+        queryset.filter(
+            cells,
+            latitude__range=(min_lat, max_lat),
+            longitude__range=(min_lng, max_lng),
+        )
+        .annotate(distance_km=distance_km_expression(lat, lng))
+        .filter(distance_km__lte=radius_km)
+        .order_by("distance_km")
+    )
@@ -1,16 +1,210 @@
+import base64
+
+from django.conf import settings
+from django.core.cache import cache
+
 from users_app.models.role import UserRole
-from users_app.models.permission import RolePermission
+from users_app.models.permission import Permission
 
 
-def get_user_permissions(user):
-    roles = UserRole.objects.filter(
-        user=user).values_list('role_id', flat=True)
+RBAC_VERSION_KEY = "rbac:version"
+RBAC_REGISTRY_KEY = "rbac:registry:{version}"
+
+# per-process copy of the code_name registry, keyed by RBAC version
+_registry_memo = {}
+
+
+# ==========================
+# RBAC VERSION
+# ==========================
+def get_rbac_version():
+    version = cache.get(RBAC_VERSION_KEY)
+    if version is None:
+        cache.add(RBAC_VERSION_KEY, 1, timeout=None)
+        version = cache.get(RBAC_VERSION_KEY, 1)
+    return version
+
+
+def bump_rbac_version():
+    """
+    Invalidate every cached permission set at once.
+    Old per-user keys are never read again and simply expire.
+    """
+    cache.add(RBAC_VERSION_KEY, 1, timeout=None)
+    return cache.incr(RBAC_VERSION_KEY)
+
+
+def _rbac_cache_key(user_id, version):
+    return f"rbac:user:{version}:{user_id}"
+
+
+# ==========================
+# PER-USER ROLES / PERMISSIONS
+# ==========================
+def _load_user_rbac(user_id):
+    """
+    Roles and permission codes for a user in one query
+    (user roles LEFT JOIN role permissions).
+    """
+    rows = (
+        UserRole.objects.filter(user_id=user_id)
+        .order_by("id")
+        .values_list(
+            "role_id",
+            "role__name",
+            "role__is_admin_role",
+            "role__rolepermission__permission__code_name",
+        )
+    )
+
+    role_details = {}
+    perms = set()
+    for role_id, name, is_admin_role, code_name in rows:
+        role_details.setdefault(role_id, (name, is_admin_role))
+        if code_name is not None:
+            perms.add(code_name)
+
+    return {
+        "roles": tuple(sorted(role_details)),
+        "role_details": tuple(role_details.values()),
+        "perms": frozenset(perms),
+    }
+
+
+def get_user_rbac(user_id, version=None):
+    """
+    {"roles": (role ids), "perms": frozenset(code names)} for a user id,
+    cached in redis under the current (or given) RBAC version.
+    """
+    if version is None:
+        version = get_rbac_version()
+
+    key = _rbac_cache_key(user_id, version)
+
+    entry = cache.get(key)
+    if entry is None:
+        entry = _load_user_rbac(user_id)
+        cache.set(key, entry, timeout=settings.RBAC_CACHE_TIMEOUT)
+
+    return entry
+
+
+def get_user_permission_set(user):
+    """
+    Permission codes for `user` as a frozenset.
+    Memoized on the user instance for the rest of the request,
+    then in redis under the current RBAC version.
+    """
+    if not user or not user.is_authenticated:
+        return frozenset()
+
+    memo = getattr(user, "_rbac_permissions", None)
+    if memo is not None:
+        return memo
+
+    perms = get_user_rbac(user.pk)["perms"]
 
-    perms = RolePermission.objects.filter(
-        role__in=roles).values_list('permission__code_name', flat=True)
+    user._rbac_permissions = perms
+    return perms
 
-    return list(set(perms))
+
+def get_login_context(user):
+    """
+    Everything a login response needs beyond the user row:
+    roles (name + admin flag), permission codes, and the RBAC
+    entry/version to sign the access token with.
+    One redis round trip when warm, one SQL query when cold.
+    """
+    version = get_rbac_version()
+    entry = get_user_rbac(user.pk, version)
+
+    if "role_details" not in entry:
+        # entry cached before role details were stored
+        entry = _load_user_rbac(user.pk)
+        cache.set(
+            _rbac_cache_key(user.pk, version),
+            entry,
+            timeout=settings.RBAC_CACHE_TIMEOUT,
+        )
+
+    user._rbac_permissions = entry["perms"]
+
+    return {
+        "version": version,
+        "rbac": entry,
+        "roles": [
+            {"role__name": name, "role__is_admin_role": is_admin_role}
+            for name, is_admin_role in entry["role_details"]
+        ],
+        "permissions": sorted(entry["perms"]),
+    }
+
+
+def get_user_permissions(user):
+    return list(get_user_permission_set(user))
 
 
 def user_has_permission(user, code_name):
-    return code_name in get_user_permissions(user)
+    return code_name in get_user_permission_set(user)
+
+
+def user_has_permissions(user, code_names):
+    """All of `code_names` (a code or a list of codes), one lookup."""
+    if isinstance(code_names, str):
+        code_names = [code_names]
+    return get_user_permission_set(user).issuperset(code_names)
+
+
+# ==========================
+# PERMISSION BITMAPS (JWT CLAIMS)
+# ==========================
+def get_permission_registry(version=None):
+    """
+    Stable code_name → bit index map.
+    Permission ids are never reused, so the bit for a permission
+    never moves while its row exists.
+    """
+    if version is None:
+        version = get_rbac_version()
+
+    registry = _registry_memo.get(version)
+    if registry is not None:
+        return registry
+
+    key = RBAC_REGISTRY_KEY.format(version=version)
+    registry = cache.get(key)
+    if registry is None:
+        registry = dict(
+            Permission.objects.values_list("code_name", "id")
+        )
+        cache.set(key, registry, timeout=settings.RBAC_CACHE_TIMEOUT)
+
+    _registry_memo.clear()
+    _registry_memo[version] = registry
+    return registry
+
+
+def encode_permission_bitmap(code_names, version=None):
+    registry = get_permission_registry(version)
+
+    bits = 0
+    for code_name in code_names:
+        index = registry.get(code_name)
+        if index is not None:
+            bits |= 1 << index
+
+    raw = bits.to_bytes((bits.bit_length() + 7) // 8 or 1, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_permission_bitmap(bitmap, version=None):
+    registry = get_permission_registry(version)
+
+    padded = bitmap + "=" * (-len(bitmap) % 4)
+    bits = int.from_bytes(base64.urlsafe_b64decode(padded), "big")
+
+    return frozenset(
+        code_name
+        for code_name, index in registry.items()
+        if bits >> index & 1
+    )
@@ -0,0 +1,61 @@
+# users_app/utils/search.py
+
+from django.contrib.postgres.indexes import GinIndex
+from django.db.models import Q
+from rest_framework.filters import SearchFilter
+
+
+# ==========================
+# SEARCH DOCUMENT
+# ==========================
+# Searchable models keep a lowercased `search_text` column with a
+# pg_trgm GIN index, so `LIKE '%term%'` is an index scan instead of
+# icontains over several joined tables.
+def search_document(*parts):
+    return " ".join(str(part).lower() for part in parts if part)
+
+
+def search_index(name):
+    return GinIndex(fields=["search_text"], name=name, opclasses=["gin_trgm_ops"])
+
+
+# ==========================
+# QUERYING
+# ==========================
+def apply_search(queryset, query, prefix_field=None, match_id=False, path=""):
+    """
+    Every word must appear in search_text.
+    - prefix_field: codes ("BK-7F3...") also match by prefix on that column
+    - match_id:     a numeric query also matches the primary key
+    - path:         search a related model instead, e.g. "booking__"
+    """
+    words = (query or "").lower().split()
+    if not words:
+        return queryset
+
+    condition = Q()
+    for word in words:
+        condition &= Q(**{f"{path}search_text__contains": word})
+
+    query = query.strip()
+    if prefix_field and len(words) == 1:
+        condition |= Q(**{f"{path}{prefix_field}__startswith": query.upper()})
+    if match_id and query.isdigit():
+        condition |= Q(**{f"{path}pk": int(query)})
+
+    return queryset.filter(condition)
+
+
+class SearchDocumentFilter(SearchFilter):
+    """
+    ?search= over the view's search_text column (see apply_search).
+    Views may set search_prefix_field / search_match_id.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        return apply_search(
+            queryset,
+            request.query_params.get(self.search_param),
+            prefix_field=getattr(view, "search_prefix_field", None),
+            match_id=getattr(view, "search_match_id", False),
+        )
@@ -0,0 +1,38 @@
+from django.conf import settings
+
+from users_app.utils.rbac import (
+    get_rbac_version,
+    get_user_rbac,
+    encode_permission_bitmap,
+)
+
+
+RBAC_VERSION_CLAIM = "rbac_v"
+ROLES_CLAIM = "roles"
+PERMISSIONS_CLAIM = "perms"
+
+
+def access_token_for(refresh, user_id, context=None):
+    """
+    Access token for a refresh token.
+    With RBAC_TOKEN_CLAIMS on, it also carries the user's role ids,
+    a permission bitmap and the RBAC version they were read at.
+    `context` (from get_login_context) skips re-reading the RBAC cache.
+    """
+    access = refresh.access_token
+
+    if not settings.RBAC_TOKEN_CLAIMS:
+        return access
+
+    if context is not None:
+        version, rbac = context["version"], context["rbac"]
+    else:
+        version = get_rbac_version()
+        rbac = get_user_rbac(user_id, version)
+
+    access[RBAC_VERSION_CLAIM] = version
+    access[ROLES_CLAIM] = list(rbac["roles"])
+    access[PERMISSIONS_CLAIM] = encode_permission_bitmap(
+        rbac["perms"], version
+    )
+    return access
@@ -0,0 +1,92 @@
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django_redis.exceptions import ConnectionInterrupted
+from redis.exceptions import RedisError
+
+
+# redis being down must not take authentication down with it
+CACHE_ERRORS = (ConnectionInterrupted, RedisError)
+
+# in-process counters: "hit", "miss", "cache_error", "invalid_token",
+# "auth_failed"
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def record_auth_event(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def get_auth_cache_stats():
+    with _stats_lock:
+        return dict(_stats)
+
+
+# ==========================
+# CACHE KEYS
+# ==========================
+def _generation_key(user_id):
+    return f"auth:user_gen:{user_id}"
+
+
+def _user_key(user_id, jti):
+    return f"auth:user:{user_id}:{jti}"
+
+
+# ==========================
+# READ / WRITE
+# ==========================
+def get_cached_user(user_id, jti):
+    """
+    One round trip: (cached user row for this token or None, the
+    user's current generation). Entries from an older generation
+    (user saved since) are ignored.
+
+    The generation is read here, before any DB load, and must be
+    passed to set_cached_user: a save landing between the load and
+    the write then leaves the stale row under the old generation.
+    Returns (None, None) when the cache is unreachable.
+    """
+    gen_key = _generation_key(user_id)
+    user_key = _user_key(user_id, jti)
+
+    try:
+        values = cache.get_many([gen_key, user_key])
+    except CACHE_ERRORS:
+        record_auth_event("cache_error")
+        return None, None
+
+    generation = values.get(gen_key, 0)
+    entry = values.get(user_key)
+
+    if entry is None or entry[0] != generation:
+        return None, generation
+    return entry[1], generation
+
+
+def set_cached_user(user, jti, generation):
+    if generation is None:
+        return
+    try:
+        cache.set(
+            _user_key(user.pk, jti),
+            (generation, user),
+            timeout=settings.AUTH_USER_CACHE_TIMEOUT,
+        )
+    except CACHE_ERRORS:
+        record_auth_event("cache_error")
+
+
+def invalidate_cached_user(user_id):
+    key = _generation_key(user_id)
+    try:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+    except CACHE_ERRORS:
+        # runs after commit: don't fail the save; a missed bump is
+        # bounded by AUTH_USER_CACHE_TIMEOUT
+        record_auth_event("cache_error")
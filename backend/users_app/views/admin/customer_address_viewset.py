@@ -13,6 +13,14 @@ from users_app.permissions import HasCustomPermission
 class AdminCustomerAddressViewSet(ModelViewSet):
     serializer_class = AdminCustomerAddressSerializer
     permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        "list": "user.address.view",
+        "retrieve": "user.address.view",
+        "create": "user.address.create",
+        "update": "user.address.update",
+        "partial_update": "user.address.update",
+        "destroy": "user.address.delete",
+    }
 
     def get_queryset(self):
         return Address.objects.filter(
@@ -21,9 +29,3 @@ class AdminCustomerAddressViewSet(ModelViewSet):
 
     def perform_create(self, serializer):
         serializer.save(user_id=self.kwargs["customer_id"])
-
-    def get_permissions(self):
-        return [
-            IsAuthenticated(),
-            HasCustomPermission(),
-        ]
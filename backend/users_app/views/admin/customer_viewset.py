@@ -1,6 +1,7 @@
 # users_app/views/admin/customer_viewset.py
 
 
+from django.db.models import Exists, OuterRef
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import IsAuthenticated
 from users_app.models.user import User
@@ -14,25 +15,23 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
 from users_app.permissions import HasCustomPermission
-from rest_framework.filters import SearchFilter
+from users_app.utils.search import SearchDocumentFilter
 
 
 class AdminCustomerViewSet(ModelViewSet):
     permission_classes = [IsAuthenticated, HasCustomPermission]
     lookup_field = "id"
 
-    filter_backends = [SearchFilter]
-    search_fields = [
-        "id",
-        "full_name",
-        "email",
-        "phone",
-    ]
+    # ?search= over full_name / email / phone, or an exact id
+    filter_backends = [SearchDocumentFilter]
+    search_match_id = True
 
     def get_queryset(self):
         return User.objects.filter(
-            userrole__role__name="customer"
-        ).distinct()
+            Exists(UserRole.objects.filter(
+                user=OuterRef("pk"), role__name="customer"
+            ))
+        )
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -41,28 +40,17 @@ class AdminCustomerViewSet(ModelViewSet):
             return CustomerUpdateSerializer
         return CustomerListSerializer
 
-    def get_permissions(self):
-        permission_map = {
-            "list": "user.view",
-            "retrieve": "user.view",
-            "create": "user.create",
-            "update": "user.update",
-            "partial_update": "user.update",
-            "destroy": "user.delete",
-            "toggle_active": "user.update",
-        }
+    permission_map = {
+        "list": "user.view",
+        "retrieve": "user.view",
+        "create": "user.create",
+        "update": "user.update",
+        "partial_update": "user.update",
+        "destroy": "user.delete",
+        "toggle_active": "user.update",
+    }
 
-        perm = permission_map.get(self.action)
-
-        if perm:
-            HasCustomPermission.required_permissions = perm
-
-        return [
-            IsAuthenticated(),
-            HasCustomPermission(),
-        ]
-
-    @action(detail=True, methods=["patch"], permission_classes=[IsAuthenticated])
+    @action(detail=True, methods=["patch"])
     def toggle_active(self, request, id=None):
         customer = self.get_object()
         customer.is_active = not customer.is_active
@@ -1,11 +1,13 @@
 # users_app/views/assignments.py
 
+from django.db import transaction
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
 from users_app.models import Role, Permission, RolePermission
 from users_app.permissions import HasCustomPermission
+from users_app.utils.rbac import bump_rbac_version
 
 
 class AssignPermissionToRole(APIView):
@@ -18,13 +20,17 @@ class AssignPermissionToRole(APIView):
 
         role = Role.objects.get(id=role_id)
 
-        RolePermission.objects.filter(role=role).delete()
+        with transaction.atomic():
+            RolePermission.objects.filter(role=role).delete()
 
-        bulk = []
-        for perm in permissions:
-            p = Permission.objects.get(code_name=perm)
-            bulk.append(RolePermission(role=role, permission=p))
+            bulk = []
+            for perm in permissions:
+                p = Permission.objects.get(code_name=perm)
+                bulk.append(RolePermission(role=role, permission=p))
 
-        RolePermission.objects.bulk_create(bulk)
+            RolePermission.objects.bulk_create(bulk)
+
+            # bulk_create sends no post_save → invalidate RBAC cache here
+            transaction.on_commit(bump_rbac_version)
 
         return Response({"success": True})
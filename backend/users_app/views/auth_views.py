@@ -7,8 +7,8 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 from users_app.serializers.register_serializer import RegisterSerializer
 from users_app.serializers.login_serializer import LoginSerializer
-from users_app.models.role import UserRole
-from users_app.utils.rbac import get_user_permissions
+from users_app.utils.rbac import get_login_context
+from users_app.utils.tokens import access_token_for
 
 
 # ==========================
@@ -76,12 +76,10 @@ class LoginView(APIView):
 
         refresh = RefreshToken.for_user(user)
 
-        roles = list(
-            UserRole.objects.filter(user=user)
-            .values("role__name", "role__is_admin_role")
-        )
-
-        permissions = get_user_permissions(user)
+        context = get_login_context(user)
+        roles = context["roles"]
+        permissions = context["permissions"]
+        access = access_token_for(refresh, user.id, context)
 
         response = Response({
             "message": "Login successful",
@@ -95,7 +93,7 @@ class LoginView(APIView):
 
         response.set_cookie(
             key=settings.AUTH_COOKIE,
-            value=str(refresh.access_token),
+            value=str(access),
             httponly=settings.AUTH_COOKIE_HTTP_ONLY,
             secure=settings.AUTH_COOKIE_SECURE,
             samesite=settings.AUTH_COOKIE_SAMESITE,
@@ -5,6 +5,7 @@ from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser
 
 from users_app.models.user import User
+from users_app.utils.conditional import conditional_response, weak_etag
 from users_app.serializers.customer.profile_serializer import (
     ProfileReadSerializer,
     ProfileUpdateSerializer,
@@ -16,8 +17,14 @@ class ProfileView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        serializer = ProfileReadSerializer(request.user)
-        return Response(serializer.data)
+        user = request.user
+        # addresses_count is the only field not on the user row
+        etag = weak_etag("profile", user.pk, user.updated_at, user.addresses.count())
+
+        return conditional_response(
+            request, etag, user.updated_at,
+            lambda: Response(ProfileReadSerializer(user).data),
+        )
 
     def patch(self, request):
         user = request.user
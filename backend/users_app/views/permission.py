@@ -5,13 +5,12 @@ from rest_framework.permissions import IsAuthenticated
 from users_app.models.permission import Permission
 from users_app.serializers.permission import PermissionSerializer
 from users_app.permissions import HasCustomPermission
+from users_app.authentication import ClaimsJWTAuthentication
 
 
 class PermissionViewSet(ReadOnlyModelViewSet):
     queryset = Permission.objects.all()
     serializer_class = PermissionSerializer
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated, HasCustomPermission]
-
-    def get_permissions(self):
-        HasCustomPermission.required_permissions = "permission.view"
-        return super().get_permissions()
+    required_permissions = "permission.view"
@@ -8,16 +8,12 @@ from users_app.permissions import HasCustomPermission
 class RoleViewSet(ModelViewSet):
     queryset = Role.objects.all()
     serializer_class = RoleSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_permissions(self):
-        if self.action == 'list':
-            HasCustomPermission.required_permissions = "role.view"
-        elif self.action == 'create':
-            HasCustomPermission.required_permissions = "role.create"
-        elif self.action in ['update', 'partial_update']:
-            HasCustomPermission.required_permissions = "role.update"
-        elif self.action == 'destroy':
-            HasCustomPermission.required_permissions = "role.delete"
-
-        return [IsAuthenticated(), HasCustomPermission()]
+    permission_classes = [IsAuthenticated, HasCustomPermission]
+    permission_map = {
+        'list': "role.view",
+        'retrieve': "role.view",
+        'create': "role.create",
+        'update': "role.update",
+        'partial_update': "role.update",
+        'destroy': "role.delete",
+    }
@@ -3,6 +3,9 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from users_app.utils.tokens import access_token_for
 
 
 class RefreshAccessTokenView(APIView):
@@ -14,7 +17,9 @@ class RefreshAccessTokenView(APIView):
 
         try:
             refresh = RefreshToken(refresh_token)
-            new_access = refresh.access_token
+            new_access = access_token_for(
+                refresh, refresh[api_settings.USER_ID_CLAIM]
+            )
         except TokenError:
             return Response({"error": "Invalid refresh token"}, status=401)
 